@@ -0,0 +1,114 @@
+# benchmarks/bench_agents.py
+
+"""Per-agent microbenchmarks on synthetic contracts: parsing (PDF and DOCX),
+segmentation, classification, risk, obligations and missing-clause checks.
+The classifier runs whatever backend it would load in production; set
+HF_HUB_OFFLINE=1 to benchmark the keyword heuristics.
+
+  python -m benchmarks.bench_agents --pages 10 100 --repeat 5
+  python -m benchmarks.bench_agents --pages 50 --mix indemnity=3 termination=1 -o agents.json
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.results import write_results
+from benchmarks.synthetic import build_contract, parse_mix
+from legal_doc_analyzer.agents.classifier_agent import ClauseClassifierAgent
+from legal_doc_analyzer.agents.missing_clause_detector import MissingClauseDetectorAgent
+from legal_doc_analyzer.agents.obligation_extractor import ObligationExtractorAgent
+from legal_doc_analyzer.agents.parser_agent import ParserAgent
+from legal_doc_analyzer.agents.risk_analyzer_agent import RiskAnalyzerAgent
+from legal_doc_analyzer.agents.segmenter_agent import ClauseSegmenterAgent
+
+
+def measure(name: str, fn, items: int, repeat: int, **extra) -> dict:
+    fn()  # warm-up: lazy imports, compiled patterns, model load
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    p50 = statistics.median(timings)
+    return {
+        "name": name,
+        "items": items,
+        "seconds_p50": round(p50, 6),
+        "seconds_min": round(min(timings), 6),
+        "items_per_s": round(items / p50, 1) if p50 else None,
+        **extra,
+    }
+
+
+def load_agents() -> dict:
+    classifier = ClauseClassifierAgent()
+    classifier.load()  # model loading is not what is being measured
+    return {
+        "parser": ParserAgent(),
+        "segmenter": ClauseSegmenterAgent(),
+        "classifier": classifier,
+        "risk": RiskAnalyzerAgent(),
+        "obligations": ObligationExtractorAgent(),
+        "missing": MissingClauseDetectorAgent(),
+    }
+
+
+def bench_pages(agents: dict, pages: int, mix, seed: int, repeat: int, tmp: str):
+    paths = {}
+    for fmt in ("pdf", "docx"):
+        paths[fmt] = os.path.join(tmp, f"contract-{pages}.{fmt}")
+        with open(paths[fmt], "wb") as f:
+            f.write(build_contract(pages, fmt, mix, seed))
+
+    parser, segmenter, classifier = agents["parser"], agents["segmenter"], agents["classifier"]
+    risk, obligations, missing = agents["risk"], agents["obligations"], agents["missing"]
+    text = parser.process(paths["pdf"])
+    clauses = segmenter.process(text)
+
+    tag = f"{pages}p"
+    n = len(clauses)
+    rows = [
+        measure(f"parser.pdf/{tag}", lambda: parser.process(paths["pdf"]), pages, repeat),
+        measure(f"parser.docx/{tag}", lambda: parser.process(paths["docx"]), pages, repeat),
+        measure(f"segmenter/{tag}", lambda: segmenter.process(text), n, repeat),
+        measure(f"classifier/{tag}", lambda: classifier.classify_batch(clauses), n, repeat,
+                backend=classifier.backend),
+        measure(f"risk/{tag}", lambda: [risk.analyze(c) for c in clauses], n, repeat),
+        measure(f"obligations/{tag}", lambda: obligations.extract_batch(clauses), n, repeat),
+        measure(f"missing_clauses/{tag}", lambda: missing.detect(clauses), n, repeat),
+    ]
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--mix", nargs="*", help="label=weight pairs, e.g. indemnity=3 payment_terms=1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    agents = load_agents()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.pages:
+            rows.extend(bench_pages(agents, pages, mix, args.seed, args.repeat, tmp))
+    agents["parser"].close()
+
+    print(f"{'benchmark':>28}  {'items':>6}  {'p50 (s)':>9}  {'items/s':>10}")
+    for row in rows:
+        print(f"{row['name']:>28}  {row['items']:>6}  {row['seconds_p50']:>9.4f}  {row['items_per_s']:>10.1f}")
+
+    write_results("agents", {"pages": args.pages, "mix": mix, "seed": args.seed, "repeat": args.repeat},
+                  rows, args.output)
+
+
+if __name__ == "__main__":
+    main()
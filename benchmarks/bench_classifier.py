@@ -0,0 +1,126 @@
+# benchmarks/bench_classifier.py
+
+"""LegalBERT throughput and resident memory per inference backend (torch fp32,
+ONNX fp32, ONNX int8). Each backend runs in its own process so peak RSS is
+measured for that backend alone, the way a worker would see it.
+
+  python -m benchmarks.bench_classifier --clauses 256 --batch-size 16
+  python -m benchmarks.bench_classifier --random-weights   # offline: BERT-base shape, random weights
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from legal_doc_analyzer.agents.classifier_agent import MODEL_NAME
+from legal_doc_analyzer.utils.inference_backends import BACKENDS, load_backend
+
+NUM_LABELS = 7
+
+
+def build_torch_model(random_weights: bool):
+    import torch
+    from transformers import AutoModelForSequenceClassification, BertConfig, BertForSequenceClassification
+
+    if random_weights:
+        torch.manual_seed(0)  # same weights in every process
+        return BertForSequenceClassification(BertConfig(num_labels=NUM_LABELS)).eval()
+    return AutoModelForSequenceClassification.from_pretrained(MODEL_NAME, num_labels=NUM_LABELS).eval()
+
+
+def clause_batches(clauses: int, batch_size: int, seed: int = 0):
+    # Token lengths typical of contract clauses, length-sorted like the classifier does
+    rng = np.random.RandomState(seed)
+    lengths = np.sort(rng.randint(32, 257, size=clauses))
+    batches = []
+    for start in range(0, clauses, batch_size):
+        chunk = lengths[start:start + batch_size]
+        width = int(chunk.max())
+        mask = (np.arange(width)[None, :] < chunk[:, None]).astype(np.int64)
+        ids = rng.randint(1000, 30000, size=mask.shape) * mask
+        batches.append({"input_ids": ids, "attention_mask": mask, "token_type_ids": np.zeros_like(ids)})
+    return batches
+
+
+def run_one(args, prepare_only: bool = False) -> dict:
+    # Child process: load a single backend, time it, report peak RSS
+    backend = load_backend(
+        args.only, "bench-random" if args.random_weights else MODEL_NAME, NUM_LABELS,
+        lambda: build_torch_model(args.random_weights), cache_dir=args.cache_dir,
+    )
+    if prepare_only:
+        return {"backend": backend.name}
+    batches = clause_batches(args.clauses, args.batch_size)
+    backend.run(batches[0])  # warm-up
+
+    best = float("inf")
+    labels = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        labels = np.concatenate([backend.run(batch)[0].argmax(axis=1) for batch in batches])
+        best = min(best, time.perf_counter() - start)
+
+    return {
+        "backend": backend.name,
+        "clauses_per_s": round(args.clauses / best, 1),
+        "seconds": round(best, 3),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "labels": labels.tolist(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--clauses", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--random-weights", action="store_true")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--only", choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument("--prepare", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.only:
+        print(json.dumps(run_one(args, prepare_only=args.prepare)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = args.cache_dir or tmp
+        results = []
+        for name in args.backends:
+            cmd = [
+                sys.executable, "-m", "benchmarks.bench_classifier", "--only", name,
+                "--clauses", str(args.clauses), "--batch-size", str(args.batch_size),
+                "--repeat", str(args.repeat), "--cache-dir", cache_dir,
+            ]
+            if args.random_weights:
+                cmd.append("--random-weights")
+            if name != "torch":
+                # Export/quantize first, so the measured run only pays for loading the cached model
+                subprocess.run(cmd + ["--prepare"], check=True, capture_output=True)
+            output = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    baseline = results[0]
+    print(f"clauses={args.clauses} batch_size={args.batch_size}")
+    print(f"{'backend':>10}  {'clauses/s':>9}  {'speedup':>7}  {'peak RSS (MB)':>13}  {'label agreement':>15}")
+    for result in results:
+        agreement = np.mean(np.array(result["labels"]) == np.array(baseline["labels"]))
+        speedup = result["clauses_per_s"] / baseline["clauses_per_s"]
+        print(
+            f"{result['backend']:>10}  {result['clauses_per_s']:>9.1f}  {speedup:>6.2f}x  "
+            f"{result['peak_rss_mb']:>13.1f}  {agreement:>15.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# benchmarks/bench_e2e.py
+
+"""End-to-end latency and throughput of POST /results on synthetic contracts,
+with summaries served by the local fake LLM server. Every upload is a
+distinct contract (different seed), so the result cache never answers;
+--cached adds a second pass that re-uploads the same files.
+
+  python -m benchmarks.bench_e2e --pages 5 --requests 20 --concurrency 4 --llm-latency 0.05
+  python -m benchmarks.bench_e2e --url http://127.0.0.1:8000   # against a running server
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.results import write_results
+from benchmarks.synthetic import build_contract, parse_mix
+from legal_doc_analyzer.utils.fake_llm_server import run_fake_llm_server
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def run_pass(client, name: str, contracts, concurrency: int) -> dict:
+    def post(item):
+        index, data = item
+        start = time.perf_counter()
+        response = client.post("/results", files={"file": (f"contract-{index}.pdf", data, "application/pdf")})
+        elapsed = time.perf_counter() - start
+        clauses = len(response.json()["details"]) if response.status_code == 200 else 0
+        return elapsed, response.status_code, clauses
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(post, enumerate(contracts)))
+    wall = time.perf_counter() - started
+
+    latencies = [elapsed for elapsed, status, _ in outcomes if status == 200]
+    errors = [status for _, status, _ in outcomes if status != 200]
+    return {
+        "name": name,
+        "requests": len(contracts),
+        "errors": len(errors),
+        "error_statuses": sorted(set(errors)),
+        "clauses": sum(clauses for _, _, clauses in outcomes),
+        "seconds_p50": round(statistics.median(latencies), 4) if latencies else None,
+        "seconds_p95": round(percentile(latencies, 0.95), 4) if latencies else None,
+        "seconds_max": round(max(latencies), 4) if latencies else None,
+        "requests_per_s": round(len(latencies) / wall, 2),
+        "wall_seconds": round(wall, 3),
+    }
+
+
+def in_process_client(tmp: str, llm_url: str):
+    # The app reads its configuration at import time, so set it up first
+    os.environ.update({"OPENAI_API_KEY": "fake", "OPENAI_BASE_URL": llm_url})
+    for key, value in {
+        "LLM_CACHE_PATH": "",  # every summary goes to the fake server
+        "CLAUSE_MEMO_PATH": "",  # synthetic contracts share template clauses
+        "ANALYSIS_DB_PATH": "",
+        "MODEL_LOADING": "eager",
+        "UPLOAD_MAX_MB": "64",
+        "UPLOAD_STORAGE_DIR": os.path.join(tmp, "uploads"),
+        "REPORT_CACHE_DIR": os.path.join(tmp, "reports"),
+    }.items():
+        os.environ.setdefault(key, value)
+
+    from fastapi.testclient import TestClient
+
+    from legal_doc_analyzer.app import app
+
+    app.state.limiter.enabled = False  # the benchmark is the abuse the limiter exists for
+    return TestClient(app)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--mix", nargs="*", help="label=weight pairs, e.g. indemnity=3 payment_terms=1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="seconds per fake completion")
+    parser.add_argument("--cached", action="store_true", help="also re-upload the same files")
+    parser.add_argument("--url", default=None, help="benchmark a running server instead of the in-process app")
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    contracts = [build_contract(args.pages, "pdf", mix, args.seed + i) for i in range(args.requests)]
+
+    with tempfile.TemporaryDirectory() as tmp, run_fake_llm_server(latency=args.llm_latency) as llm:
+        if args.url:
+            import httpx
+
+            client = httpx.Client(base_url=args.url, timeout=600)
+        else:
+            client = in_process_client(tmp, llm.base_url)
+
+        with client:
+            rows = [run_pass(client, f"results/{args.pages}p/cold", contracts, args.concurrency)]
+            if args.cached:
+                rows.append(run_pass(client, f"results/{args.pages}p/cached", contracts, args.concurrency))
+        llm_calls = llm.requests_served
+
+    print(f"pages={args.pages} requests={args.requests} concurrency={args.concurrency} llm_calls={llm_calls}")
+    print(f"{'pass':>24}  {'p50 (s)':>8}  {'p95 (s)':>8}  {'req/s':>7}  {'errors':>6}")
+    for row in rows:
+        print(
+            f"{row['name']:>24}  {row['seconds_p50'] or 0:>8.3f}  {row['seconds_p95'] or 0:>8.3f}  "
+            f"{row['requests_per_s']:>7.2f}  {row['errors']:>6}"
+        )
+
+    params = {key: value for key, value in vars(args).items() if key != "output"}
+    params["mix"] = mix
+    write_results("e2e", params, rows, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/bench_keywords.py
+
+"""Per-clause keyword scanning cost as keyword tables grow: one compiled
+KeywordMatcher pass vs. the per-agent lower() + `in` loops it replaced.
+
+  python -m benchmarks.bench_keywords --sizes 10 100 500 1000 --clauses 500
+"""
+
+import argparse
+import random
+import time
+
+from legal_doc_analyzer.utils.keyword_matcher import KeywordMatcher
+
+VOCABULARY = (
+    "agreement party supplier client notice breach remedy warranty license fee invoice term "
+    "renewal assignment waiver severability audit insurance subcontract personal data security "
+    "escrow indemnify liability termination confidential payment dispute arbitration law"
+).split()
+
+CLAUSE = (
+    "The Supplier shall indemnify and hold harmless the Client against all losses arising from any "
+    "breach of this Agreement, including termination without cause, late payment of any invoice, "
+    "or disclosure of confidential information in violation of the governing law. "
+)
+
+
+def make_keywords(count: int, rng: random.Random):
+    keywords = set()
+    while len(keywords) < count:
+        words = rng.choices(VOCABULARY, k=rng.randint(1, 3))
+        keywords.add(" ".join(words) + rng.choice(["", "s", "ing", " clause"]))
+    return sorted(keywords)
+
+
+def naive_scan(clause: str, keywords):
+    lowered = clause.lower()
+    return {keyword for keyword in keywords if keyword in lowered}
+
+
+def per_clause_us(fn, clauses) -> float:
+    start = time.perf_counter()
+    for clause in clauses:
+        fn(clause)
+    return (time.perf_counter() - start) / len(clauses) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 250, 500, 1000])
+    parser.add_argument("--clauses", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    clauses = [CLAUSE * rng.randint(1, 4) for _ in range(args.clauses)]
+
+    print(f"{'keywords':>8}  {'compiled (us)':>13}  {'naive (us)':>10}")
+    for size in args.sizes:
+        keywords = make_keywords(size, rng)
+        matcher = KeywordMatcher(keywords)
+        assert all(matcher.scan(c) == naive_scan(c, keywords) for c in clauses[:20])
+
+        compiled = per_clause_us(matcher.scan, clauses)
+        naive = per_clause_us(lambda c: naive_scan(c, keywords), clauses)
+        print(f"{size:>8}  {compiled:>13.1f}  {naive:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_parser.py
+
+"""Serial vs page-parallel ParserAgent on a scaled-up copy of the sample PDF.
+
+  python -m benchmarks.bench_parser --pages 300 --workers 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import pdfplumber
+
+from benchmarks.synthetic import LINES_PER_PAGE, paginate, render_pdf
+from legal_doc_analyzer.agents.parser_agent import ParserAgent
+
+SAMPLE_PDF = os.path.join(os.path.dirname(__file__), "..", "tests", "sample_docs", "sample.pdf")
+
+FALLBACK_LINES = [
+    "1. Termination. Either party may terminate this Agreement upon thirty days written notice.",
+    "The Supplier shall return all Confidential Information within ten business days.",
+    "2. Confidentiality. The Recipient must not disclose Confidential Information to third parties.",
+    "3. Payment Terms. The Client will pay each undisputed invoice within thirty days of receipt.",
+    "4. Governing Law. This Agreement is governed by the laws of the State of New York.",
+]
+
+
+def sample_lines(path: str = SAMPLE_PDF):
+    try:
+        with pdfplumber.open(path) as pdf:
+            lines = [line for page in pdf.pages for line in (page.extract_text() or "").splitlines()]
+    except Exception:
+        lines = []
+    return lines or FALLBACK_LINES
+
+
+def build_pdf(pages: int, path: str) -> None:
+    lines = sample_lines()
+    scaled = [lines[i % len(lines)] for i in range(pages * LINES_PER_PAGE)]
+    with open(path, "wb") as f:
+        f.write(render_pdf(paginate(scaled)))
+
+
+def timed(agent: ParserAgent, path: str, repeat: int):
+    best, text = float("inf"), ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = agent.process(path)
+        best = min(best, time.perf_counter() - start)
+    return best, text
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scaled.pdf")
+        build_pdf(args.pages, path)
+
+        serial_time, serial_text = timed(ParserAgent(max_workers=1), path, args.repeat)
+        parallel_agent = ParserAgent(max_workers=args.workers, parallel_min_pages=1)
+        timed(parallel_agent, path, 1)  # warm up the process pool
+        parallel_time, parallel_text = timed(parallel_agent, path, args.repeat)
+        parallel_agent.close()
+
+    assert serial_text == parallel_text, "parallel output differs from serial output"
+    print(f"pages={args.pages} workers={args.workers}")
+    print(f"serial:   {serial_time:.3f}s ({args.pages / serial_time:.1f} pages/s)")
+    print(f"parallel: {parallel_time:.3f}s ({args.pages / parallel_time:.1f} pages/s)")
+    print(f"speedup:  {serial_time / parallel_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
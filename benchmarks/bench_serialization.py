@@ -0,0 +1,107 @@
+# benchmarks/bench_serialization.py
+
+"""Response size and encoding cost of an analysis result: the stdlib JSONResponse
+the API used to return vs the orjson-backed FastJSONResponse, for the full
+record and for ?fields= projections, with gzip/brotli on top.
+
+  python -m benchmarks.bench_serialization --clauses 500 5000
+  python -m benchmarks.bench_serialization --clauses 2000 --fields "type,risk,obligations.start,obligations.end"
+"""
+
+import argparse
+
+from fastapi.responses import JSONResponse
+
+from benchmarks.bench_agents import measure
+from benchmarks.results import write_results
+from benchmarks.synthetic import generate_clauses
+from legal_doc_analyzer.agents.obligation_extractor import ObligationExtractorAgent
+from legal_doc_analyzer.agents.risk_analyzer_agent import RiskAnalyzerAgent
+from legal_doc_analyzer.utils import responses
+
+PROJECTIONS = {
+    "full": None,
+    "no-text": "type,summary,risk,obligations.start,obligations.end,obligations.triggers",
+    "offsets": "type,risk,obligations.start,obligations.end",
+}
+
+
+def build_analysis(count: int, seed: int) -> dict:
+    # Same record shape as /results; summaries are the clause's first sentence, as the heuristic writes them
+    clauses = generate_clauses(count, seed=seed)
+    texts = [clause["text"] for clause in clauses]
+    obligations = ObligationExtractorAgent().extract_batch(texts)
+    risk = RiskAnalyzerAgent()
+    details = [
+        {
+            "clause": text,
+            "type": clause["label"],
+            "summary": text.split(". ")[0][:200],
+            "risk": risk.analyze(text),
+            "obligations": found,
+        }
+        for clause, text, found in zip(clauses, texts, obligations)
+    ]
+    summary = {
+        "total_clauses": len(details),
+        "missing_clauses": [],
+        "total_obligations": sum(len(found) for found in obligations),
+        "reused_clauses": 0,
+    }
+    return {"summary": summary, "details": details}
+
+
+def bench_size(count: int, projections: dict, seed: int, repeat: int):
+    data = build_analysis(count, seed)
+    stdlib = JSONResponse(content=None)
+    fast = responses.FastJSONResponse(content=None)
+    encodings = ["gzip"] + (["br"] if responses.brotli is not None else [])
+
+    rows = []
+    baseline = len(stdlib.render(data))
+    for label, fields in projections.items():
+        content = responses.project_analysis(data, responses.parse_fields(fields))
+        body = fast.render(content)
+        tag = f"{label}/{count}"
+        rows.append(measure(f"json.stdlib/{tag}", lambda: stdlib.render(content), count, repeat,
+                            bytes=len(stdlib.render(content))))
+        rows.append(measure(f"json.fast/{tag}", lambda: fast.render(content), count, repeat,
+                            bytes=len(body), bytes_vs_full_stdlib=round(len(body) / baseline, 4)))
+        for encoding in encodings:
+            compressed = responses.compress(body, encoding)
+            rows.append(measure(f"{encoding}/{tag}", lambda: responses.compress(body, encoding), count, repeat,
+                                bytes=len(compressed), bytes_vs_full_stdlib=round(len(compressed) / baseline, 4)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--clauses", type=int, nargs="+", default=[500, 5000])
+    parser.add_argument("--fields", default=None, help="benchmark this projection instead of the built-in ones")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args()
+
+    projections = {"full": None, "custom": args.fields} if args.fields else PROJECTIONS
+    rows = []
+    for count in args.clauses:
+        rows.extend(bench_size(count, projections, args.seed, args.repeat))
+
+    print(f"encoder={'orjson' if responses.orjson is not None else 'stdlib'} "
+          f"brotli={'yes' if responses.brotli is not None else 'not installed'}")
+    print(f"{'benchmark':>30}  {'p50 (ms)':>9}  {'bytes':>10}  {'vs full stdlib':>14}")
+    for row in rows:
+        ratio = row.get("bytes_vs_full_stdlib")
+        print(f"{row['name']:>30}  {row['seconds_p50'] * 1000:>9.2f}  {row['bytes']:>10}  "
+              f"{'' if ratio is None else f'{ratio:.3f}':>14}")
+
+    params = {key: value for key, value in vars(args).items() if key != "output"}
+    params["projections"] = projections
+    write_results("serialization", params, rows, args.output)
+
+
+if __name__ == "__main__":
+    main()
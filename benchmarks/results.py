@@ -0,0 +1,89 @@
+# benchmarks/results.py
+#
+# Machine-readable benchmark results, so runs can be diffed between releases.
+#
+#   python -m benchmarks.results benchmarks/results/agents-old.json benchmarks/results/agents-new.json
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__), capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def environment() -> dict:
+    return {
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def write_results(benchmark: str, params: dict, results: List[dict], output: Optional[str] = None) -> str:
+    """Write one run as JSON; ``results`` rows are keyed by their ``name``."""
+    if output is None:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{benchmark}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    payload = {"benchmark": benchmark, "environment": environment(), "params": params, "results": results}
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    print(f"📝 Results written to {output}")
+    return output
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    with open(path, encoding="utf-8") as f:
+        return {row["name"]: row for row in json.load(f)["results"]}
+
+
+# 📉 Lower is better for time-like metrics, higher for throughput
+def compare(baseline: Dict[str, dict], current: Dict[str, dict], metric: str, threshold: float) -> List[str]:
+    higher_is_better = metric.endswith("_per_s")
+    regressions = []
+    for name, row in current.items():
+        old = baseline.get(name, {}).get(metric)
+        new = row.get(metric)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        worse = -change if higher_is_better else change
+        flag = "  ⚠️ regression" if worse > threshold else ""
+        print(f"{name:>32}  {old:>12.4g}  {new:>12.4g}  {change:>+8.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--metric", default="seconds_p50")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown")
+    args = parser.parse_args()
+
+    print(f"{'benchmark':>32}  {'baseline':>12}  {'current':>12}  {'change':>8}   ({args.metric})")
+    regressions = compare(load_results(args.baseline), load_results(args.current), args.metric, args.threshold)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+# benchmarks/synthetic.py
+#
+# Deterministic synthetic contracts (PDF or DOCX) plus the minimal,
+# dependency-free writers used to build them.
+#
+#   python -m benchmarks.synthetic --pages 100 --format docx --mix indemnity=3 termination=1 -o contract.docx
+
+import argparse
+import io
+import random
+import textwrap
+import zipfile
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
+LINES_PER_PAGE = 60
+
+
+def _escape(line: str) -> bytes:
+    line = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return line.encode("latin-1", errors="replace")
+
+
+def render_pdf(pages: List[List[str]]) -> bytes:
+    # Object 1 is the font, object 2 the page tree; pages follow as (content, page) pairs
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", b""]
+    kids = []
+    for lines in pages:
+        ops = b" ".join(b"(" + _escape(line) + b") '" for line in lines)
+        stream = b"BT /F1 10 Tf 50 770 Td 12 TL " + ops + b" ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 1 0 R >> >> >>" % (PAGE_WIDTH, PAGE_HEIGHT, len(objects))
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, len(objects), xref
+    )
+    return bytes(out)
+
+
+def paginate(lines: List[str], lines_per_page: int = LINES_PER_PAGE) -> List[List[str]]:
+    return [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+
+# 🧾 Clause text per classifier label, with the keywords and obligation triggers real contracts use
+CLAUSE_TEMPLATES: Dict[str, List[str]] = {
+    "termination": [
+        "Either party may terminate this Agreement upon {days} days written notice to the other party.",
+        "The {party} may terminate this Agreement immediately if the other party commits a material breach.",
+        "Upon termination the {party} shall return all materials and pay any outstanding fees.",
+    ],
+    "confidentiality": [
+        "The Recipient shall keep all Confidential Information strictly confidential.",
+        "The {party} must not disclose Confidential Information to any third party without prior consent.",
+        "These nondisclosure obligations survive for {years} years after the end of this Agreement.",
+    ],
+    "indemnity": [
+        "The {party} agrees to indemnify and hold harmless the other party against all claims and losses.",
+        "Liability under this clause is capped at {amount} except in cases of gross negligence.",
+        "The {party} will defend any claim at its own expense and is required to give prompt notice.",
+    ],
+    "governing law": [
+        "This Agreement is governed by the governing law of the State of {state}.",
+        "The courts of {state} have exclusive jurisdiction over any matter arising under this Agreement.",
+    ],
+    "force majeure": [
+        "Neither party is liable for delay caused by a force majeure event beyond its reasonable control.",
+        "The affected party shall notify the other party within {days} days of any force majeure event.",
+    ],
+    "payment terms": [
+        "The {party} shall pay each undisputed invoice within {days} days of receipt.",
+        "Late payment accrues interest at {rate} percent per month and late fees may apply.",
+        "All payment amounts are exclusive of applicable taxes unless stated otherwise.",
+    ],
+    "dispute resolution": [
+        "Any dispute shall first be referred to senior management for good faith negotiation.",
+        "Unresolved disputes will be settled by binding arbitration seated in {state}.",
+    ],
+}
+
+TITLES = {
+    "termination": "Termination",
+    "confidentiality": "Confidentiality",
+    "indemnity": "Indemnity",
+    "governing law": "Governing Law",
+    "force majeure": "Force Majeure",
+    "payment terms": "Payment Terms",
+    "dispute resolution": "Dispute Resolution",
+}
+
+FILLERS = {
+    "party": ["Supplier", "Client", "Licensee", "Licensor", "Contractor"],
+    "days": ["10", "15", "30", "45", "60", "90"],
+    "years": ["2", "3", "5"],
+    "amount": ["USD 100,000", "the fees paid in the prior twelve months", "EUR 1,000,000"],
+    "state": ["New York", "Delaware", "California", "England and Wales"],
+    "rate": ["1", "1.5", "2"],
+}
+
+LINE_WIDTH = 95  # characters that fit one line of the PDF page
+
+
+@lru_cache(maxsize=None)
+def clause_labels() -> Tuple[str, ...]:
+    # The generator follows the classifier's label set, so new labels show up here automatically
+    from legal_doc_analyzer.agents.classifier_agent import ClauseClassifierAgent
+
+    return tuple(label for _, label in sorted(ClauseClassifierAgent().get_label_map().items()))
+
+
+def generate_clauses(count: int, mix: Optional[Dict[str, float]] = None, seed: int = 0) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    labels = [label for label in clause_labels() if label in CLAUSE_TEMPLATES]
+    weights = [float((mix or {}).get(label, 0 if mix else 1)) for label in labels]
+    if not any(weights):
+        raise ValueError(f"Clause mix selects none of: {', '.join(labels)}")
+
+    clauses = []
+    for number in range(1, count + 1):
+        label = rng.choices(labels, weights=weights)[0]
+        sentences = rng.sample(CLAUSE_TEMPLATES[label], k=rng.randint(1, len(CLAUSE_TEMPLATES[label])))
+        body = " ".join(
+            sentence.format(**{key: rng.choice(values) for key, values in FILLERS.items()})
+            for sentence in sentences
+        )
+        clauses.append({"label": label, "text": f"{number}. {TITLES[label]}. {body}"})
+    return clauses
+
+
+def contract_lines(pages: int, mix: Optional[Dict[str, float]] = None, seed: int = 0) -> List[str]:
+    # Keep adding clauses until the wrapped text fills the requested number of pages
+    target = pages * LINES_PER_PAGE
+    lines: List[str] = []
+    batch = max(8, target // 3)
+    offset = 0
+    while len(lines) < target:
+        for clause in generate_clauses(batch, mix, seed + offset):
+            lines.extend(textwrap.wrap(clause["text"], LINE_WIDTH))
+            if len(lines) >= target:
+                break
+        offset += 1
+    return renumber(lines[:target])
+
+
+def renumber(lines: List[str]) -> List[str]:
+    # Batches restart numbering at 1; make clause numbers run through the whole document
+    out, number = [], 0
+    for line in lines:
+        head, sep, rest = line.partition(". ")
+        if sep and head.isdigit():
+            number += 1
+            line = f"{number}. {rest}"
+        out.append(line)
+    return out
+
+
+def render_docx(pages: List[List[str]]) -> bytes:
+    # Smallest valid WordprocessingML package: one paragraph per clause, page breaks between pages
+    body = []
+    for index, lines in enumerate(pages):
+        paragraphs, current = [], []
+        for line in lines:
+            head, sep, _ = line.partition(". ")
+            if sep and head.isdigit() and current:
+                paragraphs.append(" ".join(current))
+                current = []
+            current.append(line)
+        if current:
+            paragraphs.append(" ".join(current))
+        for text in paragraphs:
+            body.append(f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>')
+        if index < len(pages) - 1:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{"".join(body)}</w:body></w:document>'
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '</Types>'
+    )
+    rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/></Relationships>'
+    )
+
+    buffer = io.BytesIO()
+    # Fixed timestamps keep the bytes (and so cache keys) identical between runs
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in (
+            ("[Content_Types].xml", content_types),
+            ("_rels/.rels", rels),
+            ("word/document.xml", document),
+        ):
+            archive.writestr(zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0)), data)
+    return buffer.getvalue()
+
+
+def build_contract(pages: int, fmt: str = "pdf", mix: Optional[Dict[str, float]] = None, seed: int = 0) -> bytes:
+    if not 1 <= pages <= 1000:
+        raise ValueError("pages must be between 1 and 1000")
+    paged = paginate(contract_lines(pages, mix, seed))
+    if fmt == "pdf":
+        return render_pdf(paged)
+    if fmt == "docx":
+        return render_docx(paged)
+    raise ValueError(f"Unsupported format: {fmt}")
+
+
+def parse_mix(items: Optional[List[str]]) -> Optional[Dict[str, float]]:
+    if not items:
+        return None
+    mix = {}
+    for item in items:
+        label, _, weight = item.rpartition("=")
+        mix[label.replace("_", " ")] = float(weight)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic contract")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--format", choices=["pdf", "docx"], default="pdf")
+    parser.add_argument("--mix", nargs="*", help="label=weight pairs, e.g. indemnity=3 payment_terms=1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args()
+
+    with open(args.output, "wb") as f:
+        f.write(build_contract(args.pages, args.format, parse_mix(args.mix), args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 
 import streamlit as st
 import requests
-import time
+import json
 
 BACKEND_URL = "http://127.0.0.1:8000"
 
@@ -20,16 +20,38 @@ if uploaded_file:
 
         try:
             progress_text = "📡 Sending to server..."
-            progress_bar.progress(10, text=progress_text)
-            time.sleep(0.5)
+            progress_bar.progress(5, text=progress_text)
 
-            response = requests.post(f"{BACKEND_URL}/results", files=files)
+            response = requests.post(f"{BACKEND_URL}/results/stream", files=files, stream=True)
 
             if response.status_code == 200:
+                result = {"summary": {}, "details": []}
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if event["event"] == "start":
+                        pages = f"{event['total_pages']} pages" if event["total_pages"] else "document"
+                        progress_bar.progress(10, text=f"🧠 Analyzing {pages}...")
+                    elif event["event"] == "clause":
+                        result["details"].append(event["record"])
+                        done = event["index"] + 1
+                        # Clauses are found while pages are read, so progress is counted in pages
+                        if event["total_pages"]:
+                            progress_bar.progress(
+                                10 + int(90 * event["page"] / event["total_pages"]),
+                                text=f"🧠 Analyzed clause {done} (page {event['page']} of {event['total_pages']})",
+                            )
+                        else:
+                            progress_bar.progress(10, text=f"🧠 Analyzed clause {done}")
+                    elif event["event"] == "summary":
+                        result["summary"] = event["summary"]
+                    elif event["event"] == "error":
+                        raise RuntimeError(event["detail"])
+
                 progress_text = "🧠 Processing complete."
                 progress_bar.progress(100, text=progress_text)
 
-                result = response.json()
                 st.session_state["analysis_result"] = result  # ✅ Used in View Results
                 st.session_state["uploaded_file"] = uploaded_file
                 st.session_state["uploaded_file_name"] = uploaded_file.name
@@ -21,6 +21,8 @@ st.subheader("📋 Summary")
 st.write(f"**Total Clauses:** {result['summary']['total_clauses']}")
 st.write(f"**Total Obligations:** {result['summary']['total_obligations']}")
 st.write("**Missing Clauses:**", ", ".join(result["summary"]["missing_clauses"]))
+if result["summary"].get("reused_clauses"):
+    st.caption(f"♻️ {result['summary']['reused_clauses']} clauses unchanged from earlier uploads were reused.")
 
 # 📊 Charts Section
 st.markdown("### 📊 Clause Type Distribution")
@@ -51,7 +53,7 @@ for clause in result["details"]:
         if clause["obligations"]:
             st.write("**Obligations:**")
             for ob in clause["obligations"]:
-                st.markdown(f"- {ob}")
+                st.markdown(f"- {ob['text']}")
 
 # 📥 PDF Download
 st.subheader("📥 Download PDF Report")
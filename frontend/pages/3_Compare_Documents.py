@@ -32,10 +32,6 @@ if doc1 and doc2:
             if response.status_code == 200:
                 comparison = response.json()
                 st.session_state["comparison_result"] = comparison
-                st.session_state["doc1_bytes"] = doc1_bytes
-                st.session_state["doc2_bytes"] = doc2_bytes
-                st.session_state["doc1_name"] = doc1.name
-                st.session_state["doc2_name"] = doc2.name
             else:
                 st.error("❌ Comparison failed.")
 
@@ -72,36 +68,49 @@ if "comparison_result" in st.session_state:
 
     st.dataframe(summary_df, use_container_width=True)
 
-    st.markdown("### ⚖️ Clause Differences (Experimental)")
+    st.markdown("### ⚖️ Clause Differences")
+    alignment = result["alignment"]
+    stats = alignment["stats"]
+    st.write(
+        f"**Identical:** {stats['matched']} · **Modified:** {stats['modified']} · "
+        f"**Only in {doc1_name}:** {stats['removed']} · **Only in {doc2_name}:** {stats['added']}"
+    )
+
+    if alignment["modified"]:
+        st.markdown("#### ✏️ Modified Clauses")
+        for pair in alignment["modified"]:
+            redline = " ".join(
+                f'<span class="diff-red"><del>{op["text"]}</del></span>' if op["op"] == "delete"
+                else f'<span class="diff-green">{op["text"]}</span>' if op["op"] == "insert"
+                else op["text"]
+                for op in pair["diff"]
+            )
+            with st.expander(f"Clause {pair['doc1_index'] + 1} → {pair['doc2_index'] + 1} "
+                             f"({pair['similarity']:.0%} similar)"):
+                st.markdown(redline, unsafe_allow_html=True)
+
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown(f"📄 **Unique to {doc1_name}**")
-        for clause in result["unique_doc1"]:
-            st.markdown(f'<div class="diff-green">✅ {clause}</div>', unsafe_allow_html=True)
+        st.markdown(f"📄 **Only in {doc1_name}**")
+        for item in alignment["removed"]:
+            st.markdown(f'<div class="diff-red">❌ {item["clause"]}</div>', unsafe_allow_html=True)
 
     with col2:
-        st.markdown(f"📄 **Unique to {doc2_name}**")
-        for clause in result["unique_doc2"]:
-            st.markdown(f'<div class="diff-green">✅ {clause}</div>', unsafe_allow_html=True)
+        st.markdown(f"📄 **Only in {doc2_name}**")
+        for item in alignment["added"]:
+            st.markdown(f'<div class="diff-green">✅ {item["clause"]}</div>', unsafe_allow_html=True)
 
     st.markdown("---")
     st.subheader("📎 Download Comparison")
 
     if st.button("📥 Download PDF Summary"):
-        doc1_bytes = st.session_state.get("doc1_bytes")
-        doc2_bytes = st.session_state.get("doc2_bytes")
-        doc1_name = st.session_state.get("doc1_name", "document1.pdf")
-        doc2_name = st.session_state.get("doc2_name", "document2.pdf")
+        comparison_id = result.get("comparison_id")
 
-        if doc1_bytes and doc2_bytes:
+        if comparison_id:
             with st.spinner("📄 Generating PDF..."):
                 try:
-                    files = [
-                        ("file1", (doc1_name, doc1_bytes, "application/pdf")),
-                        ("file2", (doc2_name, doc2_bytes, "application/pdf")),
-                    ]
-                    resp = requests.post(f"{BACKEND_URL}/compare/download", files=files)
+                    resp = requests.get(f"{BACKEND_URL}/compare/{comparison_id}/download")
                     if resp.status_code == 200:
                         st.success("✅ PDF report ready!")
                         st.download_button(
@@ -110,9 +119,11 @@ if "comparison_result" in st.session_state:
                             file_name="comparison_report.pdf",
                             mime="application/pdf"
                         )
+                    elif resp.status_code == 404:
+                        st.error("📎 This comparison has expired. Please compare the documents again.")
                     else:
                         st.error("❌ PDF generation failed.")
                 except Exception as e:
                     st.error(f"🚨 Error during PDF generation: {e}")
         else:
-            st.error("📎 Please re-upload both documents before downloading the PDF.")
+            st.error("📎 Please compare the documents again before downloading the PDF.")
@@ -1,59 +1,214 @@
 # legal_doc_analyzer/agents/classifier_agent.py
 
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import torch
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 import os
 import logging
+import threading
+
+import numpy as np
+
+from legal_doc_analyzer.utils.keyword_matcher import KeywordMatcher
+from legal_doc_analyzer.utils.inference_backends import load_backend, model_revision
 
 logger = logging.getLogger(__name__)
 
+# Clauses per forward pass when classifying a whole document
+DEFAULT_BATCH_SIZE = int(os.getenv("CLASSIFIER_BATCH_SIZE", "16"))
+MODEL_NAME = "nlpaueb/legal-bert-base-uncased"
+# Inference engine for LegalBERT: torch, onnx or onnx-int8 (falls back to torch)
+DEFAULT_BACKEND = os.getenv("CLASSIFIER_BACKEND", "torch")
+# Tokens shared by consecutive windows of a clause longer than the model's 512
+WINDOW_STRIDE = int(os.getenv("CLASSIFIER_WINDOW_STRIDE", "128"))
+
+# Heuristic fallback: first label whose keywords appear in the clause wins
+HEURISTIC_RULES = [
+    ("termination", frozenset({"termination"})),
+    ("confidentiality", frozenset({"confidential", "nondisclosure"})),
+    ("indemnity", frozenset({"indemnify", "liability"})),
+    ("governing law", frozenset({"governing law", "jurisdiction"})),
+    ("force majeure", frozenset({"force majeure"})),
+    ("payment terms", frozenset({"payment"})),
+    ("dispute resolution", frozenset({"dispute", "arbitration"})),
+]
+
 class ClauseClassifierAgent:
-    def __init__(self):
-        try:
-            model_name = "nlpaueb/legal-bert-base-uncased"
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(
-                model_name,
-                num_labels=len(self.get_label_map()),
-            )
-            self.label_map = self.get_label_map()
-            self.use_transformer = True
-            logger.info("✅ LegalBERT loaded successfully.")
-        except Exception as e:
-            logger.warning("⚠️ LegalBERT not available. Falling back to heuristics.")
-            self.use_transformer = False
-
-    def classify(self, clause_text: str) -> str:
+    def __init__(
+        self, batch_size: Optional[int] = None, backend: Optional[str] = None, window_stride: Optional[int] = None
+    ):
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self.window_stride = window_stride if window_stride is not None else WINDOW_STRIDE
+        self.backend_name = backend or DEFAULT_BACKEND
+        self.inference = None
+        self.keyword_matcher = KeywordMatcher(self.keywords())
+        self.label_map = self.get_label_map()
+        self.load_error: Optional[str] = None
+        self._use_transformer = False
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+    # 🐢 torch/transformers are imported and LegalBERT loaded on first use, not at import
+    def load(self) -> bool:
+        if self._loaded:
+            return self._use_transformer
+        with self._load_lock:
+            if self._loaded:
+                return self._use_transformer
+            try:
+                from transformers import AutoConfig, AutoTokenizer
+
+                self.tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+                self.config = AutoConfig.from_pretrained(MODEL_NAME, num_labels=len(self.label_map))
+                self.inference = load_backend(
+                    self.backend_name, MODEL_NAME, len(self.label_map), self._load_torch_model,
+                    revision=model_revision(self.config),
+                )
+                self._use_transformer = True
+                logger.info("✅ LegalBERT loaded successfully (%s backend).", self.inference.name)
+            except Exception as e:
+                self.load_error = f"{type(e).__name__}: {e}"
+                logger.warning("⚠️ LegalBERT not available (%s). Falling back to heuristics.", self.load_error)
+            self._loaded = True
+        return self._use_transformer
+
+    def _load_torch_model(self):
+        from transformers import AutoModelForSequenceClassification
+
+        return AutoModelForSequenceClassification.from_pretrained(MODEL_NAME, config=self.config)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def use_transformer(self) -> bool:
+        return self.load()
+
+    @property
+    def backend(self) -> str:
+        if not self._loaded:
+            return "not loaded"
+        return f"legalbert/{self.inference.name}" if self._use_transformer else "heuristics"
+
+    def classify(self, clause_text: str, hits: Optional[FrozenSet[str]] = None) -> str:
         if self.use_transformer:
             return self._classify_with_model(clause_text)
         else:
-            return self._classify_with_heuristics(clause_text)
+            return self._classify_with_heuristics(clause_text, hits)
+
+    def classify_batch(
+        self,
+        clauses: List[str],
+        batch_size: Optional[int] = None,
+        hits: Optional[Sequence[FrozenSet[str]]] = None,
+    ) -> List[str]:
+        if not clauses:
+            return []
+        if self.use_transformer:
+            return self._classify_batch_with_model(clauses, batch_size or self.batch_size)
+        if hits is None:
+            hits = self.keyword_matcher.scan_many(clauses)
+        return [self._classify_with_heuristics(clause, clause_hits) for clause, clause_hits in zip(clauses, hits)]
+
+    def score_batch(
+        self,
+        clauses: List[str],
+        batch_size: Optional[int] = None,
+        hits: Optional[Sequence[FrozenSet[str]]] = None,
+        with_embeddings: bool = False,
+    ) -> Tuple[List[str], List[Optional[float]], Optional[np.ndarray]]:
+        """Labels, the model's confidence in each (None for the heuristics) and,
+        when asked, mean-pooled clause embeddings, all from the same forward passes."""
+        if with_embeddings and not self.use_transformer:
+            raise RuntimeError("Clause embeddings require the LegalBERT model")
+        if not clauses:
+            empty = np.empty((0, self.embedding_dim), dtype=np.float32) if with_embeddings else None
+            return [], [], empty
+        if self.use_transformer:
+            return self._run_model_batches(clauses, batch_size or self.batch_size, with_embeddings)
+        return self.classify_batch(clauses, hits=hits), [None] * len(clauses), None
 
     def _classify_with_model(self, clause_text: str) -> str:
-        inputs = self.tokenizer(clause_text, return_tensors="pt", truncation=True, padding=True)
-        with torch.no_grad():
-            logits = self.model(**inputs).logits
-            predicted_label = torch.argmax(logits, dim=1).item()
-            return self.label_map.get(predicted_label, "unknown")
-
-    def _classify_with_heuristics(self, clause_text: str) -> str:
-        clause_text = clause_text.lower()
-        if "termination" in clause_text:
-            return "termination"
-        elif "confidential" in clause_text or "nondisclosure" in clause_text:
-            return "confidentiality"
-        elif "indemnify" in clause_text or "liability" in clause_text:
-            return "indemnity"
-        elif "governing law" in clause_text or "jurisdiction" in clause_text:
-            return "governing law"
-        elif "force majeure" in clause_text:
-            return "force majeure"
-        elif "payment" in clause_text:
-            return "payment terms"
-        elif "dispute" in clause_text or "arbitration" in clause_text:
-            return "dispute resolution"
-        else:
-            return "unknown"
+        labels, _, _ = self._run_model_batches([clause_text], self.batch_size, with_embeddings=False)
+        return labels[0]
+
+    def _classify_batch_with_model(self, clauses: List[str], batch_size: int) -> List[str]:
+        labels, _, _ = self._run_model_batches(clauses, batch_size, with_embeddings=False)
+        return labels
+
+    def classify_and_embed_batch(self, clauses: List[str], batch_size: Optional[int] = None):
+        # One forward pass yields both the label and a mean-pooled clause embedding
+        labels, _, embeddings = self.score_batch(clauses, batch_size, with_embeddings=True)
+        return labels, embeddings
+
+    def embed_batch(self, clauses: List[str], batch_size: Optional[int] = None):
+        return self.classify_and_embed_batch(clauses, batch_size)[1]
+
+    @property
+    def embedding_dim(self) -> int:
+        return self.config.hidden_size
+
+    def _windows(self, clauses: List[str]) -> Tuple[List[Dict], List[int]]:
+        """Model inputs for every window of every clause, and the clause each belongs to.
+
+        A clause longer than the model's input is cut into overlapping windows
+        instead of being truncated to its first 512 tokens.
+        """
+        max_length = min(self.tokenizer.model_max_length, self.config.max_position_embeddings)
+        span = max_length - self.tokenizer.num_special_tokens_to_add()
+        step = span - min(self.window_stride, span // 2)
+        token_ids = self.tokenizer(clauses, add_special_tokens=False, verbose=False)["input_ids"]
+
+        windows, owners = [], []
+        for i, ids in enumerate(token_ids):
+            start = 0
+            while True:
+                windows.append(self.tokenizer.prepare_for_model(ids[start:start + span], verbose=False))
+                owners.append(i)
+                if start + span >= len(ids):
+                    break
+                start += step
+        return windows, owners
+
+    def _run_model_batches(self, clauses: List[str], batch_size: int, with_embeddings: bool):
+        # Windows of every clause share the forward passes; sorted by length so each
+        # batch is only padded up to its own longest window instead of the document's.
+        windows, owners = self._windows(clauses)
+        order = sorted(range(len(windows)), key=lambda w: len(windows[w]["input_ids"]))
+
+        probabilities = np.zeros((len(clauses), len(self.label_map)))
+        tokens_seen = np.zeros(len(clauses))
+        embeddings = np.zeros((len(clauses), self.embedding_dim), dtype=np.float32) if with_embeddings else None
+        for start in range(0, len(order), batch_size):
+            bucket = order[start:start + batch_size]
+            inputs = self.tokenizer.pad([windows[w] for w in bucket], padding="longest", return_tensors="np")
+            logits, hidden = self.inference.run(dict(inputs), with_hidden=with_embeddings)
+            owner = np.array([owners[w] for w in bucket])
+            mask = inputs["attention_mask"]
+            lengths = mask.sum(axis=1)
+            # Each window votes with its class probabilities, weighted by the tokens it saw
+            exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+            np.add.at(probabilities, owner, exp / exp.sum(axis=1, keepdims=True) * lengths[:, None])
+            np.add.at(tokens_seen, owner, lengths)
+            if with_embeddings:
+                np.add.at(embeddings, owner, (hidden * mask[..., None].astype(hidden.dtype)).sum(axis=1))
+
+        probabilities /= np.maximum(tokens_seen, 1)[:, None]
+        labels = [self.label_map.get(label, "unknown") for label in probabilities.argmax(axis=1).tolist()]
+        confidences = [round(confidence, 4) for confidence in probabilities.max(axis=1).tolist()]
+        if with_embeddings:
+            embeddings /= np.maximum(tokens_seen, 1)[:, None].astype(np.float32)
+        return labels, confidences, embeddings
+
+    def _classify_with_heuristics(self, clause_text: str, hits: Optional[FrozenSet[str]] = None) -> str:
+        if hits is None:
+            hits = self.keyword_matcher.scan(clause_text)
+        for label, keywords in HEURISTIC_RULES:
+            if hits & keywords:
+                return label
+        return "unknown"
+
+    def keywords(self) -> Set[str]:
+        return {keyword for _, keywords in HEURISTIC_RULES for keyword in keywords}
 
     def get_label_map(self):
         # You can customize this as needed
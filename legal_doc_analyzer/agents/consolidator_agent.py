@@ -7,13 +7,26 @@ class ConsolidatorAgent:
         self,
         clauses_data: List[Dict],
         missing_clauses: List[str],
-        obligations: List[str],
+        obligations: List[Dict],
+        reused_clauses: int = 0,
     ) -> Dict:
         return {
-            "summary": {
-                "total_clauses": len(clauses_data),
-                "missing_clauses": missing_clauses,
-                "total_obligations": len(obligations),
-            },
+            "summary": self.summarize(len(clauses_data), missing_clauses, len(obligations), reused_clauses),
             "details": clauses_data,
         }
+
+    def summarize(
+        self,
+        total_clauses: int,
+        missing_clauses: List[str],
+        total_obligations: int,
+        reused_clauses: int = 0,
+    ) -> Dict:
+        # From running counts, for a pipeline that doesn't keep every clause around
+        return {
+            "total_clauses": total_clauses,
+            "missing_clauses": missing_clauses,
+            "total_obligations": total_obligations,
+            # Clauses whose results came from an earlier analysis of identical text
+            "reused_clauses": reused_clauses,
+        }
@@ -1,11 +1,13 @@
 # missing_clause_detector.py
 
-from typing import List
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from legal_doc_analyzer.utils.keyword_matcher import KeywordMatcher
 
 class MissingClauseDetectorAgent:
     def __init__(self):
         # Standard clauses often expected in legal documents
-        self.required_clauses = {
+        self.required_clauses = frozenset({
             "confidentiality",
             "termination",
             "governing law",
@@ -14,15 +16,34 @@ class MissingClauseDetectorAgent:
             "dispute resolution",
             "payment terms",
             "intellectual property",
-        }
+        })
+        self.keyword_matcher = KeywordMatcher(self.required_clauses)
+
+    def keywords(self) -> Set[str]:
+        return set(self.required_clauses)
 
-    def detect(self, clauses: List[str]) -> List[str]:
+    def detect(self, clauses: List[str], hits: Optional[Sequence[FrozenSet[str]]] = None) -> List[str]:
+        if hits is None:
+            hits = self.keyword_matcher.scan_many(clauses)
+        return self.missing(self.found(hits))
+
+    # Incremental form for documents read in chunks: union ``found`` per chunk, then ``missing``
+    def found(self, hits: Sequence[FrozenSet[str]]) -> Set[str]:
         found = set()
+        for clause_hits in hits:
+            found |= clause_hits & self.required_clauses
+        return found
 
-        for clause in clauses:
-            for required in self.required_clauses:
-                if required.lower() in clause.lower():
-                    found.add(required)
+    def missing(self, found: Set[str]) -> List[str]:
+        return sorted(self.required_clauses - found)
 
-        missing = self.required_clauses - found
-        return sorted(missing)
+    def bundle_view(self, missing_by_document: Sequence[Tuple[str, List[str]]]) -> Dict:
+        # A master agreement and its schedules: a clause present in any document covers the bundle
+        found_in = {
+            clause: [name for name, missing in missing_by_document if clause not in missing]
+            for clause in sorted(self.required_clauses)
+        }
+        return {
+            "missing_clauses": [clause for clause, names in found_in.items() if not names],
+            "found_in": found_in,
+        }
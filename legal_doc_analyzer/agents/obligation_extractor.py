@@ -1,35 +1,81 @@
 # obligation_extractor.py
 
 import re
-from typing import List
+from typing import Dict, List, Optional
 
+from legal_doc_analyzer.utils.llm_client import get_llm_client
 from legal_doc_analyzer.utils.llm_utils import call_llm  # if using LLM fallback
 
+OBLIGATION_TRIGGERS = [
+    "shall",
+    "must",
+    "agrees to",
+    "is required to",
+    "is obligated to",
+    "will",
+]
+
+# One alternation for every trigger; multi-word triggers tolerate PDF line breaks
+TRIGGER_RE = re.compile(
+    r"\b(" + "|".join(r"\s+".join(map(re.escape, t.split())) for t in OBLIGATION_TRIGGERS) + r")\b",
+    flags=re.IGNORECASE,
+)
+
 class ObligationExtractorAgent:
     def __init__(self, use_llm_fallback: bool = False):
         self.use_llm = use_llm_fallback
-        self.patterns = [
-            r"\bshall\b[^.]*\.",
-            r"\bmust\b[^.]*\.",
-            r"\bagrees to\b[^.]*\.",
-            r"\bis required to\b[^.]*\.",
-            r"\bis obligated to\b[^.]*\.",
-            r"\bwill\b[^.]*\.",
-        ]
-
-    def extract(self, clause: str) -> List[str]:
+        self.triggers = OBLIGATION_TRIGGERS
+
+    def _scan(self, clause: str) -> List[Dict]:
+        # Walk trigger hits left to right; each hit claims the sentence around it,
+        # so a sentence with several triggers is reported once with all of them.
         obligations = []
+        current: Optional[Dict] = None
+        for match in TRIGGER_RE.finditer(clause):
+            trigger = " ".join(match.group(1).lower().split())
+            if current is not None and match.start() < current["end"]:
+                if trigger not in current["triggers"]:
+                    current["triggers"].append(trigger)
+                continue
 
-        # Run regex patterns
-        for pattern in self.patterns:
-            matches = re.findall(pattern, clause, flags=re.IGNORECASE)
-            obligations.extend(matches)
+            start = clause.rfind(".", 0, match.start()) + 1
+            end = clause.find(".", match.end())
+            end = len(clause) if end == -1 else end + 1
+
+            # Trim surrounding whitespace without losing the offsets
+            while start < end and clause[start].isspace():
+                start += 1
+            while end > start and clause[end - 1].isspace():
+                end -= 1
+
+            current = {"text": clause[start:end], "start": start, "end": end, "triggers": [trigger]}
+            obligations.append(current)
+        return obligations
+
+    def _llm_prompt(self, clause: str) -> str:
+        return f"Extract all obligations (duties, responsibilities) from the following clause:\n\n{clause}"
+
+    def extract(self, clause: str) -> List[Dict]:
+        obligations = self._scan(clause)
 
         # Optional: Use LLM for fallback
         if self.use_llm and not obligations:
-            prompt = f"Extract all obligations (duties, responsibilities) from the following clause:\n\n{clause}"
-            llm_response = call_llm(prompt)
+            llm_response = call_llm(self._llm_prompt(clause))
             if llm_response:
-                obligations.append(llm_response.strip())
+                obligations.append({"text": llm_response.strip(), "start": None, "end": None, "triggers": []})
 
         return obligations
+
+    def extract_batch(self, clauses: List[str]) -> List[List[Dict]]:
+        results = [self._scan(clause) for clause in clauses]
+
+        if self.use_llm:
+            pending = [i for i, obligations in enumerate(results) if not obligations]
+            responses = get_llm_client().complete_many(
+                [[{"role": "user", "content": self._llm_prompt(clauses[i])}] for i in pending]
+            )
+            for i, response in zip(pending, responses):
+                if response:
+                    results[i].append({"text": response.strip(), "start": None, "end": None, "triggers": []})
+
+        return results
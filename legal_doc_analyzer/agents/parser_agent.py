@@ -1,21 +1,150 @@
-import pdfplumber
-import docx2txt
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+# Page-parallel extraction only pays off once a document is long enough
+PARALLEL_MIN_PAGES = int(os.getenv("PARSER_PARALLEL_MIN_PAGES", "32"))
+PARSER_WORKERS = int(os.getenv("PARSER_WORKERS", str(os.cpu_count() or 1)))
+
+
+def _iter_pdf_pages(pdf, start: int = 0, stop: Optional[int] = None):
+    # pdf.pages builds every page up front and pdfminer caches each object it parses;
+    # walk the page tree lazily and drop the cache so long files use constant memory
+    from pdfminer.pdfpage import PDFPage
+    from pdfplumber.page import Page
+
+    doctop = 0
+    for number, page_obj in enumerate(PDFPage.create_pages(pdf.doc)):
+        if stop is not None and number >= stop:
+            break
+        if number < start:
+            continue  # only text is extracted, so pages before the slice needn't offset doctop
+        page = Page(pdf, page_obj, page_number=number + 1, initial_doctop=doctop)
+        doctop += page.height
+        yield page
+        page.flush_cache()
+        for cache in ("_cached_objs", "_parsed_objs"):
+            getattr(pdf.doc, cache, {}).clear()
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    # Runs in a worker process: open the file independently and only touch our slice
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return [page.extract_text() or "" for page in _iter_pdf_pages(pdf, start, stop)]
+
+
+def _extract_document(file_path: str) -> Tuple[str, Optional[int]]:
+    # Runs in a worker process: one whole document per task
+    return ParserAgent(max_workers=1).extract(file_path)
+
+
+def pdf_page_count(file_path: str) -> int:
+    # Walks the page tree without parsing any page content; /Count can't be trusted in broken files
+    import pdfplumber
+    from pdfminer.pdfpage import PDFPage
+
+    with pdfplumber.open(file_path) as pdf:
+        return sum(1 for _ in PDFPage.create_pages(pdf.doc))
+
 
 class ParserAgent:
+    def __init__(self, max_workers: Optional[int] = None, parallel_min_pages: Optional[int] = None):
+        self.max_workers = max_workers if max_workers is not None else PARSER_WORKERS
+        self.parallel_min_pages = parallel_min_pages if parallel_min_pages is not None else PARALLEL_MIN_PAGES
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
     def process(self, file_path):
+        return self.extract(file_path)[0]
+
+    def extract(self, file_path) -> Tuple[str, Optional[int]]:
+        # Text plus page count; DOCX has no fixed pages, so its count is None
+        texts = list(self.iter_pages(file_path))
+        return "".join(texts), len(texts) if file_path.endswith(".pdf") else None
+
+    def extract_many(self, file_paths: Sequence[str]) -> List[Union[Tuple[str, Optional[int]], Exception]]:
+        """``extract`` for several documents, parsed in parallel across documents.
+        A file that can't be parsed gets its exception in its slot instead."""
+        if self.max_workers > 1 and len(file_paths) > 1:
+            executor = self._get_executor()
+            futures = [executor.submit(_extract_document, path) for path in file_paths]
+            outcomes = [future.result for future in futures]
+        else:
+            outcomes = [partial(self.extract, path) for path in file_paths]
+
+        results = []
+        for outcome in outcomes:
+            try:
+                results.append(outcome())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def page_count(self, file_path) -> Optional[int]:
+        return pdf_page_count(file_path) if file_path.endswith(".pdf") else None
+
+    def iter_pages(self, file_path) -> Iterator[str]:
+        """Page texts in order, each ending in a newline, one page in memory at a time.
+        A DOCX has no fixed pages and is yielded as a single one."""
         if file_path.endswith(".pdf"):
-            return self._extract_pdf(file_path)
+            for text in self._iter_pdf(file_path):
+                yield text + "\n"
         elif file_path.endswith(".docx"):
-            return self._extract_docx(file_path)
+            yield self._extract_docx(file_path)
         else:
             raise ValueError("Unsupported file type")
 
-    def _extract_pdf(self, file_path):
-        text = ""
+    def _iter_pdf(self, file_path) -> Iterator[str]:
+        import pdfplumber
+
+        if self.max_workers > 1:
+            page_count = pdf_page_count(file_path)
+            if page_count >= self.parallel_min_pages:
+                yield from self._iter_pdf_parallel(file_path, page_count)
+                return
+
         with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text += page.extract_text() + "\n"
-        return text
+            for page in _iter_pdf_pages(pdf):
+                yield page.extract_text() or ""
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def _iter_pdf_parallel(self, file_path: str, page_count: int) -> Iterator[str]:
+        executor = self._get_executor()
+        # A few ranges per worker, so text streams out in order and only a bounded window of
+        # them is in flight; each range re-opens the file, so they shouldn't get too small
+        step = max(self.parallel_min_pages, -(-page_count // (self.max_workers * 4)), 1)
+        ranges = (
+            (start, min(start + step, page_count)) for start in range(0, page_count, step)
+        )
+        in_flight = deque(
+            executor.submit(_extract_page_range, file_path, start, stop)
+            for start, stop in islice(ranges, self.max_workers * 2)
+        )
+        while in_flight:
+            texts = in_flight.popleft().result()
+            following = next(ranges, None)
+            if following is not None:
+                in_flight.append(executor.submit(_extract_page_range, file_path, *following))
+            yield from texts
+
+    def close(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
 
     def _extract_docx(self, file_path):
+        import docx2txt
+
         return docx2txt.process(file_path)
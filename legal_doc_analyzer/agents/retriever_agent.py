@@ -1,7 +1,7 @@
 # risk_analyzer_agent.py
 
-from typing import Literal
-import re
+from typing import FrozenSet, Literal, Optional, Set
+from legal_doc_analyzer.utils.keyword_matcher import KeywordMatcher
 from legal_doc_analyzer.utils.llm_utils import call_llm  # Optional fallback to GPT
 
 RiskLevel = Literal["✅ Safe", "⚠️ Medium Risk", "❌ High Risk"]
@@ -10,21 +10,26 @@ class RiskAnalyzerAgent:
     def __init__(self, use_llm_fallback: bool = False):
         self.use_llm = use_llm_fallback
 
-        self.high_risk_keywords = [
-            "indemnify", "hold harmless", "penalty", "termination without cause", 
+        self.high_risk_keywords = frozenset({
+            "indemnify", "hold harmless", "penalty", "termination without cause",
             "liquidated damages", "waiver of rights"
-        ]
-        self.medium_risk_keywords = [
+        })
+        self.medium_risk_keywords = frozenset({
             "non-compete", "non-solicitation", "exclusive", "binding arbitration",
             "governing law", "dispute resolution", "late fees"
-        ]
+        })
+        self.keyword_matcher = KeywordMatcher(self.keywords())
 
-    def analyze(self, clause: str) -> RiskLevel:
-        clause_lower = clause.lower()
+    def keywords(self) -> Set[str]:
+        return set(self.high_risk_keywords | self.medium_risk_keywords)
 
-        if any(kw in clause_lower for kw in self.high_risk_keywords):
+    def analyze(self, clause: str, hits: Optional[FrozenSet[str]] = None) -> RiskLevel:
+        if hits is None:
+            hits = self.keyword_matcher.scan(clause)
+
+        if hits & self.high_risk_keywords:
             return "❌ High Risk"
-        elif any(kw in clause_lower for kw in self.medium_risk_keywords):
+        elif hits & self.medium_risk_keywords:
             return "⚠️ Medium Risk"
         else:
             if self.use_llm:
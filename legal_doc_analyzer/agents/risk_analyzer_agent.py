@@ -1,12 +1,20 @@
 # risk_analyzer_agent.py
+from typing import FrozenSet, Optional, Set
+
+from legal_doc_analyzer.utils.keyword_matcher import KeywordMatcher
+
 class RiskAnalyzerAgent:
     def __init__(self):
         # Simple list of risky keywords (expand later)
-        self.risky_keywords = ["penalty", "termination", "liability", "indemnify"]
+        self.risky_keywords = frozenset({"penalty", "termination", "liability", "indemnify"})
+        self.keyword_matcher = KeywordMatcher(self.risky_keywords)
+
+    def keywords(self) -> Set[str]:
+        return set(self.risky_keywords)
 
-    def analyze(self, clause):
-        lower_clause = clause.lower()
-        for keyword in self.risky_keywords:
-            if keyword in lower_clause:
-                return "⚠️ Risky"
+    def analyze(self, clause, hits: Optional[FrozenSet[str]] = None):
+        if hits is None:
+            hits = self.keyword_matcher.scan(clause)
+        if hits & self.risky_keywords:
+            return "⚠️ Risky"
         return "✅ Safe"
@@ -1,7 +1,34 @@
 import re
+from typing import Iterable, Iterator
+
+# Example: split on numbered clauses like "1.", "2.", etc.
+CLAUSE_BOUNDARY = re.compile(r"\n\d+\.\s")
+# The start of a boundary cut off by the end of the text read so far
+PARTIAL_BOUNDARY = re.compile(r"\n\d*\.?")
 
 class ClauseSegmenterAgent:
     def process(self, text):
-        # Example: split on numbered clauses like "1.", "2.", etc.
-        clauses = re.split(r"\n\d+\.\s", text)
+        clauses = CLAUSE_BOUNDARY.split(text)
         return [clause.strip() for clause in clauses if clause.strip()]
+
+    def iter_clauses(self, pages: Iterable[str]) -> Iterator[str]:
+        """Same clauses as ``process("".join(pages))``, emitted as soon as the next
+        boundary is read; only the unfinished clause is held between pages."""
+        carry = ""
+        scan_from = 0
+        for page in pages:
+            carry += page
+            clause_start = 0
+            for boundary in CLAUSE_BOUNDARY.finditer(carry, scan_from):
+                clause = carry[clause_start:boundary.start()].strip()
+                if clause:
+                    yield clause
+                clause_start = boundary.end()
+            carry = carry[clause_start:]
+            # Don't rescan a clause that runs over many pages, except a boundary split by the page break
+            newline = carry.rfind("\n")
+            scan_from = newline if newline != -1 and PARTIAL_BOUNDARY.fullmatch(carry, newline) else len(carry)
+
+        clause = carry.strip()
+        if clause:
+            yield clause
@@ -1,18 +1,20 @@
 # summarizer_agent.py
 
 import os
+from typing import List
+from legal_doc_analyzer.utils.llm_client import LLMError, get_llm_client
 from legal_doc_analyzer.utils.logger import get_logger
 
 logger = get_logger("SummarizerAgent")
 
+SYSTEM_PROMPT = "You are a legal expert."
+
 class SummarizerAgent:
     def __init__(self):
         self.use_llm = os.getenv("OPENAI_API_KEY") is not None
         if self.use_llm:
             try:
-                import openai
-                self.openai = openai
-                self.openai.api_key = os.getenv("OPENAI_API_KEY")
+                self.llm = get_llm_client()
                 logger.info("✅ SummarizerAgent: OpenAI API loaded.")
             except Exception as e:
                 logger.warning(f"⚠️ Failed to initialize OpenAI: {e}")
@@ -23,25 +25,40 @@ class SummarizerAgent:
         summary = clause.strip().split(".")[0]
         return summary + "." if summary and not summary.endswith('.') else summary
 
+    def _messages(self, clause: str) -> List[dict]:
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": f"Summarize the following clause in one sentence:\n\n{clause}"}
+        ]
+
     def summarize(self, clause: str) -> str:
         if not clause.strip():
             return "No content provided."
 
         if self.use_llm:
             try:
-                response = self.openai.ChatCompletion.create(
-                    model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": "You are a legal expert."},
-                        {"role": "user", "content": f"Summarize the following clause in one sentence:\n\n{clause}"}
-                    ],
-                    temperature=0.3,
-                    max_tokens=100
-                )
-                summary = response.choices[0].message.content.strip()
-                return summary
-            except Exception as e:
+                summary = self.llm.complete(self._messages(clause), temperature=0.3, max_tokens=100)
+                return summary.strip()
+            except LLMError as e:
                 logger.warning(f"🔁 LLM failed. Falling back to heuristics. Error: {e}")
-        
+
         # Fallback
         return self.heuristic_summary(clause)
+
+    def summarize_batch(self, clauses: List[str]) -> List[str]:
+        # Fan a document's clauses out concurrently; the client caps in-flight calls
+        summaries = [None if clause.strip() else "No content provided." for clause in clauses]
+        pending = [i for i, summary in enumerate(summaries) if summary is None]
+
+        if self.use_llm and pending:
+            responses = self.llm.complete_many(
+                [self._messages(clauses[i]) for i in pending], temperature=0.3, max_tokens=100
+            )
+            for i, response in zip(pending, responses):
+                if response is not None:
+                    summaries[i] = response.strip()
+
+        return [
+            summary if summary is not None else self.heuristic_summary(clause)
+            for clause, summary in zip(clauses, summaries)
+        ]
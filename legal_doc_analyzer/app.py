@@ -1,10 +1,20 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, Request
-from fastapi.responses import JSONResponse, FileResponse
+from typing import List, Optional
+from fastapi.responses import JSONResponse, FileResponse, PlainTextResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-import tempfile
+import asyncio
+import hashlib
+import json
 import os
+import re
+import tempfile
+import threading
+import time
+import zipfile
+from itertools import islice
 
 from legal_doc_analyzer.agents.parser_agent import ParserAgent
 from legal_doc_analyzer.agents.segmenter_agent import ClauseSegmenterAgent
@@ -16,28 +26,162 @@ from legal_doc_analyzer.agents.obligation_extractor import ObligationExtractorAg
 from legal_doc_analyzer.agents.consolidator_agent import ConsolidatorAgent
 
 from legal_doc_analyzer.utils.logger import get_logger
-from legal_doc_analyzer.utils.pdf_generator import generate_pdf
+from legal_doc_analyzer.utils.pdf_generator import load_renderer
+from legal_doc_analyzer.utils.analysis_cache import AnalysisCache
+from legal_doc_analyzer.utils.keyword_matcher import KeywordMatcher
+from legal_doc_analyzer.utils.clause_alignment import ClauseAligner
+from legal_doc_analyzer.utils.clause_memo import clause_memo_from_env
+from legal_doc_analyzer.utils.llm_client import existing_llm_client
+from legal_doc_analyzer.utils.responses import (
+    CompressionMiddleware, FastJSONResponse, dumps, parse_fields, project_analysis, project_record
+)
+from legal_doc_analyzer.utils.metrics import (
+    DOCUMENT_CLAUSES, DOCUMENT_PAGES, REGISTRY, REQUEST_SECONDS, Gauge, StageTimer
+)
+from legal_doc_analyzer.services.job_service import JobManager, QueueFullError
+from legal_doc_analyzer.services.vector_store_service import VectorStore
+from legal_doc_analyzer.services.database_service import database_from_env
+from legal_doc_analyzer.services.report_service import report_renderer_from_env
+from legal_doc_analyzer.services.storage_service import InvalidUploadError, StoredBlob, blob_store_from_env
 
 from dotenv import load_dotenv
+from pydantic import BaseModel
+import numpy as np
 load_dotenv()
 
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 logger = get_logger("app")
 
+# 🗜️ gzip/brotli for complete JSON responses, when the client accepts them
+if os.getenv("RESPONSE_COMPRESSION", "true").lower() == "true":
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+    )
+
 # 🚦 Rate limiter setup
 limiter = Limiter(key_func=get_remote_address, default_limits=["20/minute"])
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# ✅ PDF validation
-def is_valid_pdf(upload_file: UploadFile, max_size_mb: int = 5) -> bool:
-    if not upload_file.filename.endswith(".pdf"):
-        return False
-    contents = upload_file.file.read()
-    if len(contents) > max_size_mb * 1024 * 1024 or not contents.startswith(b"%PDF"):
-        return False
-    upload_file.file.seek(0)
-    return True
+# ⏱️ Latency per route template (raw paths would explode label cardinality)
+QUIET_ROUTES = {"/health", "/ready", "/metrics"}
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # For streamed responses this is time to first byte; the body is still being produced
+        elapsed = time.perf_counter() - started
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        REQUEST_SECONDS.observe(elapsed, method=request.method, route=path, status=status)
+        if path not in QUIET_ROUTES:
+            logger.info("🌐 Request handled", extra={"fields": {
+                "method": request.method,
+                "route": path,
+                "status": status,
+                "seconds": round(elapsed, 4),
+            }})
+
+# 🏗️ Worker pool: analyses never run on the event loop
+job_manager = JobManager(
+    max_workers=int(os.getenv("ANALYSIS_WORKERS", str(os.cpu_count() or 2))),
+    max_queue=int(os.getenv("ANALYSIS_QUEUE_SIZE", "16")),
+    mode=os.getenv("ANALYSIS_EXECUTOR", "thread"),
+)
+
+async def queue_full_handler(request: Request, exc: QueueFullError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy, please retry shortly."},
+        headers={"Retry-After": "5"},
+    )
+
+app.add_exception_handler(QueueFullError, queue_full_handler)
+
+# 📦 Uploads stream into a content-addressed store, validated chunk by chunk.
+# Stored blobs are leased until the request (or job) using them is done, so
+# eviction for later uploads never removes a file that is still to be parsed.
+blob_store = blob_store_from_env()
+
+async def store_pdf(upload_file: UploadFile, detail: str = "Invalid or corrupted PDF") -> StoredBlob:
+    if not upload_file or not upload_file.filename or not upload_file.filename.endswith(".pdf"):
+        raise HTTPException(status_code=400, detail=detail)
+    try:
+        return await run_in_threadpool(blob_store.save_stream, upload_file.file, lease=True)
+    except InvalidUploadError as e:
+        logger.warning("🚫 Rejected upload %s: %s", upload_file.filename, e)
+        raise HTTPException(status_code=400, detail=detail)
+
+# 📦 Bundle uploads: several PDFs, or ZIP archives of them
+BATCH_MAX_DOCUMENTS = int(os.getenv("BATCH_MAX_DOCUMENTS", "25"))
+
+def store_bundle(uploads: List[UploadFile]):
+    # Every member stays leased until the bundle is analyzed; a rejected bundle releases what it stored
+    documents = []
+    try:
+        for upload in uploads:
+            name = upload.filename or ""
+            if name.lower().endswith(".zip"):
+                store_zip(upload, documents)
+            elif name.lower().endswith(".pdf"):
+                documents.append((store_upload(upload.file, name), name))
+            else:
+                raise HTTPException(status_code=400, detail=f"Only PDF files or ZIP archives of PDFs are accepted: {name}")
+            if len(documents) > BATCH_MAX_DOCUMENTS:
+                raise HTTPException(status_code=400, detail=f"A bundle holds at most {BATCH_MAX_DOCUMENTS} documents")
+        if not documents:
+            raise HTTPException(status_code=400, detail="No PDF documents in the upload")
+    except BaseException:
+        blob_store.release(*(blob for blob, _ in documents))
+        raise
+    return documents
+
+def store_zip(upload: UploadFile, documents: list):
+    try:
+        archive = zipfile.ZipFile(upload.file)
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail=f"Invalid ZIP archive: {upload.filename}")
+    with archive:
+        for member in archive.infolist():
+            base = os.path.basename(member.filename)
+            # Folders, macOS resource forks and anything that isn't a PDF are skipped
+            if member.is_dir() or base.startswith(".") or "__MACOSX" in member.filename:
+                continue
+            if not base.lower().endswith(".pdf"):
+                continue
+            if len(documents) >= BATCH_MAX_DOCUMENTS:
+                raise HTTPException(status_code=400, detail=f"A bundle holds at most {BATCH_MAX_DOCUMENTS} documents")
+            # Inflated through the blob store, so the per-file size limit also stops ZIP bombs
+            with archive.open(member) as stream:
+                documents.append((store_upload(stream, member.filename), member.filename))
+
+def store_upload(stream, name: str) -> StoredBlob:
+    try:
+        return blob_store.save_stream(stream, lease=True)
+    except InvalidUploadError as e:
+        logger.warning("🚫 Rejected upload %s: %s", name, e)
+        raise HTTPException(status_code=400, detail=f"Invalid or corrupted PDF: {name}")
+
+# 🔍 ?fields= projection of the per-clause records
+def parse_projection(fields: Optional[str]):
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# 🖨️ PDF reports render on their own worker pool and are cached by content
+report_renderer = report_renderer_from_env()
+
+async def pdf_response(data, mode, filename):
+    pdf_path = await report_renderer.render_pdf(data, mode=mode)
+    logger.info(f"✅ PDF ready: {pdf_path}")
+    return FileResponse(pdf_path, filename=filename, media_type="application/pdf")
 
 # ⚙️ Agents
 parser_agent = ParserAgent()
@@ -49,156 +193,793 @@ missing_clause_detector = MissingClauseDetectorAgent()
 obligation_extractor = ObligationExtractorAgent()
 consolidator_agent = ConsolidatorAgent()
 
-# 🧠 Helper to process PDF
-def process_document(file_path):
-    text = parser_agent.process(file_path)
-    clauses = segmenter_agent.process(text)
-
-    results = []
-    all_obligations = []
-
-    for clause in clauses:
-        clause_type = classifier_agent.classify(clause)
-        summary = summarizer_agent.summarize(clause)
-        risk_flag = risk_analyzer_agent.analyze(clause)
-        obligations = obligation_extractor.extract(clause)
-        all_obligations.extend(obligations)
-        results.append({
-            "clause": clause,
-            "type": clause_type,
+clause_aligner = ClauseAligner()
+
+# 🧭 Clause embedding index (needs LegalBERT for embeddings)
+VECTOR_STORE_DIR = os.getenv("VECTOR_STORE_DIR")
+vector_store = None
+vector_store_lock = threading.Lock()
+
+def get_vector_store():
+    # Opened on first use: its dimension comes from LegalBERT, which loads lazily
+    global vector_store
+    if not VECTOR_STORE_DIR or vector_store is not None:
+        return vector_store
+    if not classifier_agent.use_transformer:
+        return None
+    with vector_store_lock:
+        if vector_store is None:
+            vector_store = VectorStore(
+                VECTOR_STORE_DIR,
+                dim=classifier_agent.embedding_dim,
+                quantize=os.getenv("VECTOR_STORE_QUANTIZE", "false").lower() == "true",
+            )
+    return vector_store
+
+# 🔎 One keyword pass per clause serves every keyword-driven agent
+keyword_matcher = KeywordMatcher(
+    classifier_agent.keywords() | risk_analyzer_agent.keywords() | missing_clause_detector.keywords()
+)
+
+# 🗃️ Result cache keyed by upload bytes + pipeline configuration
+analysis_cache = AnalysisCache(
+    max_entries=int(os.getenv("ANALYSIS_CACHE_SIZE", "128")),
+    cache_dir=os.getenv("ANALYSIS_CACHE_DIR") or None,
+    max_disk_bytes=int(os.getenv("ANALYSIS_CACHE_MAX_MB", "512")) * 1024 * 1024,
+)
+# Longer documents are not cached, so streaming them never holds every record
+ANALYSIS_CACHE_MAX_CLAUSES = int(os.getenv("ANALYSIS_CACHE_MAX_CLAUSES", "2000"))
+
+# ♻️ Per-clause results shared across documents and contract versions
+clause_memo = clause_memo_from_env()
+
+# 🗄️ Persistent store of every analysis for portfolio queries
+analysis_db = database_from_env()
+
+def persist_analysis(doc_id, data, filename=None):
+    # Storage problems must never fail the analysis itself
+    if analysis_db is None:
+        return
+    try:
+        analysis_db.save_analysis(doc_id, data, filename=filename)
+    except Exception as e:
+        logger.warning("⚠️ Could not store analysis %s: %s", doc_id[:16], e)
+
+def persist_spooled(doc_id, summary, spool, filename=None):
+    # Same as persist_analysis, with the records read back from a JSON-lines spool file
+    def records():
+        spool.seek(0)
+        for line in spool:
+            yield json.loads(line)
+
+    try:
+        analysis_db.save_records(doc_id, summary, records, filename=filename)
+    except Exception as e:
+        logger.warning("⚠️ Could not store analysis %s: %s", doc_id[:16], e)
+
+def analysis_version() -> str:
+    classifier_agent.load()
+    classifier = classifier_agent.backend  # int8 ONNX labels may differ slightly from torch
+    summarizer = "llm" if summarizer_agent.use_llm else "heuristics"
+    return f"{classifier}:{summarizer}"
+
+# 🧠 Pipeline as a stream of events: "start", one "clause" per clause, then "summary"
+DOCUMENT_CHUNK_CLAUSES = int(os.getenv("DOCUMENT_CHUNK_CLAUSES", "256"))
+
+def analyze_chunk(chunk, chunk_hits, timer, version=None, with_embeddings=False):
+    """Records for a batch of clauses, which may come from several documents.
+
+    Returns the records, their embeddings when ``with_embeddings`` (else None)
+    and the positions of the records that came from the clause memo.
+    """
+    # ♻️ Clauses unchanged since an earlier version of the contract skip the expensive agents
+    memo_keys, memoized = [], {}
+    if clause_memo is not None:
+        with timer.stage("memo"):
+            memo_keys = [clause_memo.make_key(clause, version) for clause in chunk]
+            memoized = clause_memo.get_many(memo_keys, with_embeddings=with_embeddings)
+    fresh = [i for i in range(len(chunk)) if not memo_keys or memo_keys[i] not in memoized]
+    fresh_clauses = [chunk[i] for i in fresh]
+    fresh_hits = [chunk_hits[i] for i in fresh]
+
+    with timer.stage("classify"):
+        clause_types, confidences, fresh_embeddings = classifier_agent.score_batch(
+            fresh_clauses, hits=fresh_hits, with_embeddings=with_embeddings
+        )
+    with timer.stage("summarize"):
+        summaries = summarizer_agent.summarize_batch(fresh_clauses)
+    # Same words, different line breaks: obligation offsets point into the text, so re-scan those
+    reflowed = [i for i, key in enumerate(memo_keys) if key in memoized and memoized[key][0]["clause"] != chunk[i]]
+    with timer.stage("obligations"):
+        chunk_obligations = obligation_extractor.extract_batch(fresh_clauses)
+        rescanned = dict(zip(reflowed, obligation_extractor.extract_batch([chunk[i] for i in reflowed])))
+    with timer.stage("risk"):
+        risk_flags = [risk_analyzer_agent.analyze(c, hits=h) for c, h in zip(fresh_clauses, fresh_hits)]
+
+    computed = {
+        i: {
+            "clause": chunk[i],
+            "type": t,
+            "confidence": confidence,
             "summary": summary,
             "risk": risk_flag,
             "obligations": obligations,
-        })
+        }
+        for i, t, confidence, summary, risk_flag, obligations in zip(
+            fresh, clause_types, confidences, summaries, risk_flags, chunk_obligations
+        )
+    }
+    if clause_memo is not None and computed:
+        with timer.stage("memo"):
+            clause_memo.set_many([
+                (memo_keys[i], result, fresh_embeddings[n] if fresh_embeddings is not None else None)
+                for n, (i, result) in enumerate(computed.items())
+            ])
+    embeddings = None
+    if with_embeddings:
+        rows = iter(fresh_embeddings)
+        embeddings = np.vstack([
+            next(rows) if i in computed else memoized[memo_keys[i]][1] for i in range(len(chunk))
+        ])
+
+    records = []
+    for i, clause in enumerate(chunk):
+        record = dict(computed[i] if i in computed else memoized[memo_keys[i]][0], clause=clause)
+        if i in rescanned:
+            record["obligations"] = rescanned[i]
+        records.append(record)
+    return records, embeddings, sorted(set(range(len(chunk))) - set(fresh))
+
+def index_row(doc_id, clause_index, record):
+    return {"doc_id": doc_id, "clause_index": clause_index, "type": record["type"], "clause": record["clause"][:1000]}
+
+def iter_document(file_path, chunk_size=None, doc_id=None, timer=None):
+    timer = timer or StageTimer()
+    with timer.stage("parse"):
+        pages = parser_agent.page_count(file_path)
+    yield {"event": "start", "total_pages": pages}
+
+    # 📄 Pages are read and segmented lazily; only the clauses of one chunk are held at a time
+    pages_read = 0
+
+    def read_pages():
+        nonlocal pages_read
+        for page in timer.iterate("parse", parser_agent.iter_pages(file_path)):
+            pages_read += 1
+            yield page
+
+    clauses = timer.iterate("segment", segmenter_agent.iter_clauses(read_pages()))
+
+    total_clauses = 0
+    total_obligations = 0
+    found_clauses = set()
+    store = get_vector_store() if doc_id else None
+    # 🧭 Rows are appended to the index chunk by chunk, so nothing grows with the document
+    index_embeddings = store is not None and store.claim(doc_id)
+    version = analysis_version() if clause_memo is not None else None
+    reused = 0
+
+    # Larger chunks batch the classifier and LLM calls better; streaming
+    # callers pass a smaller one so the first clauses are ready sooner.
+    chunk_size = chunk_size or DOCUMENT_CHUNK_CLAUSES
+    for chunk in iter(lambda: list(islice(clauses, chunk_size)), []):
+        with timer.stage("keywords"):
+            chunk_hits = keyword_matcher.scan_many(chunk)
+            found_clauses |= missing_clause_detector.found(chunk_hits)
+
+        records, chunk_embeddings, chunk_reused = analyze_chunk(
+            chunk, chunk_hits, timer, version, with_embeddings=index_embeddings
+        )
+        reused += len(chunk_reused)
+        if index_embeddings and records:
+            with timer.stage("index"):
+                rows = [index_row(doc_id, total_clauses + i, record) for i, record in enumerate(records)]
+                store.add(chunk_embeddings, rows)
+
+        for record in records:
+            total_obligations += len(record["obligations"])
+            total_clauses += 1
+            yield {
+                "event": "clause",
+                "index": total_clauses - 1,
+                "page": pages_read if pages else None,
+                "total_pages": pages,
+                "record": record,
+            }
+
+    with timer.stage("missing_clauses"):
+        missing = missing_clause_detector.missing(found_clauses)
+    with timer.stage("consolidate"):
+        summary = consolidator_agent.summarize(total_clauses, missing, total_obligations, reused_clauses=reused)
+
+    # ⏱️ One structured line per document: where the time went
+    if pages is not None:
+        DOCUMENT_PAGES.observe(pages)
+    DOCUMENT_CLAUSES.observe(total_clauses)
+    logger.info("⏱️ Document analyzed", extra={"fields": {
+        "doc_id": doc_id[:16] if doc_id else None,
+        "pages": pages,
+        "clauses": total_clauses,
+        "reused_clauses": reused,
+        "classifier": classifier_agent.backend,
+        "timings": timer.finish(),
+    }})
+    yield {"event": "summary", "summary": summary}
+
+# 🧠 Helper to process PDF
+def process_document(file_path, progress=None, timer=None):
+    data = collect_events(iter_document(file_path, timer=timer), progress=progress)
+    return data, [record["clause"] for record in data["details"]]
+
+def collect_events(events, progress=None):
+    details = []
+    summary = {}
+    for event in events:
+        if event["event"] == "clause":
+            details.append(event["record"])
+            if progress and event["total_pages"]:
+                progress(event["page"], event["total_pages"])
+        elif event["event"] == "summary":
+            summary = event["summary"]
+    return {"summary": summary, "details": details}
+
+# 🗃️ Analyze a stored upload, reusing cached results for identical files
+def analyze_upload(blob: StoredBlob, progress=None, filename=None):
+    data = collect_events(iter_upload(blob, filename=filename), progress=progress)
+    return data, [record["clause"] for record in data["details"]]
+
+def iter_upload(blob: StoredBlob, chunk_size=None, filename=None):
+    doc_id = blob.digest
+    key = analysis_cache.key_for_digest(doc_id, analysis_version())
+    cached = analysis_cache.get(key)
+    if cached is not None:
+        logger.info("⚡ Cache hit: %s", key[:16])
+        if analysis_db is not None and not analysis_db.has_document(doc_id):
+            persist_analysis(doc_id, cached["data"], filename)
+        details = cached["data"]["details"]
+        yield {"event": "start", "total_pages": None}
+        for index, record in enumerate(details):
+            yield {"event": "clause", "index": index, "page": None, "total_pages": None, "record": record}
+        yield {"event": "summary", "summary": {**cached["data"]["summary"], "reused_clauses": len(details)}}
+        return
+
+    # 🌊 Records are kept for the cache only up to ANALYSIS_CACHE_MAX_CLAUSES;
+    # the database copy is spooled to disk, so memory stays flat on long filings
+    details = []
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024) if analysis_db is not None else None
+    try:
+        for event in iter_document(blob.path, chunk_size=chunk_size, doc_id=doc_id):
+            if event["event"] == "clause":
+                record = event["record"]
+                if details is not None:
+                    details.append(record)
+                    if len(details) > ANALYSIS_CACHE_MAX_CLAUSES:
+                        details = None
+                if spool is not None:
+                    spool.write(dumps(record) + b"\n")
+            elif event["event"] == "summary":
+                if details is not None:
+                    data = {"summary": event["summary"], "details": details}
+                    analysis_cache.set(key, {"data": data, "clauses": [r["clause"] for r in details]})
+                if spool is not None:
+                    persist_spooled(doc_id, event["summary"], spool, filename)
+            yield event
+    finally:
+        if spool is not None:
+            spool.close()
+
+# 📦 Bundles: a master agreement and its schedules analyzed together
+def analyze_bundle(documents):
+    """Per-document results for ``(blob, filename)`` pairs, plus the bundle's missing-clause view.
+
+    Documents are parsed in parallel and their clauses pooled, so the classifier
+    and LLM see a few large batches instead of a handful per document.
+    """
+    timer = StageTimer()
+    version = analysis_version()
+    # Identical files in one bundle are analyzed once
+    unique = {}
+    for blob, filename in documents:
+        unique.setdefault(blob.digest, (blob, filename))
+
+    results, errors, pending = {}, {}, []
+    for blob, filename in unique.values():
+        cached = analysis_cache.get(analysis_cache.key_for_digest(blob.digest, version))
+        if cached is None:
+            pending.append((blob, filename))
+            continue
+        if analysis_db is not None and not analysis_db.has_document(blob.digest):
+            persist_analysis(blob.digest, cached["data"], filename)
+        details = cached["data"]["details"]
+        summary = {**cached["data"]["summary"], "reused_clauses": len(details)}
+        results[blob.digest] = {"summary": summary, "details": details}
+
+    with timer.stage("parse"):
+        parsed = parser_agent.extract_many([blob.path for blob, _ in pending])
+    analyzed = []
+    for (blob, filename), outcome in zip(pending, parsed):
+        if isinstance(outcome, Exception):
+            logger.warning("⚠️ Could not parse %s: %s", filename, outcome)
+            errors[blob.digest] = "Invalid or corrupted PDF"
+            continue
+        text, pages = outcome
+        with timer.stage("segment"):
+            analyzed.append((blob, filename, pages, segmenter_agent.process(text)))
+
+    # 🧺 Clauses of every document go through the agents in shared batches
+    owners = [n for n, (_, _, _, clauses) in enumerate(analyzed) for _ in clauses]
+    pooled = [clause for _, _, _, clauses in analyzed for clause in clauses]
+    with timer.stage("keywords"):
+        hits = keyword_matcher.scan_many(pooled)
+    store = get_vector_store()
+    to_index = {
+        n for n, (blob, _, _, _) in enumerate(analyzed) if store is not None and not store.has_document(blob.digest)
+    }
+    records, embeddings, reused = [], [], [0] * len(analyzed)
+    for start in range(0, len(pooled), DOCUMENT_CHUNK_CLAUSES):
+        stop = start + DOCUMENT_CHUNK_CLAUSES
+        chunk_records, chunk_embeddings, chunk_reused = analyze_chunk(
+            pooled[start:stop], hits[start:stop], timer, version, with_embeddings=bool(to_index)
+        )
+        records.extend(chunk_records)
+        if to_index:
+            embeddings.append(chunk_embeddings)
+        for i in chunk_reused:
+            reused[owners[start + i]] += 1
+    embeddings = np.vstack(embeddings) if embeddings else None
+
+    offset = 0
+    for n, (blob, filename, pages, clauses) in enumerate(analyzed):
+        span = slice(offset, offset + len(clauses))
+        offset += len(clauses)
+        details = records[span]
+        with timer.stage("missing_clauses"):
+            missing = missing_clause_detector.missing(missing_clause_detector.found(hits[span]))
+        with timer.stage("consolidate"):
+            total_obligations = sum(len(record["obligations"]) for record in details)
+            summary = consolidator_agent.summarize(len(details), missing, total_obligations, reused_clauses=reused[n])
+        data = {"summary": summary, "details": details}
+        if n in to_index and details:
+            with timer.stage("index"):
+                rows = [index_row(blob.digest, i, record) for i, record in enumerate(details)]
+                store.add(embeddings[span], rows, doc_id=blob.digest)
+        analysis_cache.set(
+            analysis_cache.key_for_digest(blob.digest, version),
+            {"data": data, "clauses": [record["clause"] for record in details]},
+        )
+        persist_analysis(blob.digest, data, filename)
+        results[blob.digest] = data
+        if pages is not None:
+            DOCUMENT_PAGES.observe(pages)
+        DOCUMENT_CLAUSES.observe(len(details))
+
+    out = []
+    for blob, filename in documents:
+        if blob.digest in errors:
+            out.append({"filename": filename, "doc_hash": blob.digest, "error": errors[blob.digest]})
+        else:
+            out.append({"filename": filename, "doc_hash": blob.digest, **results[blob.digest]})
+    complete = [doc for doc in out if "error" not in doc]
+    bundle = {
+        "documents": len(out),
+        "failed": len(out) - len(complete),
+        "total_clauses": sum(doc["summary"]["total_clauses"] for doc in complete),
+        "total_obligations": sum(doc["summary"]["total_obligations"] for doc in complete),
+        **missing_clause_detector.bundle_view(
+            [(doc["filename"], doc["summary"]["missing_clauses"]) for doc in complete]
+        ),
+    }
+
+    logger.info("⏱️ Bundle analyzed", extra={"fields": {
+        "documents": len(out),
+        "analyzed": len(analyzed),
+        "cached": len(results) - len(analyzed),
+        "clauses": len(pooled),
+        "classifier": classifier_agent.backend,
+        "timings": timer.finish(),
+    }})
+    return {"documents": out, "bundle": bundle}
+
+# 🆚 Comparison payload shared by /compare and /compare/download
+def build_comparison(doc1_name, doc1_data, doc1_clauses, doc2_name, doc2_data, doc2_clauses):
+    alignment = clause_aligner.align(doc1_clauses, doc2_clauses)
+    return {
+        "doc1_name": doc1_name,
+        "doc2_name": doc2_name,
+        "doc1": doc1_data,
+        "doc2": doc2_data,
+        "alignment": alignment,
+        "unique_doc1": [item["clause"] for item in alignment["removed"]],
+        "unique_doc2": [item["clause"] for item in alignment["added"]],
+    }
+
+# 🆚 Both documents are analyzed concurrently; byte-identical uploads only once
+async def analyze_pair(blob1: StoredBlob, name1: str, blob2: StoredBlob, name2: str):
+    if blob1.digest == blob2.digest:
+        logger.info("🟰 Identical uploads, analyzing once: %s", blob1.digest[:16])
+        result = await job_manager.run(analyze_upload, blob1, filename=name1)
+        return result, result
+    return await asyncio.gather(
+        job_manager.run(analyze_upload, blob1, filename=name1),
+        job_manager.run(analyze_upload, blob2, filename=name2),
+    )
+
+def comparison_id(digest1: str, name1: str, digest2: str, name2: str) -> str:
+    payload = json.dumps([digest1, name1, digest2, name2, analysis_version()])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+def compare_and_store(blob1, name1, doc1, blob2, name2, doc2):
+    # Kept in the result cache so the PDF can be rendered later without re-uploading
+    comparison = build_comparison(name1, doc1[0], doc1[1], name2, doc2[0], doc2[1])
+    comparison["comparison_id"] = comparison_id(blob1.digest, name1, blob2.digest, name2)
+    analysis_cache.set(f"comparison-{comparison['comparison_id']}", comparison)
+    return comparison
+
+async def store_pair(file1: UploadFile, file2: UploadFile):
+    blob1 = await store_pdf(file1, "First file is invalid.")
+    try:
+        blob2 = await store_pdf(file2, "Second file is invalid.")
+    except BaseException:
+        blob_store.release(blob1)
+        raise
+    return blob1, blob2
 
-    missing = missing_clause_detector.detect(clauses)
-    consolidated = consolidator_agent.consolidate(results, missing, all_obligations)
-    consolidated["details"] = results
-    return consolidated, clauses
+async def run_comparison(blob1, name1, blob2, name2):
+    doc1, doc2 = await analyze_pair(blob1, name1, blob2, name2)
+    return await run_in_threadpool(compare_and_store, blob1, name1, doc1, blob2, name2, doc2)
 
 # 🧾 Main results
 @app.post("/results")
 @limiter.limit("10/minute")
-async def get_results(request: Request, file: UploadFile = File(...)):
-    if not file or not is_valid_pdf(file):
-        raise HTTPException(status_code=400, detail="Invalid or corrupted PDF")
+async def get_results(request: Request, file: UploadFile = File(...), fields: Optional[str] = None):
+    projection = parse_projection(fields)
+    blob = await store_pdf(file)
 
     try:
         logger.info("🔄 Received file: %s", file.filename)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(await file.read())
-            tmp_path = tmp.name
-
-        data, _ = process_document(tmp_path)
+        data, _ = await job_manager.run(analyze_upload, blob, filename=file.filename)
         logger.info("✅ Document processed successfully.")
-        return JSONResponse(content=data)
+        return FastJSONResponse(content=project_analysis(data, projection))
+    except QueueFullError:
+        raise
     except Exception as e:
         logger.error("❌ Error: %s", str(e))
         raise HTTPException(status_code=500, detail="Internal server error")
     finally:
-        if os.path.exists(tmp_path): os.remove(tmp_path)
+        blob_store.release(blob)
 
 # 🧾 Single PDF report
 @app.post("/download")
 @limiter.limit("5/minute")
 async def download_pdf(request: Request, file: UploadFile = File(...)):
-    if not file or not is_valid_pdf(file):
-        raise HTTPException(status_code=400, detail="Invalid or corrupted PDF")
+    blob = await store_pdf(file)
 
     try:
         logger.info("⬇️ Generating PDF for: %s", file.filename)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(await file.read())
-            path = tmp.name
-
-        data, _ = process_document(path)
-        pdf_path = generate_pdf(data)
-        logger.info(f"✅ PDF written successfully to: {pdf_path}")
+        data, _ = await job_manager.run(analyze_upload, blob, filename=file.filename)
+        return await pdf_response(data, "single", "legal_report.pdf")
+    except QueueFullError:
+        raise
     except Exception as e:
         logger.error("❌ PDF error: %s", str(e))
         raise HTTPException(status_code=500, detail="PDF generation failed")
     finally:
-        if os.path.exists(path): os.remove(path)
+        blob_store.release(blob)
 
-    return FileResponse(pdf_path, filename="legal_report.pdf", media_type="application/pdf")
+# 📡 Streaming results: one record per clause as soon as it is ready
+@app.post("/results/stream")
+@limiter.limit("10/minute")
+async def stream_results(
+    request: Request, file: UploadFile = File(...), format: str = "ndjson", fields: Optional[str] = None
+):
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+    projection = parse_projection(fields)
+    blob = await store_pdf(file)
+
+    logger.info("📡 Streaming results for: %s", file.filename)
+    try:
+        events = job_manager.stream(
+            iter_upload, blob, chunk_size=classifier_agent.batch_size, filename=file.filename,
+            on_done=lambda: blob_store.release(blob),  # once the worker stops reading, even after a disconnect
+        )
+    except BaseException:
+        blob_store.release(blob)
+        raise
+
+    async def body():
+        try:
+            async for event in events:
+                if event["event"] == "clause" and projection is not None:
+                    event = {**event, "record": project_record(event["record"], projection)}
+                payload = dumps(event).decode("utf-8")
+                if format == "sse":
+                    yield f"event: {event['event']}\ndata: {payload}\n\n"
+                else:
+                    yield payload + "\n"
+        except Exception as e:
+            logger.error("❌ Streaming error: %s", str(e))
+            error = json.dumps({"event": "error", "detail": "Internal server error"})
+            yield f"event: error\ndata: {error}\n\n" if format == "sse" else error + "\n"
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(body(), media_type=media_type)
+
+# 📦 Several documents in one request, with shared model batches
+@app.post("/results/batch")
+@limiter.limit("5/minute")
+async def batch_results(request: Request, files: List[UploadFile] = File(...), fields: Optional[str] = None):
+    projection = parse_projection(fields)
+    documents = await run_in_threadpool(store_bundle, files)
+
+    try:
+        logger.info("📦 Received bundle of %d documents", len(documents))
+        result = await job_manager.run(analyze_bundle, documents)
+        result["documents"] = [
+            project_analysis(doc, projection) if "details" in doc else doc for doc in result["documents"]
+        ]
+        return FastJSONResponse(content=result)
+    except QueueFullError:
+        raise
+    except Exception as e:
+        logger.error("❌ Bundle error: %s", str(e))
+        raise HTTPException(status_code=500, detail="Internal server error")
+    finally:
+        blob_store.release(*(blob for blob, _ in documents))
 
 # 🆚 Compare two documents
 @app.post("/compare")
 @limiter.limit("10/minute")
 async def compare_documents(request: Request, file1: UploadFile = File(...), file2: UploadFile = File(...)):
-    if not file1 or not is_valid_pdf(file1):
-        raise HTTPException(status_code=400, detail="First file is invalid.")
-    if not file2 or not is_valid_pdf(file2):
-        raise HTTPException(status_code=400, detail="Second file is invalid.")
+    blob1, blob2 = await store_pair(file1, file2)
 
     try:
         logger.info("🔍 Comparing: %s vs %s", file1.filename, file2.filename)
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp1:
-            tmp1.write(file1.file.read())
-            path1 = tmp1.name
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp2:
-            tmp2.write(file2.file.read())
-            path2 = tmp2.name
-
-        doc1_data, doc1_clauses = process_document(path1)
-        doc2_data, doc2_clauses = process_document(path2)
-
-        return {
-            "doc1_name": file1.filename,
-            "doc2_name": file2.filename,
-            "doc1": doc1_data,
-            "doc2": doc2_data,
-            "unique_doc1": list(set(doc1_clauses) - set(doc2_clauses)),
-            "unique_doc2": list(set(doc2_clauses) - set(doc1_clauses)),
-        }
+        return await run_comparison(blob1, file1.filename, blob2, file2.filename)
+    except QueueFullError:
+        raise
     except Exception as e:
         logger.error("❌ Comparison error: %s", str(e))
         raise HTTPException(status_code=500, detail="Comparison failed")
     finally:
-        for path in [path1, path2]:
-            if os.path.exists(path): os.remove(path)
+        blob_store.release(blob1, blob2)
 
 # 🧾 Download comparison report
 @app.post("/compare/download")
 @limiter.limit("5/minute")
 async def download_comparison_pdf(request: Request, file1: UploadFile = File(...), file2: UploadFile = File(...)):
-    if not file1 or not is_valid_pdf(file1):
-        raise HTTPException(status_code=400, detail="First file is invalid.")
-    if not file2 or not is_valid_pdf(file2):
-        raise HTTPException(status_code=400, detail="Second file is invalid.")
+    blob1, blob2 = await store_pair(file1, file2)
 
     try:
         logger.info("⬇️ Generating comparison PDF...")
+        comparison_data = await run_comparison(blob1, file1.filename, blob2, file2.filename)
+        return await pdf_response(comparison_data, "comparison", "comparison_report.pdf")
+    except QueueFullError:
+        raise
+    except Exception as e:
+        logger.error("❌ Comparison PDF failed: %s", str(e))
+        raise HTTPException(status_code=500, detail="PDF generation failed")
+    finally:
+        blob_store.release(blob1, blob2)
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp1:
-            tmp1.write(file1.file.read())
-            path1 = tmp1.name
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp2:
-            tmp2.write(file2.file.read())
-            path2 = tmp2.name
-
-        doc1_data, doc1_clauses = process_document(path1)
-        doc2_data, doc2_clauses = process_document(path2)
-
-        comparison_data = {
-            "doc1_name": file1.filename,
-            "doc2_name": file2.filename,
-            "doc1": doc1_data,
-            "doc2": doc2_data,
-            "unique_doc1": list(set(doc1_clauses) - set(doc2_clauses)),
-            "unique_doc2": list(set(doc2_clauses) - set(doc1_clauses)),
-        }
+# 🧾 Download the report of a finished comparison, no re-upload or re-analysis
+@app.get("/compare/{comparison_id}/download")
+@limiter.limit("5/minute")
+async def download_stored_comparison_pdf(request: Request, comparison_id: str):
+    if not re.fullmatch(r"[0-9a-f]{32}", comparison_id):
+        raise HTTPException(status_code=404, detail="Comparison not found")
+    comparison_data = await run_in_threadpool(analysis_cache.get, f"comparison-{comparison_id}")
+    if comparison_data is None:
+        raise HTTPException(status_code=404, detail="Comparison not found, run /compare again")
 
-        pdf_path = generate_pdf(comparison_data, mode="comparison")
-        logger.info(f"✅ PDF written successfully to: {pdf_path}")
+    try:
+        logger.info("⬇️ Generating PDF for comparison %s", comparison_id)
+        return await pdf_response(comparison_data, "comparison", "comparison_report.pdf")
+    except QueueFullError:
+        raise
     except Exception as e:
         logger.error("❌ Comparison PDF failed: %s", str(e))
         raise HTTPException(status_code=500, detail="PDF generation failed")
-    finally:
-        for path in [path1, path2]:
-            if os.path.exists(path): os.remove(path)
 
-    return FileResponse(pdf_path, filename="comparison_report.pdf", media_type="application/pdf")
+# 🧭 Most similar clauses across every indexed document
+class SimilarClauseQuery(BaseModel):
+    text: str
+    k: int = 10
+
+def find_similar_clauses(text: str, k: int):
+    store = get_vector_store()
+    if store is None:
+        return None
+    query = classifier_agent.embed_batch([text])[0]
+    return {"indexed_clauses": len(store), "matches": store.search(query, k=k)}
+
+@app.post("/clauses/similar")
+@limiter.limit("30/minute")
+async def similar_clauses(request: Request, query: SimilarClauseQuery):
+    if not VECTOR_STORE_DIR:
+        raise HTTPException(status_code=503, detail="Clause index is not enabled")
+    if not query.text.strip() or not 1 <= query.k <= 100:
+        raise HTTPException(status_code=400, detail="Provide clause text and 1 <= k <= 100")
+
+    result = await job_manager.run(find_similar_clauses, query.text, min(query.k, 100))
+    if result is None:
+        raise HTTPException(status_code=503, detail="Clause index needs the LegalBERT model")
+    return result
+
+# 🧵 Background analysis jobs
+@app.post("/jobs", status_code=202)
+@limiter.limit("10/minute")
+async def create_job(request: Request, file: UploadFile = File(...)):
+    blob = await store_pdf(file)
+
+    try:
+        job_id = job_manager.submit_job(
+            analyze_upload, blob, track_progress=True, filename=file.filename,
+            on_done=lambda: blob_store.release(blob),  # the lease lasts while the job waits in the queue
+        )
+    except BaseException:
+        blob_store.release(blob)
+        raise
+    logger.info("🧵 Queued job %s for: %s", job_id, file.filename)
+    return {"job_id": job_id, "status": "queued"}
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, fields: Optional[str] = None):
+    projection = parse_projection(fields)
+    job = job_manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if "result" in job:
+        job["result"] = project_analysis(job["result"][0], projection)
+    return FastJSONResponse(content=job)
+
+# 🗄️ Stored analyses: documents and cross-document clause queries
+def require_db():
+    if analysis_db is None:
+        raise HTTPException(status_code=503, detail="Analysis database is not enabled")
+    return analysis_db
+
+@app.get("/documents")
+def list_documents(limit: int = 50, cursor: Optional[int] = None):
+    return require_db().list_documents(limit=limit, cursor=cursor)
+
+@app.get("/documents/{doc_hash}")
+def get_document(doc_hash: str):
+    document = require_db().get_document(doc_hash)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+    return document
+
+@app.get("/clauses")
+def query_clauses(
+    type: Optional[str] = None,
+    risk: Optional[str] = None,
+    document: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[int] = None,
+):
+    return require_db().query_clauses(clause_type=type, risk=risk, doc_hash=document, limit=limit, cursor=cursor)
+
+# 🔥 Model loading: nothing heavy happens at import; MODEL_LOADING picks when it does
+MODEL_LOADING = os.getenv("MODEL_LOADING", "background")  # background | eager | lazy
+REQUIRE_LEGALBERT = os.getenv("REQUIRE_LEGALBERT", "false").lower() == "true"
+WARMUP_CLAUSE = "Termination. Either party may terminate this Agreement on thirty days written notice."
+preload_thread = None
+
+def preload_backends():
+    started = time.perf_counter()
+    classifier_agent.load()
+    get_vector_store()
+    if os.getenv("MODEL_WARMUP", "false").lower() == "true":
+        # One real pass so the first request doesn't pay for lazy kernel/graph setup
+        classifier_agent.classify_batch([WARMUP_CLAUSE])
+        report_renderer.jobs.executor.submit(load_renderer).result()
+    logger.info("🔥 Backends ready in %.2fs (classifier: %s)", time.perf_counter() - started, classifier_agent.backend)
+
+@app.on_event("startup")
+def start_preload():
+    global preload_thread
+    if MODEL_LOADING == "eager":
+        preload_backends()
+    elif MODEL_LOADING == "background":
+        preload_thread = threading.Thread(target=preload_backends, name="preload-backends", daemon=True)
+        preload_thread.start()
+
+# 💓 Liveness: answers as soon as the process is up
+@app.get("/health")
+async def health():
+    return {"status": "ok"}
+
+# 🚦 Readiness: which backends are loaded, 503 until the pod should take traffic
+@app.get("/ready")
+async def ready():
+    loading = preload_thread is not None and preload_thread.is_alive()
+    if not VECTOR_STORE_DIR:
+        vector_backend = "disabled"
+    elif vector_store is not None:
+        vector_backend = "enabled"
+    else:
+        vector_backend = "unavailable" if classifier_agent.loaded else "not loaded"
+
+    backends = {
+        "classifier": "loading" if loading else classifier_agent.backend,
+        "summarizer": "llm" if summarizer_agent.use_llm else "heuristics",
+        "pdf_renderer": f"weasyprint ({report_renderer.jobs.mode} pool)",
+        "vector_store": vector_backend,
+        "database": "sqlite" if analysis_db is not None else "disabled",
+    }
+    errors = {}
+    if classifier_agent.load_error:
+        errors["classifier"] = classifier_agent.load_error
+
+    is_ready = not loading and not (REQUIRE_LEGALBERT and backends["classifier"] == "heuristics")
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={"ready": is_ready, "backends": backends, "errors": errors},
+    )
+
+@app.on_event("shutdown")
+def shutdown_workers():
+    job_manager.shutdown(wait=False)
+    report_renderer.shutdown(wait=False)
+    parser_agent.close()
+    if analysis_db is not None:
+        analysis_db.close()
+    if clause_memo is not None:
+        clause_memo.close()
+
+# 📈 Cache statistics
+def llm_cache_in_use():
+    client = existing_llm_client()
+    return client.cache if client is not None else None
+
+@app.get("/cache/stats")
+async def cache_stats():
+    llm_cache = llm_cache_in_use()
+    return {
+        "analysis": analysis_cache.stats(),
+        "llm": llm_cache.stats() if llm_cache is not None else None,
+        "reports": report_renderer.stats(),
+        "clauses": clause_memo.stats() if clause_memo is not None else None,
+    }
+
+# 📊 Prometheus metrics: histograms recorded as work happens, pool and cache figures read at scrape time
+def cache_figures(field):
+    # Read from the in-memory counters, not stats(): a scrape never walks the cache
+    # directories or counts SQLite rows, so its cost doesn't grow with the caches
+    caches = {
+        "analysis": analysis_cache,
+        "reports": report_renderer,
+        "llm": llm_cache_in_use(),
+        "clauses": clause_memo,
+    }
+    figures = {}
+    for name, cache in caches.items():
+        if cache is None:
+            continue
+        hits, misses = cache.hits, cache.misses
+        figures[(name,)] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        }[field]
+    return figures
+
+REGISTRY.register(Gauge(
+    "legal_doc_queue_depth", "Jobs running or waiting, per worker pool.",
+    lambda: {("analysis",): job_manager.queue_depth, ("reports",): report_renderer.jobs.queue_depth},
+    ["pool"],
+))
+REGISTRY.register(Gauge(
+    "legal_doc_cache_hits_total", "Cache hits.", lambda: cache_figures("hits"), ["cache"], kind="counter"
+))
+REGISTRY.register(Gauge(
+    "legal_doc_cache_misses_total", "Cache misses.", lambda: cache_figures("misses"), ["cache"], kind="counter"
+))
+REGISTRY.register(Gauge(
+    "legal_doc_cache_hit_ratio", "Cache hit rate since start.", lambda: cache_figures("hit_rate"), ["cache"]
+))
+
+@app.get("/metrics")
+def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,246 @@
+# legal_doc_analyzer/bulk.py
+#
+# Offline bulk analysis of a directory of contracts, without the API or its rate limits.
+# Every worker process imports the app's pipeline once and analyzes documents with
+# the same agents as POST /results, writing one JSONL record per document.
+#
+#   python -m legal_doc_analyzer.bulk /archive/contracts -o results.jsonl --workers 4
+#   python -m legal_doc_analyzer.bulk /archive/contracts -o results.jsonl   # rerun: resumes
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterator, Set
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+
+def iter_documents(root: str) -> Iterator[str]:
+    # Sorted walk, so shards and output order are stable between runs
+    for directory, subdirs, files in os.walk(root):
+        subdirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield os.path.join(directory, name)
+
+
+def load_checkpoint(output: str, retry_failed: bool = False) -> Set[str]:
+    """Paths already recorded in ``output``; a torn last line from a killed run is dropped.
+
+    With ``retry_failed`` the error records are removed from the file, so the
+    retry's record is the only one for its path.
+    """
+    done = set()
+    if not os.path.exists(output):
+        return done
+    retried = False
+    with open(output, "rb+") as f:
+        valid_bytes = 0
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if not line.endswith(b"\n"):
+                break
+            valid_bytes += len(line)
+            if record.get("status") == "ok" or not retry_failed:
+                done.add(record["path"])
+            else:
+                retried = True
+        f.truncate(valid_bytes)
+
+    if retried:
+        tmp_path = f"{output}.{os.getpid()}.tmp"
+        with open(output, "rb") as src, open(tmp_path, "wb") as dst:
+            for line in src:
+                if json.loads(line).get("status") == "ok":
+                    dst.write(line)
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, output)
+    return done
+
+
+# 🏗️ Worker side: one pipeline per process, loaded in the initializer
+def init_worker(threads_per_worker: int) -> None:
+    # Set before torch is imported: workers x threads should not oversubscribe the CPUs
+    os.environ.setdefault("OMP_NUM_THREADS", str(threads_per_worker))
+    os.environ.setdefault("PARSER_WORKERS", "1")  # the pool already parallelizes across documents
+    os.environ.setdefault("ANALYSIS_DB_PATH", "")
+    from legal_doc_analyzer import app
+
+    app.classifier_agent.load()
+
+
+def analyze_file(path: str, root: str) -> dict:
+    from legal_doc_analyzer import app
+    from legal_doc_analyzer.utils.metrics import StageTimer
+
+    record = {"path": os.path.relpath(path, root)}
+    started = time.perf_counter()
+    timer = StageTimer()
+    try:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        record["sha256"] = digest.hexdigest()
+        data, _ = app.process_document(path, timer=timer)
+        record.update(status="ok", result=data)
+    except Exception as e:
+        record.update(status="error", error=f"{type(e).__name__}: {e}")
+    record["seconds"] = round(time.perf_counter() - started, 4)
+    record["timings"] = {name: round(seconds, 4) for name, seconds in timer.timings.items()}
+    return record
+
+
+# 📊 Run summary
+class RunStats:
+    def __init__(self, skipped: int = 0):
+        self.started = time.perf_counter()
+        self.ok = 0
+        self.failed = 0
+        self.skipped = skipped
+        self.clauses = 0
+        self.stage_seconds: Dict[str, float] = {}
+
+    def add(self, record: dict) -> None:
+        if record["status"] == "ok":
+            self.ok += 1
+            self.clauses += record["result"]["summary"]["total_clauses"]
+        else:
+            self.failed += 1
+        for name, seconds in record.get("timings", {}).items():
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+
+    def report(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        processed = self.ok + self.failed
+        return {
+            "documents": processed,
+            "ok": self.ok,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "clauses": self.clauses,
+            "seconds": round(elapsed, 3),
+            "documents_per_s": round(processed / elapsed, 3) if elapsed else 0.0,
+            # Summed over documents (and so over workers); mean is per document
+            "stages": {
+                name: {"total_s": round(total, 3), "mean_s": round(total / processed, 4)}
+                for name, total in sorted(self.stage_seconds.items(), key=lambda item: -item[1])
+            } if processed else {},
+        }
+
+
+def run(root: str, output: str, workers: int, retry_failed: bool = False, limit: int = 0) -> dict:
+    done = load_checkpoint(output, retry_failed=retry_failed)
+    pending = (path for path in iter_documents(root) if os.path.relpath(path, root) not in done)
+    if limit:
+        pending = (path for _, path in zip(range(limit), pending))
+    stats = RunStats(skipped=len(done))
+    if done:
+        print(f"🔁 Resuming: {len(done)} documents already in {output}", file=sys.stderr)
+
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    # spawn: torch and the LLM client's threads don't survive fork
+    context = multiprocessing.get_context("spawn")
+
+    def new_pool() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=init_worker, initargs=(threads,)
+        )
+
+    pool = new_pool()
+    # A bounded window of submissions, so a huge archive isn't queued in memory up front
+    in_flight: Dict[Future, str] = {}
+    try:
+        with open(output, "a", encoding="utf-8") as out:
+            for path in pending:
+                try:
+                    future = pool.submit(analyze_file, path, root)
+                except BrokenProcessPool:
+                    if in_flight:
+                        pool = collect(pool, new_pool, in_flight, root, out, stats)
+                    else:
+                        pool.shutdown()
+                        pool = new_pool()
+                    future = pool.submit(analyze_file, path, root)
+                in_flight[future] = path
+                if len(in_flight) >= workers * 4:
+                    pool = collect(pool, new_pool, in_flight, root, out, stats)
+            while in_flight:
+                pool = collect(pool, new_pool, in_flight, root, out, stats)
+    finally:
+        pool.shutdown()
+    return stats.report()
+
+
+def collect(
+    pool: ProcessPoolExecutor,
+    new_pool: Callable[[], ProcessPoolExecutor],
+    in_flight: Dict[Future, str],
+    root: str,
+    out,
+    stats: RunStats,
+) -> ProcessPoolExecutor:
+    """Write the records of finished documents; returns the pool to keep submitting to.
+
+    A worker killed by a crash or the OOM killer breaks the whole pool: every
+    document in flight gets an error record (so a resumed run skips it instead
+    of crashing on it again) and a fresh pool takes over.
+    """
+    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+    broken = any(isinstance(future.exception(), BrokenProcessPool) for future in finished)
+    if broken:
+        wait(in_flight)  # a broken pool fails every pending future at once
+        finished = list(in_flight)
+    write_records({future: in_flight.pop(future) for future in finished}, root, out, stats)
+    if not broken:
+        return pool
+    print(f"💥 A worker process died; {len(finished)} in-flight documents recorded as errors", file=sys.stderr)
+    pool.shutdown(wait=True)
+    return new_pool()
+
+
+def write_records(finished: Dict[Future, str], root: str, out, stats: RunStats) -> None:
+    for future, path in finished.items():
+        try:
+            record = future.result()
+        except Exception as e:
+            record = {"path": os.path.relpath(path, root), "status": "error", "error": f"{type(e).__name__}: {e}"}
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        stats.add(record)
+        if record["status"] != "ok":
+            print(f"❌ {record['path']}: {record['error']}", file=sys.stderr)
+    # Flushed per batch: a kill loses at most the documents still in flight
+    out.flush()
+    os.fsync(out.fileno())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze every PDF/DOCX under a directory into a JSONL file")
+    parser.add_argument("root", help="directory to walk for .pdf and .docx files")
+    parser.add_argument("-o", "--output", required=True, help="JSONL results file; also the resume checkpoint")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--retry-failed", action="store_true", help="re-run documents that failed last time")
+    parser.add_argument("--limit", type=int, default=0, help="stop after this many new documents")
+    parser.add_argument("--stats", default=None, help="also write the run summary to this JSON file")
+    args = parser.parse_args()
+
+    report = run(args.root, args.output, args.workers, retry_failed=args.retry_failed, limit=args.limit)
+    print(json.dumps(report, indent=2))
+    if args.stats:
+        with open(args.stats, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(1 if report["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,295 @@
-# Placeholder for DB interaction logic
+# legal_doc_analyzer/services/database_service.py
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from legal_doc_analyzer.utils.logger import get_logger
+
+logger = get_logger("AnalysisDatabase")
+
+MAX_PAGE_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    doc_hash TEXT NOT NULL UNIQUE,
+    filename TEXT,
+    total_clauses INTEGER NOT NULL,
+    total_obligations INTEGER NOT NULL,
+    missing_clauses TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS clauses (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    clause_index INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    type TEXT NOT NULL,
+    confidence REAL,
+    summary TEXT,
+    risk TEXT NOT NULL,
+    risk_level TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS obligations (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    clause_index INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    start_offset INTEGER,
+    end_offset INTEGER,
+    triggers TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_clauses_type_risk ON clauses(type, risk_level);
+CREATE INDEX IF NOT EXISTS idx_clauses_risk ON clauses(risk_level);
+CREATE INDEX IF NOT EXISTS idx_clauses_document ON clauses(document_id, clause_index);
+CREATE INDEX IF NOT EXISTS idx_obligations_document ON obligations(document_id, clause_index);
+"""
+
+# Columns added after the first release: (table, column, definition), applied to older files on open
+MIGRATIONS = [
+    ("clauses", "confidence", "REAL"),
+]
+
+
+def risk_level(risk: str) -> str:
+    # "❌ High Risk" -> "high risk", so filters don't depend on the emoji
+    return " ".join(word for word in risk.split() if any(c.isalnum() for c in word)).lower()
+
+
+class AnalysisDatabase:
+    """SQLite store of analyzed documents, their clauses and obligations.
+
+    Each document is written in one transaction with batched inserts, and the
+    clause table is indexed by type and risk level so portfolio queries read
+    stored results instead of re-running the pipeline.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            conn = self._connection()
+            conn.executescript(SCHEMA)
+            self._migrate(conn)
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        for table, column, definition in MIGRATIONS:
+            columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                logger.info("🛠️ Added %s.%s to %s", table, column, self.path)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Worker processes must not share a connection inherited across fork
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._pid = os.getpid()
+        return self._conn
+
+    # 💾 Ingestion
+    def has_document(self, doc_hash: str) -> bool:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT 1 FROM documents WHERE doc_hash = ?", (doc_hash,)
+            ).fetchone()
+        return row is not None
+
+    def save_analysis(self, doc_hash: str, data: Dict, filename: Optional[str] = None) -> int:
+        details = data["details"]
+        return self.save_records(doc_hash, data["summary"], lambda: iter(details), filename=filename)
+
+    def save_records(
+        self,
+        doc_hash: str,
+        summary: Dict,
+        records: Callable[[], Iterable[Dict]],
+        filename: Optional[str] = None,
+    ) -> int:
+        """Like ``save_analysis``, with the clause records read from ``records()``.
+
+        It is called once per table, so the records can be re-read from a spool
+        file instead of all being held in memory.
+        """
+        def clause_rows(document_id):
+            for index, record in enumerate(records()):
+                yield (
+                    document_id, index, record["clause"], record["type"], record.get("confidence"),
+                    record.get("summary"), record["risk"], risk_level(record["risk"]),
+                )
+
+        def obligation_rows(document_id):
+            for index, record in enumerate(records()):
+                for ob in record.get("obligations", []):
+                    yield (
+                        document_id, index, ob["text"], ob.get("start"), ob.get("end"),
+                        json.dumps(ob.get("triggers", [])),
+                    )
+
+        total_clauses = summary.get("total_clauses")
+        if total_clauses is None:
+            total_clauses = sum(1 for _ in records())
+        total_obligations = summary.get("total_obligations")
+        if total_obligations is None:
+            total_obligations = sum(len(record.get("obligations", [])) for record in records())
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Re-analysis (e.g. a new pipeline version) replaces the old rows
+                conn.execute("DELETE FROM documents WHERE doc_hash = ?", (doc_hash,))
+                document_id = conn.execute(
+                    "INSERT INTO documents (doc_hash, filename, total_clauses, total_obligations, "
+                    "missing_clauses, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        doc_hash,
+                        filename,
+                        total_clauses,
+                        total_obligations,
+                        json.dumps(summary.get("missing_clauses", [])),
+                        time.time(),
+                    ),
+                ).lastrowid
+                conn.executemany(
+                    "INSERT INTO clauses (document_id, clause_index, text, type, confidence, summary, risk, risk_level) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    clause_rows(document_id),
+                )
+                conn.executemany(
+                    "INSERT INTO obligations (document_id, clause_index, text, start_offset, end_offset, triggers) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    obligation_rows(document_id),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return document_id
+
+    # 🔍 Queries (keyset pagination: pass back the returned next_cursor)
+    def list_documents(self, limit: int = 50, cursor: Optional[int] = None) -> Dict:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT id, doc_hash, filename, total_clauses, total_obligations, missing_clauses, created_at "
+                "FROM documents WHERE id < ? ORDER BY id DESC LIMIT ?",
+                (cursor if cursor is not None else 2 ** 63 - 1, limit + 1),
+            ).fetchall()
+
+        items = [
+            {**dict(row), "missing_clauses": json.loads(row["missing_clauses"])}
+            for row in rows[:limit]
+        ]
+        next_cursor = items[-1]["id"] if len(rows) > limit else None
+        return {"items": items, "next_cursor": next_cursor}
+
+    def get_document(self, doc_hash: str) -> Optional[Dict]:
+        with self._lock:
+            conn = self._connection()
+            document = conn.execute("SELECT * FROM documents WHERE doc_hash = ?", (doc_hash,)).fetchone()
+            if document is None:
+                return None
+            clauses = conn.execute(
+                "SELECT clause_index, text, type, confidence, summary, risk FROM clauses "
+                "WHERE document_id = ? ORDER BY clause_index",
+                (document["id"],),
+            ).fetchall()
+            obligations = conn.execute(
+                "SELECT clause_index, text, start_offset, end_offset, triggers FROM obligations "
+                "WHERE document_id = ? ORDER BY id",
+                (document["id"],),
+            ).fetchall()
+
+        by_clause: Dict[int, List[Dict]] = {}
+        for ob in obligations:
+            by_clause.setdefault(ob["clause_index"], []).append({
+                "text": ob["text"],
+                "start": ob["start_offset"],
+                "end": ob["end_offset"],
+                "triggers": json.loads(ob["triggers"]),
+            })
+
+        return {
+            "doc_hash": document["doc_hash"],
+            "filename": document["filename"],
+            "summary": {
+                "total_clauses": document["total_clauses"],
+                "missing_clauses": json.loads(document["missing_clauses"]),
+                "total_obligations": document["total_obligations"],
+            },
+            "details": [
+                {
+                    "clause": c["text"],
+                    "type": c["type"],
+                    "confidence": c["confidence"],
+                    "summary": c["summary"],
+                    "risk": c["risk"],
+                    "obligations": by_clause.get(c["clause_index"], []),
+                }
+                for c in clauses
+            ],
+        }
+
+    def query_clauses(
+        self,
+        clause_type: Optional[str] = None,
+        risk: Optional[str] = None,
+        doc_hash: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[int] = None,
+    ) -> Dict:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        where, params = ["c.id > ?"], [cursor or 0]
+        if clause_type:
+            where.append("c.type = ?")
+            params.append(clause_type.lower())
+        if risk:
+            where.append("c.risk_level = ?")
+            params.append(risk_level(risk))
+        if doc_hash:
+            where.append("d.doc_hash = ?")
+            params.append(doc_hash)
+
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT c.id, c.clause_index, c.text, c.type, c.confidence, c.summary, c.risk, d.doc_hash, d.filename "
+                "FROM clauses c JOIN documents d ON d.id = c.document_id "
+                f"WHERE {' AND '.join(where)} ORDER BY c.id LIMIT ?",
+                (*params, limit + 1),
+            ).fetchall()
+
+        items = [dict(row) for row in rows[:limit]]
+        next_cursor = items[-1]["id"] if len(rows) > limit else None
+        return {"items": items, "next_cursor": next_cursor}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def database_from_env() -> Optional[AnalysisDatabase]:
+    # Opt-in: uploaded contracts' clauses are only persisted where a path is configured
+    path = os.getenv("ANALYSIS_DB_PATH", "")
+    if not path:
+        return None
+    try:
+        return AnalysisDatabase(path)
+    except sqlite3.Error as e:
+        logger.warning("⚠️ Analysis database unavailable at %s: %s", path, e)
+        return None
@@ -0,0 +1,227 @@
+# legal_doc_analyzer/services/job_service.py
+
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from legal_doc_analyzer.utils.logger import get_logger
+
+logger = get_logger("JobService")
+
+
+class QueueFullError(Exception):
+    pass
+
+
+_DONE = object()
+
+
+class JobManager:
+    """Runs blocking analyses on a thread or process pool behind a bounded queue."""
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue: int = 16,
+        mode: str = "thread",
+        max_finished_jobs: int = 1000,
+    ):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unsupported executor mode: {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.max_finished_jobs = max_finished_jobs
+        self._executor = None
+        self._thread_executor = None
+        self._jobs = OrderedDict()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            pool = ThreadPoolExecutor if self.mode == "thread" else ProcessPoolExecutor
+            self._executor = pool(max_workers=self.max_workers)
+            logger.info("⚙️ Started %s pool with %d workers.", self.mode, self.max_workers)
+        return self._executor
+
+    @property
+    def thread_executor(self):
+        # Generators can't cross process boundaries, so streams always run on threads
+        if self.mode == "thread":
+            return self.executor
+        if self._thread_executor is None:
+            self._thread_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._thread_executor
+
+    @property
+    def queue_depth(self) -> int:
+        with self._lock:
+            return self._in_flight
+
+    def _reserve_slot(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                raise QueueFullError("Analysis queue is full")
+            self._in_flight += 1
+
+    def _release_slot(self, _future=None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _submit(self, fn: Callable, *args, **kwargs):
+        self._reserve_slot()
+        try:
+            future = self.executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release_slot()
+            raise
+        future.add_done_callback(self._release_slot)
+        return future
+
+    # 🔁 Run a blocking call without stalling the event loop
+    async def run(self, fn: Callable, *args, **kwargs):
+        return await asyncio.wrap_future(self._submit(fn, *args, **kwargs))
+
+    # 📡 Iterate a blocking generator on a worker, yielding items to the event loop
+    def stream(self, fn: Callable, *args, on_done: Optional[Callable[[], None]] = None, **kwargs):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        cancelled = threading.Event()
+
+        def publish(item, error=None):
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (item, error))
+            except RuntimeError:  # event loop already closed
+                cancelled.set()
+
+        def produce():
+            items = None
+            try:
+                items = fn(*args, **kwargs)
+                for item in items:
+                    if cancelled.is_set():
+                        break
+                    publish(item)
+            except Exception as e:
+                publish(None, e)
+            finally:
+                if hasattr(items, "close"):
+                    items.close()
+                if on_done is not None:
+                    on_done()
+                publish(_DONE)
+
+        self._reserve_slot()
+        try:
+            future = self.thread_executor.submit(produce)
+        except Exception:
+            self._release_slot()
+            raise
+        future.add_done_callback(self._release_slot)
+
+        async def consume():
+            try:
+                while True:
+                    item, error = await queue.get()
+                    if error is not None:
+                        raise error
+                    if item is _DONE:
+                        return
+                    yield item
+            finally:
+                cancelled.set()
+
+        return consume()
+
+    # 🧾 Background jobs
+    def submit_job(
+        self,
+        fn: Callable,
+        *args,
+        track_progress: bool = False,
+        on_done: Optional[Callable[[], None]] = None,
+        **kwargs,
+    ) -> str:
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "progress": 0.0,
+            "created_at": time.time(),
+            "finished_at": None,
+            "future": None,
+        }
+
+        # Progress callbacks only work when the worker shares our memory
+        if track_progress and self.mode == "thread":
+            def progress(done: int, total: int):
+                job["progress"] = round(done / total, 4) if total else 1.0
+            kwargs["progress"] = progress
+
+        job["future"] = self._submit(fn, *args, **kwargs)
+
+        def finished(future):
+            job["finished_at"] = time.time()
+            job["progress"] = 1.0
+            error = future.exception()
+            if error is not None:
+                # Full details stay in the server log; clients only see the exception type
+                logger.error("❌ Job %s failed", job_id, exc_info=(type(error), error, error.__traceback__))
+            if on_done is not None:
+                on_done()
+
+        job["future"].add_done_callback(finished)
+
+        with self._lock:
+            self._jobs[job_id] = job
+            self._prune_finished()
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+
+        future = job["future"]
+        snapshot = {
+            "job_id": job["id"],
+            "status": self._status(future),
+            "progress": job["progress"],
+            "created_at": job["created_at"],
+            "finished_at": job["finished_at"],
+        }
+        if future.done():
+            error = future.exception()
+            if error is not None:
+                snapshot["error"] = "Analysis failed"
+                snapshot["error_type"] = type(error).__name__
+            else:
+                snapshot["result"] = future.result()
+        return snapshot
+
+    @staticmethod
+    def _status(future) -> str:
+        if future.done():
+            return "failed" if future.exception() is not None else "completed"
+        if future.running():
+            return "running"
+        return "queued"
+
+    def _prune_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job["future"].done()]
+        for job_id in finished[: max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def shutdown(self, wait: bool = True) -> None:
+        for executor in (self._executor, self._thread_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait)
+        self._executor = None
+        self._thread_executor = None
@@ -0,0 +1,147 @@
+# legal_doc_analyzer/services/report_service.py
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict
+
+from legal_doc_analyzer.services.job_service import JobManager
+from legal_doc_analyzer.utils.logger import get_logger
+from legal_doc_analyzer.utils.metrics import STAGE_SECONDS
+from legal_doc_analyzer.utils.pdf_generator import generate_pdf, template_version
+
+logger = get_logger("ReportService")
+
+
+def render_to(data: dict, mode: str, path: str, render: Callable = generate_pdf) -> int:
+    # Runs in a worker process; write next to the target, then rename so readers never see a partial PDF
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        render(data, mode=mode, output_path=tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return os.path.getsize(path)
+
+
+class ReportRenderer:
+    """Renders PDF reports on a bounded worker pool and caches them on disk.
+
+    Reports are keyed by a hash of the report data, the mode and the template
+    version, so rendering the same analysis twice serves the cached file.
+    Concurrent requests for the same report share one render.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_cache_bytes: int = 256 * 1024 * 1024,
+        max_workers: int = 2,
+        max_queue: int = 8,
+        mode: str = "process",
+        render: Callable = generate_pdf,
+    ):
+        self.cache_dir = cache_dir
+        self.max_cache_bytes = max_cache_bytes
+        self.render = render
+        self.jobs = JobManager(max_workers=max_workers, max_queue=max_queue, mode=mode)
+        self.hits = 0
+        self.misses = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._evict_lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(data: dict, mode: str) -> str:
+        payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+        digest = hashlib.sha256(f"{mode}:{template_version()}:".encode("utf-8"))
+        digest.update(payload.encode("utf-8"))
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    async def render_pdf(self, data: dict, mode: str = "single") -> str:
+        loop = asyncio.get_running_loop()
+        # Hashing hundreds of clauses is not free; keep it off the event loop too
+        key = await loop.run_in_executor(None, self.make_key, data, mode)
+        path = self.path_for(key)
+        if os.path.exists(path):
+            self.hits += 1
+            os.utime(path)  # refresh recency for eviction
+            return path
+
+        self.misses += 1
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._render(key, data, mode))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        await asyncio.shield(pending)
+        return path
+
+    async def _render(self, key: str, data: dict, mode: str) -> None:
+        started = time.perf_counter()
+        size = await self.jobs.run(render_to, data, mode, self.path_for(key), self.render)
+        elapsed = time.perf_counter() - started  # includes waiting for a free render worker
+        STAGE_SECONDS.observe(elapsed, stage="render_pdf")
+        logger.info("🖨️ Rendered %s report %s", mode, key[:12], extra={"fields": {
+            "mode": mode, "kilobytes": size // 1024, "seconds": round(elapsed, 4),
+        }})
+        await asyncio.get_running_loop().run_in_executor(None, self._evict, key)
+
+    # 🧹 Oldest reports go first once the cache outgrows its budget
+    def _evict(self, keep: str) -> None:
+        with self._evict_lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".pdf") or name == f"{keep}.pdf":
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries) + os.path.getsize(self.path_for(keep))
+            for _, size, path in sorted(entries):
+                if total <= self.max_cache_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "rendering": len(self._inflight),
+            "disk_bytes": sum(
+                os.path.getsize(os.path.join(self.cache_dir, name))
+                for name in os.listdir(self.cache_dir)
+                if name.endswith(".pdf")
+            ),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.jobs.shutdown(wait=wait)
+
+
+def report_renderer_from_env() -> ReportRenderer:
+    return ReportRenderer(
+        os.getenv("REPORT_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "legal-doc-analyzer", "reports"),
+        max_cache_bytes=int(os.getenv("REPORT_CACHE_MAX_MB", "256")) * 1024 * 1024,
+        max_workers=int(os.getenv("REPORT_WORKERS", "2")),
+        max_queue=int(os.getenv("REPORT_QUEUE_SIZE", "8")),
+        mode=os.getenv("REPORT_EXECUTOR", "process"),
+    )
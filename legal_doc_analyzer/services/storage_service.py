@@ -1 +1,173 @@
-# Placeholder for file storage logic
+# legal_doc_analyzer/services/storage_service.py
+
+import hashlib
+import os
+import tempfile
+import threading
+from typing import BinaryIO, Dict, NamedTuple, Optional
+
+from legal_doc_analyzer.utils.logger import get_logger
+
+logger = get_logger("BlobStore")
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class InvalidUploadError(ValueError):
+    """Upload rejected while streaming: wrong file type or over the size limit."""
+
+
+class StoredBlob(NamedTuple):
+    digest: str  # SHA-256 of the content
+    path: str
+    size: int
+
+
+class BlobStore:
+    """Content-addressed file store for uploads.
+
+    Uploads are streamed to disk one chunk at a time while being hashed, then
+    moved to ``<root>/<aa>/<bb>/<sha256><suffix>``. Identical files share one
+    blob, and the stored path is handed straight to the parser.
+
+    A blob saved with ``lease=True`` is never evicted until ``release`` is
+    called for it, so a queued job or the first file of a pair can't lose its
+    file while the store trims itself for a later upload.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_upload_bytes: int = 5 * 1024 * 1024,
+        max_total_bytes: int = 1024 * 1024 * 1024,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.root = root
+        self.max_upload_bytes = max_upload_bytes
+        self.max_total_bytes = max_total_bytes
+        self.chunk_size = chunk_size
+        self._tmp_dir = os.path.join(root, "tmp")
+        self._evict_lock = threading.Lock()
+        self._lease_lock = threading.Lock()
+        self._leases: Dict[str, int] = {}
+        os.makedirs(self._tmp_dir, exist_ok=True)
+
+    def path_for(self, digest: str, suffix: str = ".pdf") -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], digest + suffix)
+
+    def save_stream(
+        self, stream: BinaryIO, magic: Optional[bytes] = b"%PDF", suffix: str = ".pdf", lease: bool = False
+    ) -> StoredBlob:
+        hasher = hashlib.sha256()
+        size = 0
+        # Same filesystem as the final location, so the move below is an atomic rename
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp_dir, suffix=suffix)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = stream.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    if size == 0 and magic and not chunk.startswith(magic):
+                        raise InvalidUploadError("File content does not match its type")
+                    size += len(chunk)
+                    if size > self.max_upload_bytes:
+                        raise InvalidUploadError(
+                            f"File exceeds the {self.max_upload_bytes // (1024 * 1024)} MB limit"
+                        )
+                    hasher.update(chunk)
+                    out.write(chunk)
+            if size == 0:
+                raise InvalidUploadError("File is empty")
+
+            digest = hasher.hexdigest()
+            path = self.path_for(digest, suffix)
+            # Leased before the blob is looked at, so eviction can't remove it from here on
+            self._acquire(path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        try:
+            try:
+                os.utime(path)  # already stored: refresh recency for eviction
+                os.remove(tmp_path)
+            except FileNotFoundError:  # new content, or evicted since it was last uploaded
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+                self._evict()
+        except BaseException:
+            self._release_path(path)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if not lease:
+            self._release_path(path)
+        return StoredBlob(digest, path, size)
+
+    def save_file(self, file_path: str, magic: Optional[bytes] = b"%PDF", lease: bool = False) -> StoredBlob:
+        suffix = os.path.splitext(file_path)[1] or ".bin"
+        with open(file_path, "rb") as stream:
+            return self.save_stream(stream, magic=magic, suffix=suffix, lease=lease)
+
+    # 🔒 Leases: blobs still needed by a request or a queued job
+    def _acquire(self, path: str) -> None:
+        with self._lease_lock:
+            self._leases[path] = self._leases.get(path, 0) + 1
+
+    def _release_path(self, path: str) -> None:
+        with self._lease_lock:
+            count = self._leases.get(path, 0) - 1
+            if count > 0:
+                self._leases[path] = count
+            else:
+                self._leases.pop(path, None)
+
+    def release(self, *blobs: StoredBlob) -> None:
+        for blob in blobs:
+            self._release_path(blob.path)
+
+    # 🧹 Oldest blobs go first once the store outgrows its budget
+    def _blobs(self):
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            if dirpath == self._tmp_dir:
+                dirnames[:] = []
+                continue
+            for name in filenames:
+                yield os.path.join(dirpath, name)
+
+    def total_bytes(self) -> int:
+        return sum(os.path.getsize(path) for path in self._blobs())
+
+    def _evict(self) -> None:
+        with self._evict_lock:
+            entries = []
+            for path in self._blobs():
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_total_bytes:
+                    break
+                # Checked and removed under the lease lock: a blob leased after the walk is kept
+                with self._lease_lock:
+                    if path in self._leases:
+                        continue
+                    try:
+                        os.remove(path)
+                        total -= size
+                    except FileNotFoundError:
+                        pass
+
+
+def blob_store_from_env() -> BlobStore:
+    return BlobStore(
+        os.getenv("UPLOAD_STORAGE_DIR") or os.path.join(tempfile.gettempdir(), "legal-doc-analyzer", "uploads"),
+        max_upload_bytes=int(os.getenv("UPLOAD_MAX_MB", "5")) * 1024 * 1024,
+        max_total_bytes=int(os.getenv("UPLOAD_STORAGE_MAX_MB", "1024")) * 1024 * 1024,
+    )
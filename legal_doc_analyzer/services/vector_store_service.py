@@ -1 +1,236 @@
-# Placeholder for vector DB (e.g. Pinecone)
+# legal_doc_analyzer/services/vector_store_service.py
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process writers only
+    fcntl = None
+
+import numpy as np
+
+from legal_doc_analyzer.utils.logger import get_logger
+
+logger = get_logger("VectorStore")
+
+SEARCH_CHUNK_ROWS = 65536  # rows scored per step, bounds temporary memory during search
+
+
+class VectorStore:
+    """Append-only clause embedding index backed by memory-mapped files.
+
+    Layout of ``directory``:
+        header.json   dimension, dtype and the committed row count
+        vectors.bin   row-major float32 (or int8) matrix of L2-normalized embeddings
+        scales.bin    float32 per-row scales (int8 only)
+        meta.jsonl    one JSON object per row
+        meta.idx      uint64 byte offset of each row's line in meta.jsonl
+        documents.txt ids of documents already indexed, one per line
+
+    Rows past the committed count (from an interrupted append) are ignored, and
+    every worker maps the same files, so the corpus is shared via the page cache
+    instead of being loaded into each process.
+    """
+
+    def __init__(self, directory: str, dim: int, quantize: bool = False):
+        self.directory = directory
+        self.dim = dim
+        self.quantize = quantize
+        self.dtype = np.int8 if quantize else np.float32
+        self._lock = threading.Lock()
+        self._mapped_count = -1
+        self._vectors = self._scales = self._offsets = None
+        self._documents = set()
+        self._documents_offset = 0
+
+        os.makedirs(directory, exist_ok=True)
+        with self._write_lock():
+            header = self._read_header()
+            if header is None:
+                self._write_header(0)
+            elif header["dim"] != dim or header["dtype"] != np.dtype(self.dtype).name:
+                raise ValueError(
+                    f"Index at {directory} holds {header['dtype']}[{header['dim']}] vectors, "
+                    f"not {np.dtype(self.dtype).name}[{dim}]"
+                )
+
+    # 📁 Files
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _read_header(self) -> Optional[Dict]:
+        try:
+            with open(self._path("header.json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write_header(self, count: int) -> None:
+        header = {"dim": self.dim, "dtype": np.dtype(self.dtype).name, "count": count}
+        tmp_path = self._path("header.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(header, f)
+        os.replace(tmp_path, self._path("header.json"))
+
+    def __len__(self) -> int:
+        return self._read_header()["count"]
+
+    @contextmanager
+    def _write_lock(self):
+        # Threads in this process, then other worker processes sharing the directory
+        with self._lock, open(self._path(".lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refresh_documents(self) -> None:
+        # Pick up documents other workers indexed since we last looked; caller holds self._lock
+        path = self._path("documents.txt")
+        if os.path.exists(path) and os.path.getsize(path) > self._documents_offset:
+            with open(path, "r", encoding="utf-8") as f:
+                f.seek(self._documents_offset)
+                self._documents.update(line.strip() for line in f if line.strip())
+                self._documents_offset = f.tell()
+
+    def has_document(self, doc_id: str) -> bool:
+        # A hint that saves computing embeddings; add() makes the authoritative check
+        with self._lock:
+            self._refresh_documents()
+            return doc_id in self._documents
+
+    def _register(self, doc_id: str) -> None:
+        # Caller holds the write lock and has just refreshed the document set
+        with open(self._path("documents.txt"), "a", encoding="utf-8") as f:
+            f.write(doc_id + "\n")
+            self._documents_offset = f.tell()
+        self._documents.add(doc_id)
+
+    def claim(self, doc_id: str) -> bool:
+        """Register ``doc_id`` up front, for a document whose rows are then appended
+        chunk by chunk with ``add(..., doc_id=None)``.
+
+        False if it is already indexed or claimed by another writer, so two
+        uploads of one document still index it once. Rows appended before an
+        analysis fails part-way stay in the index.
+        """
+        with self._write_lock():
+            self._refresh_documents()
+            if doc_id in self._documents:
+                return False
+            self._register(doc_id)
+            return True
+
+    # ➕ Append-only inserts
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def add(self, vectors: np.ndarray, metadata: List[Dict], doc_id: Optional[str] = None) -> int:
+        vectors = self._normalize(vectors)
+        if vectors.ndim != 2 or vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected vectors of shape (n, {self.dim}), got {vectors.shape}")
+        if len(metadata) != len(vectors):
+            raise ValueError("Need exactly one metadata entry per vector")
+
+        with self._write_lock():
+            count = self._read_header()["count"]
+            if doc_id is not None:
+                # Checked under the write lock: two uploads of one document index it once
+                self._refresh_documents()
+                if doc_id in self._documents:
+                    return count
+            self._truncate_to(count)
+
+            if self.quantize:
+                scales = np.abs(vectors).max(axis=1) / 127.0
+                scales[scales == 0] = 1.0
+                rows = np.round(vectors / scales[:, None]).astype(np.int8)
+                with open(self._path("scales.bin"), "ab") as f:
+                    f.write(scales.astype(np.float32).tobytes())
+            else:
+                rows = vectors
+            with open(self._path("vectors.bin"), "ab") as f:
+                f.write(rows.tobytes())
+
+            with open(self._path("meta.jsonl"), "ab") as meta, open(self._path("meta.idx"), "ab") as idx:
+                offset = meta.tell()
+                offsets = []
+                for entry in metadata:
+                    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+                    offsets.append(offset)
+                    meta.write(line)
+                    offset += len(line)
+                idx.write(np.asarray(offsets, dtype=np.uint64).tobytes())
+
+            # The header is the commit point: rows only become visible once it is replaced
+            self._write_header(count + len(vectors))
+            if doc_id is not None:
+                self._register(doc_id)
+            return count + len(vectors)
+
+    def _truncate_to(self, count: int) -> None:
+        # Drop bytes left behind by an append that crashed before committing
+        row_bytes = self.dim * np.dtype(self.dtype).itemsize
+        files = [("vectors.bin", row_bytes), ("meta.idx", 8)]
+        if self.quantize:
+            files.append(("scales.bin", 4))
+        for name, size in files:
+            path = self._path(name)
+            if os.path.exists(path) and os.path.getsize(path) > count * size:
+                with open(path, "r+b") as f:
+                    f.truncate(count * size)
+
+    # 🔍 Search
+    def _mapped(self):
+        count = self._read_header()["count"]
+        if count != self._mapped_count:
+            if count == 0:
+                self._vectors = self._scales = self._offsets = None
+            else:
+                self._vectors = np.memmap(self._path("vectors.bin"), dtype=self.dtype, mode="r", shape=(count, self.dim))
+                self._offsets = np.memmap(self._path("meta.idx"), dtype=np.uint64, mode="r", shape=(count,))
+                if self.quantize:
+                    self._scales = np.memmap(self._path("scales.bin"), dtype=np.float32, mode="r", shape=(count,))
+            self._mapped_count = count
+        return count
+
+    def search(self, query: np.ndarray, k: int = 10) -> List[Dict]:
+        with self._lock:
+            count = self._mapped()
+            vectors, scales, offsets = self._vectors, self._scales, self._offsets
+        if count == 0 or k <= 0:
+            return []
+
+        query = self._normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+        k = min(k, count)
+        best_scores = np.empty(0, dtype=np.float32)
+        best_rows = np.empty(0, dtype=np.int64)
+
+        for start in range(0, count, SEARCH_CHUNK_ROWS):
+            chunk = vectors[start:start + SEARCH_CHUNK_ROWS]
+            scores = chunk.astype(np.float32, copy=False) @ query
+            if scales is not None:
+                scores *= scales[start:start + SEARCH_CHUNK_ROWS]
+
+            # Keep a running top-k so memory stays at one chunk
+            scores = np.concatenate([best_scores, scores])
+            rows = np.concatenate([best_rows, np.arange(start, start + len(chunk))])
+            top = np.argpartition(-scores, k - 1)[:k] if len(scores) > k else np.arange(len(scores))
+            best_scores, best_rows = scores[top], rows[top]
+
+        results = []
+        with open(self._path("meta.jsonl"), "rb") as meta:
+            for i in np.argsort(-best_scores, kind="stable"):
+                meta.seek(int(offsets[best_rows[i]]))
+                results.append({"score": round(float(best_scores[i]), 4), **json.loads(meta.readline())})
+        return results
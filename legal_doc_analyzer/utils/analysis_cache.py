@@ -0,0 +1,161 @@
+# legal_doc_analyzer/utils/analysis_cache.py
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from legal_doc_analyzer.utils.logger import get_logger
+
+logger = get_logger("AnalysisCache")
+
+# Bump whenever agent output changes shape or meaning so stale entries stop matching
+PIPELINE_VERSION = "3"
+
+
+class AnalysisCache:
+    """Two-tier (memory LRU + optional disk) cache of analysis results keyed by file content."""
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(content: bytes, version: str = "") -> str:
+        return AnalysisCache.key_for_digest(hashlib.sha256(content).hexdigest(), version)
+
+    @staticmethod
+    def key_for_digest(digest: str, version: str = "") -> str:
+        # Uploads are hashed while streaming to storage, so the digest is usually known already
+        stamp = hashlib.sha256(f"{PIPELINE_VERSION}:{version}".encode()).hexdigest()[:12]
+        return f"{digest}-{stamp}"
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._put_memory(key, value)
+        return value
+
+    def set(self, key: str, value: dict) -> None:
+        with self._lock:
+            self._put_memory(key, value)
+        self._write_disk(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        for path in self._disk_entries():
+            os.remove(path)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_bytes": sum(os.path.getsize(p) for p in self._disk_entries()),
+            }
+
+    # 🧠 Memory tier
+    def _put_memory(self, key: str, value: dict) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # 💾 Disk tier
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _disk_entries(self):
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return []
+        return [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".json")
+        ]
+
+    def _read_disk(self, key: str) -> Optional[dict]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)  # refresh recency for LRU eviction
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️ Dropping unreadable cache entry %s: %s", key, e)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def _write_disk(self, key: str, value: dict) -> None:
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.warning("⚠️ Failed to persist cache entry %s: %s", key, e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        entries = []
+        for path in self._disk_entries():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                pass
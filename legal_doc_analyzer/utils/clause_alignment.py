@@ -0,0 +1,166 @@
+# legal_doc_analyzer/utils/clause_alignment.py
+
+import re
+import zlib
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+_WORD_RE = re.compile(r"\w+")
+# Case, punctuation and symbols kept: "$1,000" vs "€1.000" or "shall" vs "Shall" is an edit
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+_MERSENNE_PRIME = np.uint64(4294967311)  # smallest prime above 2**32
+_MAX_BUCKET = 50  # buckets this large are boilerplate noise, not useful candidates
+
+
+def _words(text: str) -> List[str]:
+    # Only for LSH fingerprints: lowercased words find candidates despite small edits
+    return _WORD_RE.findall(text.lower())
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text)
+
+
+class ClauseAligner:
+    """Aligns the clauses of two documents into matched, modified, removed and added.
+
+    Clauses with the same text (up to whitespace) are paired by hash; any
+    other difference, even in case or punctuation, is a modification. The
+    rest are compared only when
+    MinHash/LSH over word shingles puts them in a shared bucket, which keeps
+    the work near-linear instead of comparing every pair.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 2,
+        short_clause_words: int = 12,
+        threshold: float = 0.5,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.short_clause_words = short_clause_words
+        self.threshold = threshold
+
+        rng = np.random.RandomState(seed)
+        # a, b < 2**31 keeps a * x + b inside uint64 for 32-bit shingle hashes
+        self._a = rng.randint(1, 2 ** 31, size=(num_perm, 1)).astype(np.uint64)
+        self._b = rng.randint(0, 2 ** 31, size=(num_perm, 1)).astype(np.uint64)
+
+    # 🧩 Fingerprints
+    def _shingles(self, words: List[str]) -> Set[int]:
+        # Short clauses have too few n-grams for one edit to leave much overlap,
+        # so they are fingerprinted on single words instead.
+        size = 1 if len(words) < self.short_clause_words else self.shingle_size
+        return {
+            zlib.crc32(" ".join(words[i:i + size]).encode("utf-8"))
+            for i in range(max(len(words) - size + 1, 1))
+        }
+
+    def _signature(self, shingles: Set[int]) -> np.ndarray:
+        values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        return ((self._a * values + self._b) % _MERSENNE_PRIME).min(axis=1)
+
+    def _candidates(self, words1: Dict[int, List[str]], words2: Dict[int, List[str]]) -> Set[Tuple[int, int]]:
+        buckets = defaultdict(lambda: ([], []))
+        for side, words_by_index in ((0, words1), (1, words2)):
+            for index, words in words_by_index.items():
+                signature = self._signature(self._shingles(words))
+                for band in range(self.bands):
+                    key = (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+                    buckets[key][side].append(index)
+
+        pairs = set()
+        for left, right in buckets.values():
+            if left and right and len(left) * len(right) <= _MAX_BUCKET ** 2:
+                pairs.update((i, j) for i in left for j in right)
+        return pairs
+
+    # 📝 Word-level redline for a modified pair
+    @staticmethod
+    def _diff(old: str, new: str) -> List[Dict]:
+        old_tokens, new_tokens = old.split(), new.split()
+        ops = []
+        matcher = SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                ops.append({"op": "equal", "text": " ".join(old_tokens[i1:i2])})
+                continue
+            if i2 > i1:
+                ops.append({"op": "delete", "text": " ".join(old_tokens[i1:i2])})
+            if j2 > j1:
+                ops.append({"op": "insert", "text": " ".join(new_tokens[j1:j2])})
+        return ops
+
+    def align(self, clauses1: List[str], clauses2: List[str]) -> Dict:
+        # 1️⃣ Identical clauses (up to whitespace, e.g. PDF line wrapping) pair up directly
+        unmatched2 = defaultdict(list)
+        for j, clause in enumerate(clauses2):
+            unmatched2[" ".join(clause.split())].append(j)
+
+        matched = []
+        left = []
+        for i, clause in enumerate(clauses1):
+            same = unmatched2.get(" ".join(clause.split()))
+            if same:
+                j = same.pop(0)
+                matched.append({"doc1_index": i, "doc2_index": j, "clause": clauses1[i], "similarity": 1.0})
+            else:
+                left.append(i)
+        right = sorted(j for indices in unmatched2.values() for j in indices)
+
+        # 2️⃣ Everything else: LSH candidates, scored on exact tokens, greedily assigned best-first
+        scored = []
+        if left and right:
+            words1 = {i: _words(clauses1[i]) for i in left}
+            words2 = {j: _words(clauses2[j]) for j in right}
+            tokens1 = {i: _tokens(clauses1[i]) for i in left}
+            tokens2 = {j: _tokens(clauses2[j]) for j in right}
+            for i, j in self._candidates(words1, words2):
+                score = SequenceMatcher(None, tokens1[i], tokens2[j], autojunk=False).ratio()
+                if score >= self.threshold:
+                    scored.append((score, i, j))
+
+        modified = []
+        used1, used2 = set(), set()
+        for score, i, j in sorted(scored, key=lambda item: (-item[0], item[1], item[2])):
+            if i in used1 or j in used2:
+                continue
+            used1.add(i)
+            used2.add(j)
+            modified.append({
+                "doc1_index": i,
+                "doc2_index": j,
+                "doc1_clause": clauses1[i],
+                "doc2_clause": clauses2[j],
+                "similarity": round(score, 4),
+                "diff": self._diff(clauses1[i], clauses2[j]),
+            })
+        modified.sort(key=lambda pair: pair["doc1_index"])
+        matched.sort(key=lambda pair: pair["doc1_index"])
+
+        removed = [{"doc1_index": i, "clause": clauses1[i]} for i in left if i not in used1]
+        added = [{"doc2_index": j, "clause": clauses2[j]} for j in right if j not in used2]
+
+        return {
+            "matched": matched,
+            "modified": modified,
+            "removed": removed,
+            "added": added,
+            "stats": {
+                "matched": len(matched),
+                "modified": len(modified),
+                "removed": len(removed),
+                "added": len(added),
+            },
+        }
@@ -0,0 +1,179 @@
+# legal_doc_analyzer/utils/clause_memo.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from legal_doc_analyzer.utils.analysis_cache import PIPELINE_VERSION
+from legal_doc_analyzer.utils.logger import get_logger
+
+logger = get_logger("ClauseMemo")
+
+# SQLite caps bound parameters per statement; look keys up in slices
+LOOKUP_BATCH = 500
+
+
+class ClauseMemo:
+    """SQLite-backed per-clause analysis results, so new versions of a contract
+    only pay for the clauses that changed.
+
+    Entries are keyed by the clause text (whitespace-normalized) and the agent
+    configuration. Each entry holds the clause's type, summary, risk flag and
+    obligations, plus its LegalBERT embedding when one was computed.
+    """
+
+    def __init__(self, path: str, max_entries: int = 200_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._inserts_since_evict = 0
+        self._conn = None
+        self._pid = None
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS clause_memo (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    embedding BLOB,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_clause_memo_last_access ON clause_memo(last_access)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # Worker processes must not share a connection inherited across fork
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def make_key(clause: str, version: str = "") -> str:
+        # PDF re-flows between versions change line breaks, not meaning
+        normalized = " ".join(clause.split())
+        return hashlib.sha256(f"{PIPELINE_VERSION}:{version}:{normalized}".encode("utf-8")).hexdigest()
+
+    def get_many(
+        self, keys: Sequence[str], with_embeddings: bool = False
+    ) -> Dict[str, Tuple[dict, Optional[np.ndarray]]]:
+        """Stored results for the keys that have one.
+
+        With ``with_embeddings``, entries saved without an embedding count as
+        misses, since the caller has to run the model for that clause anyway.
+        """
+        unique = list(dict.fromkeys(keys))
+        found = {}
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(unique), LOOKUP_BATCH):
+                batch = unique[start:start + LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT key, result, embedding FROM clause_memo WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, result, embedding in rows:
+                    if with_embeddings and embedding is None:
+                        continue
+                    vector = np.frombuffer(embedding, dtype=np.float32) if embedding is not None else None
+                    found[key] = (json.loads(result), vector)
+                conn.execute(
+                    f"UPDATE clause_memo SET last_access = ? WHERE key IN ({placeholders})", [now, *batch]
+                )
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def set_many(self, entries: List[Tuple[str, dict, Optional[np.ndarray]]]) -> None:
+        if not entries:
+            return
+        now = time.time()
+        rows = [
+            (
+                key,
+                json.dumps(result, ensure_ascii=False),
+                np.asarray(embedding, dtype=np.float32).tobytes() if embedding is not None else None,
+                now,
+            )
+            for key, result, embedding in entries
+        ]
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # An entry that already has an embedding keeps it when re-saved without one
+                conn.executemany(
+                    "INSERT INTO clause_memo (key, result, embedding, last_access) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET result = excluded.result, "
+                    "embedding = COALESCE(excluded.embedding, clause_memo.embedding), "
+                    "last_access = excluded.last_access",
+                    rows,
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._inserts_since_evict += len(rows)
+            # Counting rows on every insert is wasteful; trim in small batches instead
+            if self._inserts_since_evict >= max(1, self.max_entries // 100):
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        self._inserts_since_evict = 0
+        (count,) = conn.execute("SELECT COUNT(*) FROM clause_memo").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM clause_memo WHERE key IN "
+                "(SELECT key FROM clause_memo ORDER BY last_access ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM clause_memo")
+
+    def stats(self) -> dict:
+        with self._lock:
+            (entries,) = self._connection().execute("SELECT COUNT(*) FROM clause_memo").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": entries,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def clause_memo_from_env() -> Optional[ClauseMemo]:
+    # Opt-in, like the analysis database: clause text is only written where a path is configured
+    path = os.getenv("CLAUSE_MEMO_PATH", "")
+    if not path:
+        return None
+    try:
+        return ClauseMemo(path, max_entries=int(os.getenv("CLAUSE_MEMO_MAX_ENTRIES", "200000")))
+    except sqlite3.Error as e:
+        logger.warning("⚠️ Clause memo unavailable at %s: %s", path, e)
+        return None
@@ -0,0 +1,121 @@
+# legal_doc_analyzer/utils/fake_llm_server.py
+#
+# Local OpenAI-compatible chat completions server for offline throughput tests.
+#
+#   python -m legal_doc_analyzer.utils.fake_llm_server --port 8001 --latency 0.5
+#   OPENAI_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=fake uvicorn legal_doc_analyzer.app:app
+
+import argparse
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency: float = 0.1, jitter: float = 0.0, failure_rate: float = 0.0):
+        super().__init__(address, FakeLLMHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.requests_served = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._reply(404, {"error": {"message": "Not found"}})
+
+        with server._lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(max(0.0, server.latency + random.uniform(-server.jitter, server.jitter)))
+            if random.random() < server.failure_rate:
+                return self._reply(500, {"error": {"message": "Injected failure", "type": "server_error"}})
+
+            request = json.loads(body or b"{}")
+            prompt = request.get("messages", [{}])[-1].get("content", "")
+            content = f"Summary: {prompt.splitlines()[-1][:80]}" if prompt else "Summary."
+            self._reply(200, {
+                "id": f"chatcmpl-fake-{server.requests_served}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "fake"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {
+                    "prompt_tokens": len(prompt.split()),
+                    "completion_tokens": len(content.split()),
+                    "total_tokens": len(prompt.split()) + len(content.split()),
+                },
+            })
+        finally:
+            with server._lock:
+                server.in_flight -= 1
+                server.requests_served += 1
+
+    def _reply(self, status: int, payload: dict):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@contextmanager
+def run_fake_llm_server(host: str = "127.0.0.1", port: int = 0, **options):
+    server = FakeLLMServer((host, port), **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds per completion")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeLLMServer(
+        (args.host, args.port),
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+    )
+    print(f"🤖 Fake LLM server listening on {server.base_url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# legal_doc_analyzer/utils/inference_backends.py
+
+import hashlib
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from legal_doc_analyzer.utils.logger import get_logger
+
+logger = get_logger("InferenceBackends")
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+ONNX_CACHE_DIR = os.getenv(
+    "ONNX_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "legal-doc-analyzer", "onnx")
+)
+ONNX_INPUTS = ("input_ids", "attention_mask", "token_type_ids")
+
+
+class TorchBackend:
+    """Eager PyTorch sequence classifier."""
+
+    name = "torch"
+
+    def __init__(self, model):
+        self.model = model.eval()
+
+    def run(self, inputs: Dict[str, np.ndarray], with_hidden: bool = False) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        import torch
+
+        tensors = {key: torch.from_numpy(np.asarray(value, dtype=np.int64)) for key, value in inputs.items()}
+        with torch.no_grad():
+            outputs = self.model(**tensors, output_hidden_states=with_hidden)
+        hidden = outputs.hidden_states[-1].numpy() if with_hidden else None
+        return outputs.logits.numpy(), hidden
+
+
+class OnnxBackend:
+    """ONNX Runtime session over an exported classifier (fp32 or int8)."""
+
+    def __init__(self, path: str, name: str = "onnx", threads: Optional[int] = None):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        threads = threads if threads is not None else int(os.getenv("ONNX_THREADS", "0"))
+        if threads:
+            options.intra_op_num_threads = threads
+        self.name = name
+        self.path = path
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self._input_names = [i.name for i in self.session.get_inputs()]
+
+    def run(self, inputs: Dict[str, np.ndarray], with_hidden: bool = False) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        feed = {name: np.asarray(inputs[name], dtype=np.int64) for name in self._input_names if name in inputs}
+        # Asking only for logits skips copying the hidden states out of the session
+        outputs = ["logits", "last_hidden_state"] if with_hidden else ["logits"]
+        results = self.session.run(outputs, feed)
+        return results[0], results[1] if with_hidden else None
+
+
+# 📦 Export / quantization
+def export_onnx(model, path: str, opset: int = 14) -> str:
+    import torch
+
+    class _Outputs(torch.nn.Module):
+        # Fixed output names: logits plus the last hidden layer for clause embeddings
+        def __init__(self, inner):
+            super().__init__()
+            self.inner = inner
+
+        def forward(self, input_ids, attention_mask, token_type_ids):
+            out = self.inner(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                token_type_ids=token_type_ids,
+                output_hidden_states=True,
+            )
+            return out.logits, out.hidden_states[-1]
+
+    model.eval()
+    dummy = tuple(torch.ones(2, 8, dtype=torch.long) for _ in ONNX_INPUTS)
+    dynamic = {name: {0: "batch", 1: "sequence"} for name in ONNX_INPUTS}
+    dynamic.update({"logits": {0: "batch"}, "last_hidden_state": {0: "batch", 1: "sequence"}})
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            _Outputs(model),
+            dummy,
+            tmp_path,
+            input_names=list(ONNX_INPUTS),
+            output_names=["logits", "last_hidden_state"],
+            dynamic_axes=dynamic,
+            opset_version=opset,
+        )
+    os.replace(tmp_path, path)
+    logger.info("📦 Exported ONNX model to %s", path)
+    return path
+
+
+def quantize_onnx(source: str, path: str) -> str:
+    # Dynamic quantization: int8 weights, activations quantized per batch at runtime
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    quantize_dynamic(source, tmp_path, weight_type=QuantType.QInt8)
+    os.replace(tmp_path, path)
+    logger.info("📦 Wrote int8 ONNX model to %s", path)
+    return path
+
+
+def model_revision(config) -> str:
+    """Short fingerprint of the weights behind ``config``, so a new checkpoint is re-exported.
+
+    Hub models are identified by the resolved commit; a local checkpoint
+    directory by its files' names, sizes and modification times. The config
+    itself is always included.
+    """
+    digest = hashlib.sha256(config.to_json_string().encode("utf-8"))
+    digest.update(str(getattr(config, "_commit_hash", None)).encode("utf-8"))
+    directory = getattr(config, "name_or_path", "")
+    if directory and os.path.isdir(directory):
+        for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+            if entry.is_file():
+                stat = entry.stat()
+                digest.update(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def onnx_paths(
+    model_name: str, num_labels: int, cache_dir: str = ONNX_CACHE_DIR, revision: Optional[str] = None
+) -> Tuple[str, str]:
+    stem = os.path.join(cache_dir, f"{model_name.replace('/', '--')}-{num_labels}")
+    if revision:
+        stem = f"{stem}-{revision}"
+    return f"{stem}.onnx", f"{stem}-int8.onnx"
+
+
+def load_backend(
+    name: str,
+    model_name: str,
+    num_labels: int,
+    load_torch_model,
+    cache_dir: str = ONNX_CACHE_DIR,
+    revision: Optional[str] = None,
+):
+    """Build the requested backend, falling back to torch if ONNX is unavailable.
+
+    ``load_torch_model`` is only called when the torch model is actually
+    needed (torch backend, or a first-time export), so a cached ONNX model
+    never pays for loading the PyTorch weights. Exports are cached per
+    ``revision`` (see ``model_revision``), so changed weights are re-exported.
+    """
+    if name not in BACKENDS:
+        logger.warning("⚠️ Unknown classifier backend %r, using torch.", name)
+        name = "torch"
+
+    if name != "torch":
+        try:
+            fp32_path, int8_path = onnx_paths(model_name, num_labels, cache_dir, revision)
+            if not os.path.exists(fp32_path):
+                export_onnx(load_torch_model(), fp32_path)
+            if name == "onnx-int8":
+                if not os.path.exists(int8_path):
+                    quantize_onnx(fp32_path, int8_path)
+                return OnnxBackend(int8_path, name=name)
+            return OnnxBackend(fp32_path, name=name)
+        except Exception as e:
+            logger.warning("⚠️ %s backend unavailable (%s: %s). Falling back to torch.", name, type(e).__name__, e)
+
+    return TorchBackend(load_torch_model())
@@ -0,0 +1,59 @@
+# legal_doc_analyzer/utils/keyword_matcher.py
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+
+def _trie_pattern(node: Dict) -> str:
+    # "" marks the end of a keyword; every other key is the next character
+    terminal = "" in node
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if terminal else group  # greedy: longest keyword wins
+
+
+class KeywordMatcher:
+    """Case-insensitive substring matcher for many keywords in a single pass.
+
+    Keywords are compiled into one trie-shaped regex, so the cost of scanning a
+    clause depends on its length rather than on how many keywords exist.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: FrozenSet[str] = frozenset(k.lower() for k in keywords if k)
+
+        trie: Dict = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        # The trie regex returns the longest keyword starting at each position;
+        # shorter keywords that are prefixes of it matched there too.
+        self._prefixes: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset(keyword[:i] for i in range(1, len(keyword) + 1) if keyword[:i] in self.keywords)
+            for keyword in self.keywords
+        }
+        pattern = _trie_pattern(trie)
+        self._regex = re.compile(pattern) if pattern else None
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        if self._regex is None or not text:
+            return frozenset()
+        text = text.lower()
+        hits: Set[str] = set()
+        search = self._regex.search
+        match = search(text)
+        while match:
+            hits |= self._prefixes[match.group()]
+            # Resume one character later so keywords overlapping this one are found too
+            match = search(text, match.start() + 1)
+        return frozenset(hits)
+
+    def scan_many(self, texts: Iterable[str]) -> List[FrozenSet[str]]:
+        return [self.scan(text) for text in texts]
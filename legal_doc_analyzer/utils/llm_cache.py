@@ -0,0 +1,136 @@
+# legal_doc_analyzer/utils/llm_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from legal_doc_analyzer.utils.logger import get_logger
+
+logger = get_logger("LLMCache")
+
+
+class LLMCache:
+    """SQLite-backed LLM response cache with TTL and LRU eviction by entry count."""
+
+    def __init__(self, path: str, ttl_seconds: float = 30 * 24 * 3600, max_entries: int = 100_000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+        self._lock = threading.Lock()
+        self._inserts_since_evict = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                tokens INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+
+    @staticmethod
+    def make_key(messages: List[dict], model: str, temperature: float, max_tokens: int) -> str:
+        # Whitespace differences (PDF line wrapping) shouldn't defeat the cache
+        normalized = [
+            {"role": m.get("role", ""), "content": " ".join(str(m.get("content", "")).split())}
+            for m in messages
+        ]
+        payload = json.dumps(
+            {"messages": normalized, "model": model, "temperature": temperature, "max_tokens": max_tokens},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, tokens, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[2] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            self.tokens_saved += row[1]
+            return row[0]
+
+    def set(self, key: str, model: str, response: str, tokens: int = 0) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, model, response, tokens, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, tokens, now, now),
+            )
+            self._inserts_since_evict += 1
+            # Counting rows on every insert is wasteful; trim in small batches instead
+            if self._inserts_since_evict >= max(1, self.max_entries // 100):
+                self._evict()
+
+    def _evict(self) -> None:
+        self._inserts_since_evict = 0
+        self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN "
+                "(SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> dict:
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "tokens_saved": self.tokens_saved,
+                "entries": entries,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def cache_from_env() -> Optional[LLMCache]:
+    # Opt-in: no SQLite file appears in the working directory unless a path is configured
+    path = os.getenv("LLM_CACHE_PATH", "")
+    if not path:
+        return None
+    try:
+        return LLMCache(
+            path,
+            ttl_seconds=float(os.getenv("LLM_CACHE_TTL_HOURS", "720")) * 3600,
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "100000")),
+        )
+    except sqlite3.Error as e:
+        logger.warning("⚠️ LLM cache unavailable at %s: %s", path, e)
+        return None
@@ -0,0 +1,256 @@
+# legal_doc_analyzer/utils/llm_client.py
+
+import asyncio
+import os
+import random
+import threading
+import time
+from functools import lru_cache
+from typing import List, Optional
+
+from legal_doc_analyzer.utils.llm_cache import LLMCache, cache_from_env
+from legal_doc_analyzer.utils.logger import get_logger
+from legal_doc_analyzer.utils.metrics import LLM_REQUEST_SECONDS
+
+logger = get_logger("LLMClient")
+
+DEFAULT_MODEL = os.getenv("LLM_MODEL", "gpt-4")
+
+# Errors worth another attempt; anything else (bad request, auth) fails fast.
+# openai is imported on first request so importing the app stays cheap.
+@lru_cache(maxsize=None)
+def retryable_errors() -> tuple:
+    import openai
+
+    return (
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.RateLimitError,
+        openai.InternalServerError,
+        asyncio.TimeoutError,
+    )
+
+
+class LLMError(Exception):
+    pass
+
+
+class AsyncLLMClient:
+    """OpenAI-compatible chat client with bounded concurrency, timeouts and jittered retries.
+
+    All requests run on one private event loop thread, so every caller (worker
+    threads included) shares a single connection pool and concurrency limit.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: int = 8,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        cache: Optional[LLMCache] = None,
+    ):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.cache = cache
+
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._semaphore = None
+        self._start_lock = threading.Lock()
+
+    # 🔁 Background event loop owning the connection pool
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="llm-client", daemon=True)
+                thread.start()
+                asyncio.run_coroutine_threadsafe(self._setup(), loop).result()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def _setup(self) -> None:
+        import httpx
+        import openai
+
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+            timeout=self.timeout,
+        )
+        self._client = openai.AsyncOpenAI(
+            api_key=self.api_key or "not-set",
+            base_url=self.base_url,
+            http_client=http_client,
+            max_retries=0,  # retries are handled here, with jitter
+            timeout=self.timeout,
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def _complete(self, messages: List[dict], model: str, temperature: float, max_tokens: int) -> str:
+        key = None
+        loop = asyncio.get_running_loop()
+        # SQLite reads and writes go to the loop's executor, so disk I/O and the cache
+        # lock never stall the other completions in flight on this loop
+        if self.cache is not None:
+            key = self.cache.make_key(messages, model, temperature, max_tokens)
+            cached = await loop.run_in_executor(None, self.cache.get, key)
+            if cached is not None:
+                return cached
+
+        content, tokens = await self._request(messages, model, temperature, max_tokens)
+        if key is not None:
+            await loop.run_in_executor(None, self.cache.set, key, model, content, tokens)
+        return content
+
+    async def _request(self, messages: List[dict], model: str, temperature: float, max_tokens: int):
+        async with self._semaphore:
+            # Timed inside the semaphore: API latency (retries included), not local queueing
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await self._request_with_retries(messages, model, temperature, max_tokens)
+                outcome = "ok"
+                return result
+            finally:
+                LLM_REQUEST_SECONDS.observe(time.perf_counter() - started, outcome=outcome)
+
+    async def _request_with_retries(self, messages: List[dict], model: str, temperature: float, max_tokens: int):
+        import openai
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await asyncio.wait_for(
+                    self._client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    ),
+                    timeout=self.timeout,
+                )
+                tokens = response.usage.total_tokens if response.usage else 0
+                return response.choices[0].message.content or "", tokens
+            except retryable_errors() as e:
+                if attempt == self.max_retries:
+                    raise LLMError(f"LLM call failed after {attempt + 1} attempts: {e}") from e
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+                logger.warning("🔁 LLM call failed (%s), retrying in %.2fs", type(e).__name__, delay)
+                await asyncio.sleep(delay)
+            except openai.OpenAIError as e:
+                raise LLMError(f"LLM call failed: {e}") from e
+
+    async def _complete_many(self, requests: List[List[dict]], model: str, temperature: float, max_tokens: int):
+        # Identical prompts (boilerplate clauses) within one batch are sent once
+        unique = {}
+        for messages in requests:
+            unique.setdefault(LLMCache.make_key(messages, model, temperature, max_tokens), messages)
+        results = await asyncio.gather(
+            *(self._complete(messages, model, temperature, max_tokens) for messages in unique.values()),
+            return_exceptions=True,
+        )
+        by_key = dict(zip(unique.keys(), results))
+        return [by_key[LLMCache.make_key(m, model, temperature, max_tokens)] for m in requests]
+
+    # 🧵 Entry points usable from any thread or event loop
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    @staticmethod
+    def _unwrap(results) -> List[Optional[str]]:
+        unwrapped = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("⚠️ %s", result)
+                unwrapped.append(None)
+            else:
+                unwrapped.append(result)
+        return unwrapped
+
+    def complete(
+        self,
+        messages: List[dict],
+        model: str = DEFAULT_MODEL,
+        temperature: float = 0.3,
+        max_tokens: int = 300,
+    ) -> str:
+        return self._submit(self._complete(messages, model, temperature, max_tokens)).result()
+
+    def complete_many(
+        self,
+        requests: List[List[dict]],
+        model: str = DEFAULT_MODEL,
+        temperature: float = 0.3,
+        max_tokens: int = 300,
+    ) -> List[Optional[str]]:
+        if not requests:
+            return []
+        future = self._submit(self._complete_many(requests, model, temperature, max_tokens))
+        return self._unwrap(future.result())
+
+    async def acomplete(
+        self,
+        messages: List[dict],
+        model: str = DEFAULT_MODEL,
+        temperature: float = 0.3,
+        max_tokens: int = 300,
+    ) -> str:
+        future = self._submit(self._complete(messages, model, temperature, max_tokens))
+        return await asyncio.wrap_future(future)
+
+    async def acomplete_many(
+        self,
+        requests: List[List[dict]],
+        model: str = DEFAULT_MODEL,
+        temperature: float = 0.3,
+        max_tokens: int = 300,
+    ) -> List[Optional[str]]:
+        if not requests:
+            return []
+        future = self._submit(self._complete_many(requests, model, temperature, max_tokens))
+        return self._unwrap(await asyncio.wrap_future(future))
+
+    def close(self) -> None:
+        with self._start_lock:
+            if self._loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._client.close(), self._loop).result()
+            asyncio.run_coroutine_threadsafe(self._loop.shutdown_default_executor(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = self._client = self._semaphore = None
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def existing_llm_client() -> Optional[AsyncLLMClient]:
+    # For stats readers: never creates the client (or its cache file) as a side effect
+    return _default_client
+
+
+def get_llm_client() -> AsyncLLMClient:
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = AsyncLLMClient(
+                max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+                timeout=float(os.getenv("LLM_TIMEOUT", "30")),
+                max_retries=int(os.getenv("LLM_MAX_RETRIES", "3")),
+                cache=cache_from_env(),
+            )
+        return _default_client
@@ -1,19 +1,18 @@
 # llm_utils.py
 
-import os
-import openai
+from legal_doc_analyzer.utils.llm_client import DEFAULT_MODEL, LLMError, get_llm_client
+from legal_doc_analyzer.utils.logger import get_logger
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
+logger = get_logger("llm_utils")
 
-def call_llm(prompt: str, model: str = "gpt-4", temperature: float = 0.3, max_tokens: int = 300) -> str:
+def call_llm(prompt: str, model: str = DEFAULT_MODEL, temperature: float = 0.3, max_tokens: int = 300) -> str:
     try:
-        response = openai.ChatCompletion.create(
+        return get_llm_client().complete(
+            [{"role": "user", "content": prompt}],
             model=model,
-            messages=[{"role": "user", "content": prompt}],
             temperature=temperature,
             max_tokens=max_tokens,
         )
-        return response['choices'][0]['message']['content']
-    except Exception as e:
-        print(f"LLM call failed: {e}")
+    except LLMError as e:
+        logger.warning(f"LLM call failed: {e}")
         return ""
@@ -1,4 +1,35 @@
+import json
 import logging
+import os
+
+# text: human-readable lines; json: one JSON object per line for log pipelines
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+
+
+class StructuredFormatter(logging.Formatter):
+    """Adds fields passed as ``extra={"fields": {...}}`` to the log line."""
+
+    def __init__(self, json_output: bool = False):
+        super().__init__('[%(asctime)s] %(levelname)s in %(name)s: %(message)s')
+        self.json_output = json_output
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, "fields", None) or {}
+        if self.json_output:
+            payload = {
+                "time": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                **fields,
+            }
+            if record.exc_info:
+                payload["exception"] = self.formatException(record.exc_info)
+            return json.dumps(payload, ensure_ascii=False, default=str)
+
+        line = super().format(record)
+        return f"{line} {json.dumps(fields, ensure_ascii=False, default=str)}" if fields else line
+
 
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
@@ -6,10 +37,7 @@ def get_logger(name: str) -> logging.Logger:
 
     if not logger.handlers:
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '[%(asctime)s] %(levelname)s in %(name)s: %(message)s'
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(StructuredFormatter(json_output=LOG_FORMAT == "json"))
         logger.addHandler(handler)
 
     return logger
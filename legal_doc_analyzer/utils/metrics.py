@@ -0,0 +1,235 @@
+# legal_doc_analyzer/utils/metrics.py
+#
+# Small in-process metrics registry rendered in the Prometheus text format.
+# Metrics live in the process that records them: with ANALYSIS_EXECUTOR=process
+# the per-stage histograms are recorded in the worker processes and do not
+# reach /metrics; request, queue and cache metrics are unaffected.
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+PAGE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+CLAUSE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        return "\n".join(lines + self.samples())
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Gauge(_Metric):
+    """A value read at scrape time from ``collect``, which returns a number or {label values: number}."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, collect: Callable, labelnames: Iterable[str] = (), kind: str = "gauge"):
+        super().__init__(name, help, labelnames)
+        self.collect = collect
+        self.kind = kind
+
+    def samples(self) -> List[str]:
+        values = self.collect()
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+            if value is not None
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # per-bucket counts (non-cumulative), then count and sum
+                series = self._series[key] = [[0] * len(self.buckets), 0, 0.0]
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += 1
+            series[2] += value
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return series[1] if series else 0
+
+    def samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+        for key, (counts, total, value_sum) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            inf = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, inf)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {total}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(value_sum)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "legal_doc_stage_seconds", "Time spent per pipeline stage for one document.", ["stage"]
+))
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "legal_doc_request_seconds", "HTTP request latency.", ["method", "route", "status"]
+))
+LLM_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "legal_doc_llm_request_seconds", "Chat completion latency, retries included.", ["outcome"]
+))
+DOCUMENT_PAGES = REGISTRY.register(Histogram(
+    "legal_doc_document_pages", "Pages per analyzed document.", buckets=PAGE_BUCKETS
+))
+DOCUMENT_CLAUSES = REGISTRY.register(Histogram(
+    "legal_doc_document_clauses", "Clauses per analyzed document.", buckets=CLAUSE_BUCKETS
+))
+
+
+class StageTimer:
+    """Per-document stage timings.
+
+    Time spent in a stage accumulates across chunks, and a stage nested in
+    another counts only toward the inner one; ``finish`` records each stage
+    total once in ``legal_doc_stage_seconds`` and returns the breakdown.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+        self._finished = False
+        self._nested = 0.0
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        outer_nested, self._nested = self._nested, 0.0
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed - self._nested
+            self._nested = outer_nested + elapsed
+
+    def iterate(self, name: str, iterable: Iterable) -> Iterator:
+        # Times a lazy stage: each step of the iterator, not the consumer's work in between
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def finish(self, histogram: Histogram = STAGE_SECONDS) -> Dict[str, float]:
+        if not self._finished:
+            self._finished = True
+            for name, seconds in self.timings.items():
+                histogram.observe(seconds, stage=name)
+        breakdown = {name: round(seconds, 4) for name, seconds in self.timings.items()}
+        breakdown["total"] = round(time.perf_counter() - self.started, 4)
+        return breakdown
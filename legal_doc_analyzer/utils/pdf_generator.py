@@ -1,21 +1,56 @@
 # legal_doc_analyzer/utils/pdf_generator.py
 
-from weasyprint import HTML
-from jinja2 import Environment, FileSystemLoader
+import hashlib
 import os
+import time
+import uuid
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+from legal_doc_analyzer.utils.logger import get_logger
+
+logger = get_logger("PDFGenerator")
 
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
 OUTPUT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "output"))
 
-env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+# WeasyPrint and Jinja are imported on first render, not when the app starts
+@lru_cache(maxsize=None)
+def get_environment():
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+
+# Changes to any template invalidate cached reports
+@lru_cache(maxsize=None)
+def template_version() -> str:
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(TEMPLATES_DIR)):
+        digest.update(name.encode("utf-8"))
+        with open(os.path.join(TEMPLATES_DIR, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+def load_renderer() -> bool:
+    try:
+        import weasyprint  # noqa: F401
+    except Exception as e:
+        logger.warning("⚠️ WeasyPrint not available: %s", e)
+        return False
+    get_environment()
+    return True
 
-def generate_pdf(data: dict, mode: str = "single") -> str:
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def generate_pdf(data: dict, mode: str = "single", output_path: Optional[str] = None) -> str:
+    from weasyprint import HTML
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{mode}_report_{timestamp}.pdf"
-    output_path = os.path.join(OUTPUT_DIR, filename)
+    env = get_environment()
+    if output_path is None:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Timestamps alone collide when two reports finish in the same second
+        filename = f"{mode}_report_{timestamp}_{uuid.uuid4().hex[:8]}.pdf"
+        output_path = os.path.join(OUTPUT_DIR, filename)
 
     generation_date = datetime.now().strftime("%B %d, %Y at %H:%M")
 
@@ -28,17 +63,20 @@ def generate_pdf(data: dict, mode: str = "single") -> str:
             html_out = template.render(data=data, generation_date=generation_date)
 
         # Generate PDF with WeasyPrint
+        started = time.perf_counter()
         HTML(string=html_out).write_pdf(output_path)
 
         # Log success
         if os.path.exists(output_path):
-            print(f"✅ PDF written successfully to: {output_path}")
+            logger.info("✅ PDF written successfully to: %s", output_path, extra={"fields": {
+                "mode": mode, "weasyprint_seconds": round(time.perf_counter() - started, 4),
+            }})
         else:
-            print(f"❌ PDF generation attempted but file not found: {output_path}")
+            logger.error("❌ PDF generation attempted but file not found: %s", output_path)
             raise FileNotFoundError(f"Generated file missing at {output_path}")
 
         return output_path
 
     except Exception as e:
-        print(f"❌ Error during PDF generation: {e}")
+        logger.error("❌ Error during PDF generation: %s", e)
         raise
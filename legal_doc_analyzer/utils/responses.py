@@ -0,0 +1,171 @@
+# legal_doc_analyzer/utils/responses.py
+#
+# Response shaping for the analysis endpoints: field projection, a fast JSON
+# encoder and gzip/brotli compression.
+
+import gzip
+import json
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # the stdlib encoder is the fallback
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# 🔍 Field projection: ?fields=type,risk,obligations.start,obligations.end
+RECORD_FIELDS = ("clause", "type", "confidence", "summary", "risk", "obligations")
+OBLIGATION_FIELDS = ("text", "start", "end", "triggers")
+
+Projection = Dict[str, Optional[Tuple[str, ...]]]
+
+
+def parse_fields(spec: Optional[str]) -> Optional[Projection]:
+    """Record fields to keep, with the kept obligation fields as a tuple, or
+    None to keep everything. Raises ValueError naming an unknown field."""
+    if not spec or not spec.strip():
+        return None
+    projection: Dict[str, Optional[list]] = {}
+    for field in (part.strip() for part in spec.split(",")):
+        if not field:
+            continue
+        name, _, sub = field.partition(".")
+        if name not in RECORD_FIELDS or (sub and (name != "obligations" or sub not in OBLIGATION_FIELDS)):
+            raise ValueError(
+                f"Unknown field '{field}'; choose from {', '.join(RECORD_FIELDS)} "
+                f"or obligations.<{'|'.join(OBLIGATION_FIELDS)}>"
+            )
+        if not sub:
+            projection[name] = None  # the whole field wins over any subset of it
+        elif name not in projection or projection[name] is not None:
+            projection.setdefault(name, []).append(sub)
+    return {name: tuple(subs) if subs is not None else None for name, subs in projection.items()}
+
+
+def project_record(record: dict, projection: Optional[Projection]) -> dict:
+    if projection is None:
+        return record
+    projected = {}
+    for name, subs in projection.items():
+        if name not in record:
+            continue
+        if subs is None:
+            projected[name] = record[name]
+        else:
+            projected[name] = [{sub: item.get(sub) for sub in subs} for item in record[name]]
+    return projected
+
+
+def project_analysis(data: dict, projection: Optional[Projection]) -> dict:
+    # The summary is small and always kept; only the per-clause details are trimmed
+    if projection is None:
+        return data
+    return {**data, "details": [project_record(record, projection) for record in data["details"]]}
+
+
+# ⚡ JSON encoding
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson when it is installed."""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+# 🗜️ Compression of complete JSON/text responses
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/x-ndjson")
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, *params = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    # Fast settings: the point is fewer bytes on the wire, not the smallest possible payload
+    if encoding == "br":
+        return brotli.compress(body, quality=4)
+    return gzip.compress(body, compresslevel=6)
+
+
+class CompressionMiddleware:
+    """gzip (and brotli, when installed) for responses sent in one piece.
+
+    Streamed responses such as /results/stream pass through untouched, so
+    their events still reach the client as soon as they are produced.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+
+        async def send_compressed(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message  # held until we know whether the body comes in one piece
+                return
+            if start is None:
+                await send(message)
+                return
+
+            held, start = start, None
+            headers = MutableHeaders(raw=held["headers"])
+            body = message.get("body", b"")
+            content_type = headers.get("content-type", "")
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or len(body) < self.minimum_size
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            ):
+                await send(held)
+                await send(message)
+                return
+
+            body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(held)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,43 @@
+import os
+
+from legal_doc_analyzer.utils.analysis_cache import AnalysisCache
+
+
+def test_key_depends_on_content_and_version():
+    key = AnalysisCache.make_key(b"%PDF-1.4 a", "legalbert:llm")
+    assert key == AnalysisCache.make_key(b"%PDF-1.4 a", "legalbert:llm")
+    assert key != AnalysisCache.make_key(b"%PDF-1.4 b", "legalbert:llm")
+    assert key != AnalysisCache.make_key(b"%PDF-1.4 a", "heuristics:llm")
+
+
+def test_memory_lru_eviction_and_counters():
+    cache = AnalysisCache(max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"v": 3}
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    AnalysisCache(cache_dir=str(tmp_path)).set("k", {"clauses": ["x"]})
+
+    cache = AnalysisCache(cache_dir=str(tmp_path))
+    assert cache.get("k") == {"clauses": ["x"]}
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_disk_tier_evicts_oldest_when_over_budget(tmp_path):
+    cache = AnalysisCache(cache_dir=str(tmp_path), max_disk_bytes=150)
+    cache.set("old", {"text": "x" * 60})
+    os.utime(tmp_path / "old.json", (0, 0))
+    cache.set("new", {"text": "y" * 60})
+    cache.set("newest", {"text": "z" * 60})
+
+    assert not (tmp_path / "old.json").exists()
+    assert (tmp_path / "newest.json").exists()
@@ -0,0 +1,103 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import zipfile
+
+import pytest
+
+from benchmarks.synthetic import build_contract
+from legal_doc_analyzer.agents.missing_clause_detector import MissingClauseDetectorAgent
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_bundle_counts_a_clause_present_in_any_document():
+    detector = MissingClauseDetectorAgent()
+    everything_but = lambda *found: sorted(detector.required_clauses - set(found))  # noqa: E731
+    view = detector.bundle_view([
+        ("msa.pdf", everything_but("termination", "governing law")),
+        ("schedule-1.pdf", everything_but("payment terms", "termination")),
+    ])
+    assert view["found_in"]["termination"] == ["msa.pdf", "schedule-1.pdf"]
+    assert view["found_in"]["payment terms"] == ["schedule-1.pdf"]
+    assert view["missing_clauses"] == everything_but("termination", "governing law", "payment terms")
+
+
+# Each upload goes through the app in a fresh interpreter, counting classifier calls
+CLIENT = """
+import json, sys
+from fastapi.testclient import TestClient
+from legal_doc_analyzer.app import app, classifier_agent
+calls = []
+classify = classifier_agent.classify_batch
+classifier_agent.classify_batch = lambda clauses, **kw: calls.append(len(clauses)) or classify(clauses, **kw)
+uploads = json.load(open(sys.argv[1]))
+with TestClient(app) as client:
+    files = [("files", (name, open(path, "rb"), "application/octet-stream")) for name, path in uploads]
+    response = client.post("/results/batch" + sys.argv[2], files=files)
+print(json.dumps([response.status_code, response.json(), calls]))
+"""
+
+
+def post_bundle(tmp_path, uploads, query=""):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("slowapi")
+    paths = []
+    for name, data in uploads:
+        path = tmp_path / f"upload-{len(paths)}"
+        path.write_bytes(data)
+        paths.append((name, str(path)))
+    manifest = tmp_path / "uploads.json"
+    manifest.write_text(json.dumps(paths))
+
+    env = {
+        **os.environ,
+        "PYTHONPATH": ROOT,
+        "MODEL_LOADING": "lazy",
+        "HF_HUB_OFFLINE": "1",
+        "ANALYSIS_DB_PATH": "",
+        "LLM_CACHE_PATH": "",
+        "CLAUSE_MEMO_PATH": "",
+        "UPLOAD_STORAGE_DIR": str(tmp_path / "uploads"),
+        "REPORT_CACHE_DIR": str(tmp_path / "reports"),
+    }
+    env.pop("OPENAI_API_KEY", None)
+    result = subprocess.run(
+        [sys.executable, "-c", CLIENT, str(manifest), query], cwd=tmp_path, env=env,
+        capture_output=True, text=True, timeout=300, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_batch_pools_clauses_of_every_document_into_shared_batches(tmp_path):
+    master, schedule = build_contract(2, "pdf", seed=11), build_contract(1, "pdf", seed=12)
+    status, body, calls = post_bundle(tmp_path, [
+        ("msa.pdf", master), ("SCHEDULE-1.PDF", schedule), ("broken.pdf", b"%PDF-1.4 not really"),
+    ])
+
+    assert status == 200
+    msa, schedule_1, broken = body["documents"]
+    assert (msa["filename"], schedule_1["filename"], broken["filename"]) == ("msa.pdf", "SCHEDULE-1.PDF", "broken.pdf")
+    assert "error" in broken and "error" not in schedule_1
+    assert body["bundle"]["failed"] == 1
+    assert body["bundle"]["total_clauses"] == msa["summary"]["total_clauses"] + schedule_1["summary"]["total_clauses"]
+    # Both documents' clauses went through the classifier in one call
+    assert calls == [body["bundle"]["total_clauses"]]
+    assert set(body["bundle"]["missing_clauses"]) <= set(msa["summary"]["missing_clauses"])
+
+
+def test_batch_accepts_a_zip_of_pdfs_and_projects_fields(tmp_path):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("bundle/msa.pdf", build_contract(1, "pdf", seed=21))
+        zf.writestr("bundle/schedule-a.pdf", build_contract(1, "pdf", seed=22))
+        zf.writestr("bundle/cover-letter.txt", "Please find attached.")
+        zf.writestr("__MACOSX/bundle/._msa.pdf", b"resource fork")
+    status, body, calls = post_bundle(tmp_path, [("bundle.zip", archive.getvalue())], query="?fields=type,risk")
+
+    assert status == 200
+    assert [doc["filename"] for doc in body["documents"]] == ["bundle/msa.pdf", "bundle/schedule-a.pdf"]
+    assert len(calls) == 1
+    assert all(set(record) == {"type", "risk"} for doc in body["documents"] for record in doc["details"])
@@ -0,0 +1,93 @@
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from benchmarks.synthetic import build_contract
+from legal_doc_analyzer.bulk import RunStats, collect, iter_documents, load_checkpoint
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_iter_documents_walks_supported_files_in_stable_order(tmp_path):
+    for name in ("b.pdf", "a.DOCX", "notes.txt", "sub/c.pdf"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_bytes(b"x")
+    paths = [os.path.relpath(p, tmp_path) for p in iter_documents(str(tmp_path))]
+    assert paths == ["a.DOCX", "b.pdf", os.path.join("sub", "c.pdf")]
+
+
+def test_checkpoint_drops_torn_last_line(tmp_path):
+    output = tmp_path / "out.jsonl"
+    good = json.dumps({"path": "a.pdf", "status": "ok"}) + "\n"
+    failed = json.dumps({"path": "b.pdf", "status": "error"}) + "\n"
+    output.write_text(good + failed + '{"path": "c.pd')
+
+    assert load_checkpoint(str(output)) == {"a.pdf", "b.pdf"}
+    assert output.read_text() == good + failed
+    assert load_checkpoint(str(output), retry_failed=True) == {"a.pdf"}
+    assert output.read_text() == good  # the retry's record will be the only one for b.pdf
+
+
+def test_dead_worker_is_recorded_and_the_pool_replaced(tmp_path):
+    def new_pool():
+        return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+    pool = new_pool()
+    in_flight = {pool.submit(os._exit, 1): str(tmp_path / "crash.pdf")}
+    in_flight[pool.submit(abs, 1)] = str(tmp_path / "queued.pdf")
+    stats = RunStats()
+    with open(tmp_path / "out.jsonl", "w") as out:
+        replacement = collect(pool, new_pool, in_flight, str(tmp_path), out, stats)
+    try:
+        assert replacement is not pool and replacement.submit(abs, -2).result() == 2
+    finally:
+        replacement.shutdown()
+
+    records = [json.loads(line) for line in (tmp_path / "out.jsonl").read_text().splitlines()]
+    assert sorted(r["path"] for r in records) == ["crash.pdf", "queued.pdf"]
+    assert all(r["status"] == "error" and r["error"].startswith("BrokenProcessPool") for r in records)
+    assert not in_flight and stats.failed == 2
+
+
+def test_bulk_run_writes_jsonl_and_resumes(tmp_path):
+    pytest.importorskip("fastapi")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "one.pdf").write_bytes(build_contract(1, "pdf", seed=1))
+    (docs / "two.docx").write_bytes(build_contract(1, "docx", seed=2))
+    (docs / "broken.pdf").write_bytes(b"not a pdf")
+    output = tmp_path / "out.jsonl"
+
+    env = {
+        **os.environ,
+        "PYTHONPATH": ROOT,
+        "HF_HUB_OFFLINE": "1",
+        "LLM_CACHE_PATH": "",
+        "CLAUSE_MEMO_PATH": "",
+        "UPLOAD_STORAGE_DIR": str(tmp_path / "uploads"),
+    }
+    env.pop("OPENAI_API_KEY", None)
+
+    def run_cli():
+        result = subprocess.run(
+            [sys.executable, "-m", "legal_doc_analyzer.bulk", str(docs), "-o", str(output), "--workers", "1"],
+            cwd=tmp_path, env=env, capture_output=True, text=True, timeout=300,
+        )
+        return result.returncode, json.loads(result.stdout)
+
+    code, report = run_cli()
+    records = {r["path"]: r for r in map(json.loads, output.read_text().splitlines())}
+    assert code == 1  # one document failed
+    assert (report["ok"], report["failed"], report["skipped"]) == (2, 1, 0)
+    assert records["broken.pdf"]["status"] == "error"
+    assert records["one.pdf"]["result"]["summary"]["total_clauses"] > 0
+    assert "parse" in records["one.pdf"]["timings"] and "parse" in report["stages"]
+
+    code, report = run_cli()
+    assert (report["documents"], report["skipped"]) == (0, 3)
+    assert len(output.read_text().splitlines()) == 3
@@ -0,0 +1,120 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from legal_doc_analyzer.agents.classifier_agent import ClauseClassifierAgent
+from legal_doc_analyzer.utils.inference_backends import TorchBackend
+
+WORDS = ["the", "supplier", "shall", "indemnify", "client", "against", "all", "losses", "liability", "notice"]
+
+
+class CountingBackend(TorchBackend):
+    def __init__(self, model):
+        super().__init__(model)
+        self.batches = []
+
+    def run(self, inputs, with_hidden=False):
+        self.batches.append(inputs["input_ids"].shape)
+        return super().run(inputs, with_hidden=with_hidden)
+
+
+@pytest.fixture
+def agent(tmp_path):
+    # A tiny BERT with a 64-token input and a word-level vocabulary: no downloads
+    vocab = tmp_path / "vocab.txt"
+    vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *WORDS]))
+    torch.manual_seed(0)
+    config = transformers.BertConfig(
+        vocab_size=len(WORDS) + 5, hidden_size=32, num_hidden_layers=1, num_attention_heads=2,
+        intermediate_size=64, max_position_embeddings=64, num_labels=7,
+    )
+    agent = ClauseClassifierAgent(batch_size=16, window_stride=16)
+    agent.tokenizer = transformers.BertTokenizerFast(str(vocab))
+    agent.config = config
+    agent.inference = CountingBackend(transformers.BertForSequenceClassification(config).eval())
+    agent._use_transformer = agent._loaded = True
+    return agent
+
+
+def clause(words):
+    return " ".join(WORDS[i % len(WORDS)] for i in range(words))
+
+
+def test_long_clauses_are_split_into_overlapping_windows(agent):
+    windows, owners = agent._windows([clause(10), clause(150)])
+    assert owners == [0, 1, 1, 1]  # 62 tokens per window, starting at 0, 46 and 92
+    assert all(len(w["input_ids"]) <= 64 for w in windows)
+    ids = [w["input_ids"][1:-1] for w in windows[1:]]
+    assert ids[0][-16:] == ids[1][:16]  # consecutive windows share the stride
+    assert sum(len(w) for w in ids) - 16 * (len(ids) - 1) == 150  # every token is covered
+
+
+def test_windows_of_every_clause_share_forward_passes(agent):
+    clauses = [clause(10), clause(150), clause(40), clause(300)]
+    labels, confidences, embeddings = agent.score_batch(clauses, with_embeddings=True)
+
+    windows, _ = agent._windows(clauses)
+    assert len(windows) > len(agent.inference.batches) == 1
+    assert len(labels) == len(confidences) == len(clauses) and embeddings.shape == (4, 32)
+    assert all(1 / 7 <= confidence <= 1 for confidence in confidences)
+
+
+def test_long_clause_label_aggregates_its_windows(agent):
+    long_clause = clause(150)
+    windows, _ = agent._windows([long_clause])
+    # Reference: each window on its own, probabilities averaged by window length
+    votes, weights = np.zeros(7), 0
+    for window in windows:
+        inputs = agent.tokenizer.pad([window], return_tensors="np")
+        logits = agent.inference.run(dict(inputs))[0][0]
+        votes += np.exp(logits) / np.exp(logits).sum() * len(window["input_ids"])
+        weights += len(window["input_ids"])
+
+    labels, confidences, _ = agent.score_batch([long_clause])
+    assert labels == [agent.label_map[int(votes.argmax())]]
+    assert confidences[0] == pytest.approx(votes.max() / weights, abs=1e-4)
+
+
+def test_short_clauses_match_a_single_truncated_pass(agent):
+    inputs = agent.tokenizer(["the supplier shall indemnify the client"], return_tensors="np")
+    logits = agent.inference.run(dict(inputs))[0]
+    assert agent.classify_batch(["the supplier shall indemnify the client"]) == [agent.label_map[int(logits.argmax())]]
+
+
+class TokenSumBackend:
+    """Stub whose label depends only on a row's tokens, so any reordering shows up."""
+
+    name = "stub"
+
+    def __init__(self):
+        self.batches = []
+
+    def run(self, inputs, with_hidden=False):
+        self.batches.append(inputs["input_ids"].shape)
+        labels = (inputs["input_ids"] * inputs["attention_mask"]).sum(axis=1) % 7
+        return np.eye(7)[labels] * 5, None
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 4, 7])
+def test_bucketed_batches_return_labels_in_input_order(agent, batch_size):
+    agent.inference = TokenSumBackend()
+    rng = np.random.RandomState(batch_size)
+    clauses = [" ".join(rng.choice(WORDS, size=n)) for n in rng.randint(2, 40, size=11)]
+    expected = [agent.classify(text) for text in clauses]
+    assert len(set(expected)) > 2
+    agent.inference.batches.clear()
+
+    assert agent.classify_batch(clauses, batch_size=batch_size) == expected
+    shapes = agent.inference.batches
+    assert len(shapes) == -(-len(clauses) // batch_size)
+    assert all(rows <= batch_size for rows, _ in shapes)
+    assert [width for _, width in shapes] == sorted(width for _, width in shapes)  # length-bucketed
+
+
+def test_heuristics_have_no_confidence():
+    agent = ClauseClassifierAgent()
+    agent._loaded = True  # never tries to load LegalBERT
+    labels, confidences, embeddings = agent.score_batch(["Either party may give notice of termination."])
+    assert labels == ["termination"] and confidences == [None] and embeddings is None
@@ -0,0 +1,65 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from legal_doc_analyzer.utils.clause_alignment import ClauseAligner
+
+DOC1 = [
+    "Termination. Either party may terminate this Agreement on thirty days notice.",
+    "Payment. The Client shall pay each invoice within 30 days of receipt.",
+    "Governing Law. This Agreement is governed by the laws of England.",
+]
+DOC2 = [
+    "Payment. The Client shall pay each invoice within 45 days of receipt.",
+    "Termination.  Either party may terminate this Agreement on thirty days notice.",
+    "Force Majeure. Neither party is liable for events beyond its control.",
+]
+
+
+def test_classifies_matched_modified_removed_added():
+    result = ClauseAligner().align(DOC1, DOC2)
+
+    assert [(m["doc1_index"], m["doc2_index"]) for m in result["matched"]] == [(0, 1)]
+    assert [(m["doc1_index"], m["doc2_index"]) for m in result["modified"]] == [(1, 0)]
+    assert [r["doc1_index"] for r in result["removed"]] == [2]
+    assert [a["doc2_index"] for a in result["added"]] == [2]
+
+
+def test_modified_pairs_carry_a_word_diff():
+    (pair,) = ClauseAligner().align(DOC1, DOC2)["modified"]
+    changes = [op for op in pair["diff"] if op["op"] != "equal"]
+    assert changes == [{"op": "delete", "text": "30"}, {"op": "insert", "text": "45"}]
+    assert 0.5 <= pair["similarity"] < 1.0
+
+
+def test_duplicate_clauses_pair_one_to_one():
+    result = ClauseAligner().align(["Same clause."] * 2, ["Same clause."])
+    assert result["stats"] == {"matched": 1, "modified": 0, "removed": 1, "added": 0}
+
+
+def test_scales_to_thousands_of_clauses():
+    doc1 = [f"Clause {i}. The Supplier shall deliver item {i} to warehouse {i % 7} by day {i % 30}." for i in range(3000)]
+    doc2 = [c.replace("deliver", "ship") if i % 10 == 0 else c for i, c in enumerate(doc1)]
+    stats = ClauseAligner().align(doc1, doc2)["stats"]
+    assert stats["matched"] == 2700
+    assert stats["modified"] == 300
+
+
+@pytest.mark.parametrize("edited", [
+    "Payment. The Client shall pay €1.000 within 30 days of receipt.",
+    "Payment. The Client Shall pay $1,000 within 30 days of receipt.",
+    "Payment. The Client shall pay $1,000 within 30 days of receipt;",
+])
+def test_case_and_punctuation_edits_are_modifications(edited):
+    original = "Payment. The Client shall pay $1,000 within 30 days of receipt."
+    result = ClauseAligner().align([original], [edited])
+
+    assert result["stats"]["matched"] == 0
+    (pair,) = result["modified"]
+    assert pair["similarity"] < 1.0
+    assert any(op["op"] != "equal" for op in pair["diff"])
+
+
+def test_whitespace_only_changes_still_match():
+    result = ClauseAligner().align(["The Client shall\npay."], ["The  Client shall pay."])
+    assert result["stats"]["matched"] == 1
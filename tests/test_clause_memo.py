@@ -0,0 +1,103 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from legal_doc_analyzer.utils.clause_memo import ClauseMemo
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_keys_ignore_line_wrapping_but_not_wording_or_version():
+    key = ClauseMemo.make_key("Either party may\nterminate  this Agreement.", "v1")
+    assert key == ClauseMemo.make_key("Either party may terminate this Agreement.", "v1")
+    assert key != ClauseMemo.make_key("Either party may terminate this Contract.", "v1")
+    assert key != ClauseMemo.make_key("Either party may terminate this Agreement.", "v2")
+
+
+def test_get_many_returns_only_stored_entries(tmp_path):
+    memo = ClauseMemo(str(tmp_path / "memo.db"))
+    result = {"clause": "a", "type": "termination", "summary": "s", "risk": "✅ Safe", "obligations": []}
+    memo.set_many([("k1", result, None), ("k2", dict(result, clause="b"), np.arange(4, dtype=np.float32))])
+
+    found = memo.get_many(["k1", "k2", "k3"])
+    assert set(found) == {"k1", "k2"}
+    assert found["k1"] == (result, None)
+    assert found["k2"][1].tolist() == [0, 1, 2, 3]
+    assert memo.stats()["hits"] == 2 and memo.stats()["misses"] == 1
+
+    # Indexing needs embeddings; entries without one must be recomputed
+    assert set(memo.get_many(["k1", "k2"], with_embeddings=True)) == {"k2"}
+
+
+def test_resaving_without_embedding_keeps_the_stored_one(tmp_path):
+    memo = ClauseMemo(str(tmp_path / "memo.db"))
+    memo.set_many([("k", {"clause": "a"}, np.ones(3, dtype=np.float32))])
+    memo.set_many([("k", {"clause": "a"}, None)])
+    assert memo.get_many(["k"], with_embeddings=True)["k"][1].tolist() == [1, 1, 1]
+
+
+def test_evicts_least_recently_used(tmp_path):
+    memo = ClauseMemo(str(tmp_path / "memo.db"), max_entries=3)
+    for i in range(3):
+        memo.set_many([(f"k{i}", {"clause": str(i)}, None)])
+    memo.get_many(["k0"])
+    memo.set_many([("k3", {"clause": "3"}, None)])
+    assert set(memo.get_many(["k0", "k1", "k2", "k3"])) == {"k0", "k2", "k3"}
+
+
+def test_memo_is_opt_in(tmp_path, monkeypatch):
+    from legal_doc_analyzer.utils.clause_memo import clause_memo_from_env
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("CLAUSE_MEMO_PATH", raising=False)
+    assert clause_memo_from_env() is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_new_contract_version_only_analyzes_changed_clauses(tmp_path):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("slowapi")
+    code = (
+        "import json\n"
+        "from fastapi.testclient import TestClient\n"
+        "from benchmarks.synthetic import contract_lines, paginate, render_pdf\n"
+        "from legal_doc_analyzer.app import app, summarizer_agent\n"
+        "calls = []\n"
+        "summarize = summarizer_agent.summarize_batch\n"
+        "summarizer_agent.summarize_batch = lambda clauses: calls.append(len(clauses)) or summarize(clauses)\n"
+        "lines = contract_lines(2, seed=4)\n"
+        "edited = list(lines)\n"
+        "edited[10] = edited[10] + ' as amended'\n"
+        "with TestClient(app) as client:\n"
+        "    out = []\n"
+        "    for name, version in (('v1.pdf', lines), ('v2.pdf', edited)):\n"
+        "        files = {'file': (name, render_pdf(paginate(version)), 'application/pdf')}\n"
+        "        out.append(client.post('/results', files=files).json()['summary'])\n"
+        "print(json.dumps([out, calls]))"
+    )
+    env = {
+        **os.environ,
+        "PYTHONPATH": ROOT,
+        "MODEL_LOADING": "lazy",
+        "HF_HUB_OFFLINE": "1",
+        "ANALYSIS_DB_PATH": "",
+        "LLM_CACHE_PATH": "",
+        "CLAUSE_MEMO_PATH": str(tmp_path / "memo.db"),
+        "UPLOAD_STORAGE_DIR": str(tmp_path / "uploads"),
+        "REPORT_CACHE_DIR": str(tmp_path / "reports"),
+    }
+    env.pop("OPENAI_API_KEY", None)
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, env=env,
+        capture_output=True, text=True, timeout=300, check=True,
+    )
+    (v1, v2), calls = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert v1["reused_clauses"] == 0
+    assert v2["total_clauses"] == v1["total_clauses"]
+    assert v2["reused_clauses"] == v2["total_clauses"] - 1
+    assert calls[1] == 1
@@ -0,0 +1,137 @@
+import json
+
+import pytest
+
+from legal_doc_analyzer.services.database_service import AnalysisDatabase, risk_level
+
+
+def _analysis(n, risky_every=3):
+    details = []
+    for i in range(n):
+        risky = i % risky_every == 0
+        details.append({
+            "clause": f"Clause {i}. The Supplier shall indemnify the Client.",
+            "type": "indemnity" if risky else "payment terms",
+            "confidence": 0.875 if risky else None,
+            "summary": f"Summary {i}",
+            "risk": "⚠️ Risky" if risky else "✅ Safe",
+            "obligations": [{"text": "The Supplier shall indemnify the Client.", "start": 11, "end": 51, "triggers": ["shall"]}],
+        })
+    summary = {"total_clauses": n, "missing_clauses": ["force majeure"], "total_obligations": n}
+    return {"summary": summary, "details": details}
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = AnalysisDatabase(str(tmp_path / "analyses.db"))
+    yield db
+    db.close()
+
+
+def test_risk_level_ignores_emoji():
+    assert risk_level("❌ High Risk") == "high risk"
+    assert risk_level("⚠️ Risky") == "risky"
+
+
+def test_document_ingested_in_one_transaction(db):
+    statements = []
+    db._connection().set_trace_callback(statements.append)
+    db.save_analysis("hash-a", _analysis(500), filename="a.pdf")
+
+    assert statements.count("COMMIT") == 1
+    assert sum(s.startswith("INSERT INTO clauses") for s in statements) == 500  # one executemany
+    assert db.has_document("hash-a")
+
+
+def test_round_trip_matches_pipeline_output(db):
+    data = _analysis(4)
+    db.save_analysis("hash-a", data, filename="a.pdf")
+    stored = db.get_document("hash-a")
+
+    assert stored["filename"] == "a.pdf"
+    assert stored["summary"] == data["summary"]
+    assert stored["details"] == data["details"]
+    assert db.get_document("missing") is None
+
+
+def test_confidence_round_trips_and_old_files_are_migrated(tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "CREATE TABLE clauses (id INTEGER PRIMARY KEY, document_id INTEGER NOT NULL, "
+        "clause_index INTEGER NOT NULL, text TEXT NOT NULL, type TEXT NOT NULL, summary TEXT, "
+        "risk TEXT NOT NULL, risk_level TEXT NOT NULL);"
+    )
+    conn.close()
+
+    db = AnalysisDatabase(path)
+    try:
+        db.save_analysis("hash-a", _analysis(3))
+        assert [c["confidence"] for c in db.get_document("hash-a")["details"]] == [0.875, None, None]
+        assert [c["confidence"] for c in db.query_clauses(doc_hash="hash-a")["items"]] == [0.875, None, None]
+    finally:
+        db.close()
+
+
+def test_reanalysis_replaces_previous_rows(db):
+    db.save_analysis("hash-a", _analysis(10))
+    db.save_analysis("hash-a", _analysis(2))
+    assert len(db.get_document("hash-a")["details"]) == 2
+    assert len(db.query_clauses(doc_hash="hash-a")["items"]) == 2
+
+
+def test_records_can_be_read_back_from_a_spool(db, tmp_path):
+    data = _analysis(3)
+    spool = tmp_path / "records.jsonl"
+    spool.write_text("".join(json.dumps(record) + "\n" for record in data["details"]))
+
+    def records():
+        with open(spool) as f:
+            yield from map(json.loads, f)
+
+    db.save_records("hash-a", {"missing_clauses": []}, records, filename="a.pdf")
+    stored = db.get_document("hash-a")
+    assert stored["details"] == data["details"]
+    assert stored["summary"]["total_clauses"] == 3
+    assert stored["summary"]["total_obligations"] == 3
+
+
+def test_query_clauses_filters_across_documents_and_paginates(db):
+    db.save_analysis("hash-a", _analysis(9), filename="a.pdf")
+    db.save_analysis("hash-b", _analysis(9), filename="b.pdf")
+
+    seen = []
+    cursor = None
+    while True:
+        page = db.query_clauses(clause_type="indemnity", risk="Risky", limit=2, cursor=cursor)
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 6
+    assert {item["filename"] for item in seen} == {"a.pdf", "b.pdf"}
+    assert all(item["type"] == "indemnity" and item["risk"] == "⚠️ Risky" for item in seen)
+    assert len({item["id"] for item in seen}) == 6
+
+
+def test_list_documents_newest_first(db):
+    for name in ("a", "b", "c"):
+        db.save_analysis(f"hash-{name}", _analysis(1), filename=f"{name}.pdf")
+
+    first = db.list_documents(limit=2)
+    assert [d["filename"] for d in first["items"]] == ["c.pdf", "b.pdf"]
+    rest = db.list_documents(limit=2, cursor=first["next_cursor"])
+    assert [d["filename"] for d in rest["items"]] == ["a.pdf"]
+    assert rest["next_cursor"] is None
+
+
+def test_database_is_opt_in(tmp_path, monkeypatch):
+    from legal_doc_analyzer.services.database_service import database_from_env
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("ANALYSIS_DB_PATH", raising=False)
+    assert database_from_env() is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,86 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+from legal_doc_analyzer.utils.inference_backends import (
+    OnnxBackend,
+    TorchBackend,
+    export_onnx,
+    load_backend,
+    model_revision,
+    onnx_paths,
+    quantize_onnx,
+)
+
+
+@pytest.fixture(scope="module")
+def tiny_model():
+    torch.manual_seed(0)
+    config = transformers.BertConfig(
+        vocab_size=500, hidden_size=64, num_hidden_layers=2, num_attention_heads=4,
+        intermediate_size=128, num_labels=7,
+    )
+    return transformers.BertForSequenceClassification(config).eval()
+
+
+def _batch(n=64, length=24, seed=0):
+    rng = np.random.RandomState(seed)
+    lengths = rng.randint(4, length + 1, size=n)
+    ids = rng.randint(5, 500, size=(n, length))
+    mask = (np.arange(length)[None, :] < lengths[:, None]).astype(np.int64)
+    return {"input_ids": ids * mask, "attention_mask": mask, "token_type_ids": np.zeros_like(ids)}
+
+
+def test_onnx_matches_torch(tiny_model, tmp_path):
+    path = export_onnx(tiny_model, str(tmp_path / "model.onnx"))
+    inputs = _batch()
+    torch_logits, torch_hidden = TorchBackend(tiny_model).run(inputs, with_hidden=True)
+    onnx_logits, onnx_hidden = OnnxBackend(path).run(inputs, with_hidden=True)
+
+    np.testing.assert_allclose(onnx_logits, torch_logits, atol=1e-4)
+    np.testing.assert_allclose(onnx_hidden, torch_hidden, atol=1e-3)
+
+
+def test_int8_labels_agree_with_torch(tiny_model, tmp_path):
+    fp32 = export_onnx(tiny_model, str(tmp_path / "model.onnx"))
+    int8 = quantize_onnx(fp32, str(tmp_path / "model-int8.onnx"))
+    inputs = _batch(n=256)
+    torch_labels = TorchBackend(tiny_model).run(inputs)[0].argmax(axis=1)
+    int8_labels = OnnxBackend(int8).run(inputs)[0].argmax(axis=1)
+
+    assert (torch_labels == int8_labels).mean() >= 0.9
+
+
+def test_load_backend_falls_back_to_torch(tiny_model, tmp_path):
+    blocked = tmp_path / "not-a-directory"
+    blocked.write_text("")  # the ONNX export cannot be written here
+
+    backend = load_backend("onnx-int8", "tiny", 7, lambda: tiny_model, cache_dir=str(blocked))
+    assert backend.name == "torch"
+
+
+def test_cached_onnx_model_skips_torch_load(tiny_model, tmp_path):
+    load_backend("onnx", "tiny", 7, lambda: tiny_model, cache_dir=str(tmp_path))
+
+    def must_not_load():
+        raise AssertionError("torch weights loaded despite a cached export")
+
+    assert load_backend("onnx", "tiny", 7, must_not_load, cache_dir=str(tmp_path)).name == "onnx"
+
+
+def test_new_weights_get_a_new_export(tiny_model, tmp_path):
+    checkpoint = tmp_path / "checkpoint"
+    tiny_model.save_pretrained(str(checkpoint))
+    config = transformers.AutoConfig.from_pretrained(str(checkpoint))
+    before = model_revision(config)
+    assert model_revision(config) == before
+
+    weights = next(p for p in checkpoint.iterdir() if p.name != "config.json")
+    weights.write_bytes(weights.read_bytes() + b"\0")
+    after = model_revision(config)
+    assert after != before
+    assert onnx_paths("tiny", 7, str(tmp_path), before) != onnx_paths("tiny", 7, str(tmp_path), after)
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from legal_doc_analyzer.services.job_service import JobManager, QueueFullError
+
+
+def wait_for(manager, job_id, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get_job(job_id)
+        if job["status"] in ("completed", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_job_reports_progress_and_result():
+    manager = JobManager(max_workers=1, max_queue=1)
+
+    def work(n, progress=None):
+        for i in range(n):
+            progress(i + 1, n)
+        return n * 2
+
+    job = wait_for(manager, manager.submit_job(work, 3, track_progress=True))
+    assert job["status"] == "completed"
+    assert job["progress"] == 1.0
+    assert job["result"] == 6
+    manager.shutdown()
+
+
+def test_failed_job_reports_error_type_but_not_details(caplog):
+    manager = JobManager(max_workers=1, max_queue=1)
+
+    def boom():
+        raise RuntimeError("cannot open /srv/uploads/secret.pdf")
+
+    with caplog.at_level("ERROR", logger="JobService"):
+        job = wait_for(manager, manager.submit_job(boom))
+    assert job["status"] == "failed"
+    assert (job["error"], job["error_type"]) == ("Analysis failed", "RuntimeError")
+    assert "secret.pdf" not in str(job)
+    assert "secret.pdf" in caplog.text  # logged server-side
+    manager.shutdown()
+
+
+def test_queue_rejects_work_beyond_capacity():
+    manager = JobManager(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    manager.submit_job(release.wait)
+    manager.submit_job(release.wait)
+    with pytest.raises(QueueFullError):
+        manager.submit_job(release.wait)
+
+    release.set()
+    manager.shutdown()
+    assert manager.queue_depth == 0
+
+
+def test_run_does_not_block_event_loop():
+    manager = JobManager(max_workers=2, max_queue=0)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        result = await manager.run(time.sleep, 0.2)
+        task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(main())
+    assert result is None
+    assert ticks > 5
+    manager.shutdown()
+
+
+def test_stream_yields_items_in_order_and_propagates_errors():
+    manager = JobManager(max_workers=1, max_queue=1)
+
+    def numbers(n):
+        for i in range(n):
+            yield i
+        raise ValueError("truncated")
+
+    async def main():
+        received = []
+        with pytest.raises(ValueError):
+            async for item in manager.stream(numbers, 3):
+                received.append(item)
+        return received
+
+    assert asyncio.run(main()) == [0, 1, 2]
+    manager.shutdown()
+    assert manager.queue_depth == 0
+
+
+def test_on_done_runs_after_jobs_and_streams_finish():
+    manager = JobManager(max_workers=1, max_queue=1)
+    done = []
+
+    def numbers(n):
+        yield from range(n)
+        assert not done  # the stream's resources are still held while it runs
+
+    job_done = threading.Event()
+    job = wait_for(manager, manager.submit_job(lambda: 1, on_done=job_done.set))
+    assert job["status"] == "completed" and job_done.wait(5)
+
+    async def main():
+        return [item async for item in manager.stream(numbers, 2, on_done=lambda: done.append("stream"))]
+
+    assert asyncio.run(main()) == [0, 1]
+    assert done == ["stream"]
+    manager.shutdown()
@@ -0,0 +1,39 @@
+import random
+
+from legal_doc_analyzer.agents.missing_clause_detector import MissingClauseDetectorAgent
+from legal_doc_analyzer.agents.risk_analyzer_agent import RiskAnalyzerAgent
+from legal_doc_analyzer.utils.keyword_matcher import KeywordMatcher
+
+
+def test_finds_overlapping_and_nested_keywords():
+    matcher = KeywordMatcher(["termination", "termination without cause", "cause", "law", "Governing Law"])
+    hits = matcher.scan("TERMINATION WITHOUT CAUSE is governed by the governing law.")
+    assert hits == {"termination", "termination without cause", "cause", "law", "governing law"}
+
+
+def test_matches_naive_substring_semantics():
+    rng = random.Random(7)
+    alphabet = "abc -"
+    for _ in range(200):
+        keywords = {"".join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(rng.randint(1, 12))}
+        text = "".join(rng.choices(alphabet + "ABC", k=rng.randint(0, 40)))
+        expected = {k for k in keywords if k in text.lower()}
+        assert KeywordMatcher(keywords).scan(text) == expected
+
+
+def test_empty_inputs():
+    assert KeywordMatcher([]).scan("anything") == frozenset()
+    assert KeywordMatcher(["x"]).scan("") == frozenset()
+
+
+def test_agents_read_answers_from_shared_hits():
+    risk = RiskAnalyzerAgent()
+    missing = MissingClauseDetectorAgent()
+    shared = KeywordMatcher(risk.keywords() | missing.keywords())
+
+    clauses = ["The Supplier shall indemnify the Client.", "Confidentiality and governing law apply."]
+    hits = shared.scan_many(clauses)
+
+    assert [risk.analyze(c, hits=h) for c, h in zip(clauses, hits)] == [risk.analyze(c) for c in clauses]
+    assert missing.detect(clauses, hits=hits) == missing.detect(clauses)
+    assert "confidentiality" not in missing.detect(clauses)
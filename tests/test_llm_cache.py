@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from legal_doc_analyzer.utils.llm_cache import LLMCache
+
+MESSAGES = [{"role": "user", "content": "Summarize:\n\nThe  Supplier shall\npay."}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.db"), max_entries=3)
+    yield cache
+    cache.close()
+
+
+def test_key_normalizes_whitespace_but_not_parameters():
+    key = LLMCache.make_key(MESSAGES, "gpt-4", 0.3, 100)
+    reflowed = [{"role": "user", "content": "Summarize: The Supplier shall pay."}]
+    assert key == LLMCache.make_key(reflowed, "gpt-4", 0.3, 100)
+    assert key != LLMCache.make_key(MESSAGES, "gpt-4o", 0.3, 100)
+    assert key != LLMCache.make_key(MESSAGES, "gpt-4", 0.0, 100)
+    assert key != LLMCache.make_key(MESSAGES, "gpt-4", 0.3, 300)
+
+
+def test_hit_rate_and_tokens_saved(cache):
+    cache.set("k", "gpt-4", "A summary.", tokens=42)
+    assert cache.get("k") == "A summary."
+    assert cache.get("missing") is None
+
+    stats = cache.stats()
+    assert stats["hit_rate"] == 0.5
+    assert stats["tokens_saved"] == 42
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = LLMCache(str(tmp_path / "llm.db"), ttl_seconds=0.01)
+    cache.set("k", "gpt-4", "stale")
+    time.sleep(0.02)
+    assert cache.get("k") is None
+    cache.close()
+
+
+def test_evicts_least_recently_used(cache):
+    for key in ("a", "b", "c"):
+        cache.set(key, "gpt-4", key)
+        time.sleep(0.01)
+    cache.get("a")
+    cache.set("d", "gpt-4", "d")
+
+    assert cache.stats()["entries"] == 3
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "llm.db")
+    first = LLMCache(path)
+    first.set("k", "gpt-4", "kept")
+    first.close()
+
+    second = LLMCache(path)
+    assert second.get("k") == "kept"
+    second.close()
+
+
+def test_cache_is_opt_in(tmp_path, monkeypatch):
+    from legal_doc_analyzer.utils.llm_cache import cache_from_env
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("LLM_CACHE_PATH", raising=False)
+    assert cache_from_env() is None
+    assert list(tmp_path.iterdir()) == []
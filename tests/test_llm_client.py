@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("openai")
+
+from legal_doc_analyzer.utils.fake_llm_server import run_fake_llm_server
+from legal_doc_analyzer.utils.llm_client import AsyncLLMClient, LLMError
+
+
+def messages(i):
+    return [{"role": "user", "content": f"Summarize clause {i}"}]
+
+
+def test_fan_out_is_bounded_by_concurrency_cap():
+    with run_fake_llm_server(latency=0.2) as server:
+        client = AsyncLLMClient(api_key="fake", base_url=server.base_url, max_concurrency=5)
+        try:
+            start = time.perf_counter()
+            results = client.complete_many([messages(i) for i in range(20)])
+            elapsed = time.perf_counter() - start
+        finally:
+            client.close()
+
+    assert results == [f"Summary: Summarize clause {i}" for i in range(20)]
+    assert server.max_in_flight <= 5
+    # 20 calls / 5 in flight = 4 rounds of 0.2s, far below 20 sequential calls
+    assert elapsed < 2.0
+
+
+def test_retries_transient_failures():
+    with run_fake_llm_server(latency=0.0, failure_rate=0.5) as server:
+        client = AsyncLLMClient(
+            api_key="fake", base_url=server.base_url, max_retries=8, backoff_base=0.001
+        )
+        try:
+            results = client.complete_many([messages(i) for i in range(10)])
+        finally:
+            client.close()
+
+    assert all(result is not None for result in results)
+
+
+def test_timeout_raises_llm_error():
+    with run_fake_llm_server(latency=1.0) as server:
+        client = AsyncLLMClient(api_key="fake", base_url=server.base_url, timeout=0.1, max_retries=0)
+        try:
+            with pytest.raises(LLMError):
+                client.complete(messages(0))
+        finally:
+            client.close()
+
+
+def test_async_entry_point_from_foreign_loop():
+    with run_fake_llm_server(latency=0.0) as server:
+        client = AsyncLLMClient(api_key="fake", base_url=server.base_url)
+        try:
+            result = asyncio.run(client.acomplete(messages(7)))
+        finally:
+            client.close()
+
+    assert result == "Summary: Summarize clause 7"
+
+
+def test_cached_responses_skip_the_server(tmp_path):
+    from legal_doc_analyzer.utils.llm_cache import LLMCache
+
+    cache = LLMCache(str(tmp_path / "llm.db"))
+    with run_fake_llm_server(latency=0.0) as server:
+        client = AsyncLLMClient(api_key="fake", base_url=server.base_url, cache=cache)
+        try:
+            first = client.complete_many([messages(1), messages(1), messages(2)])
+            second = client.complete_many([messages(1), messages(2)])
+        finally:
+            client.close()
+
+    assert first == [first[0], first[0], first[2]]
+    assert second == [first[0], first[2]]
+    assert server.requests_served == 2
+    assert cache.stats()["tokens_saved"] > 0
+    cache.close()
+
+
+def test_cache_io_runs_off_the_event_loop(tmp_path):
+    from legal_doc_analyzer.utils.llm_cache import LLMCache
+
+    class RecordingCache(LLMCache):
+        threads = set()
+
+        def get(self, key):
+            self.threads.add(threading.current_thread().name)
+            return super().get(key)
+
+        def set(self, *args, **kwargs):
+            self.threads.add(threading.current_thread().name)
+            return super().set(*args, **kwargs)
+
+    cache = RecordingCache(str(tmp_path / "llm.db"))
+    with run_fake_llm_server(latency=0.0) as server:
+        client = AsyncLLMClient(api_key="fake", base_url=server.base_url, cache=cache)
+        try:
+            client.complete_many([messages(i) for i in range(4)])
+            client.complete_many([messages(i) for i in range(4)])
+        finally:
+            client.close()
+
+    assert RecordingCache.threads and "llm-client" not in RecordingCache.threads
+    assert cache.stats()["hits"] == 4
+    cache.close()
@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from legal_doc_analyzer.utils.logger import StructuredFormatter
+from legal_doc_analyzer.utils.metrics import Counter, Gauge, Histogram, MetricsRegistry, StageTimer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Latency.", ["stage"], buckets=(0.1, 1))
+    histogram.observe(0.05, stage="parse")
+    histogram.observe(0.5, stage="parse")
+    histogram.observe(5, stage="parse")
+
+    lines = histogram.render().splitlines()
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{stage="parse",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{stage="parse",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{stage="parse",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{stage="parse"} 3' in lines
+    assert 'latency_seconds_sum{stage="parse"} 5.55' in lines
+
+
+def test_registry_renders_counters_and_scrape_time_gauges():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("uploads_total", "Uploads.", ["kind"]))
+    counter.inc(kind="pdf")
+    counter.inc(2, kind="pdf")
+    registry.register(Gauge("queue_depth", "Depth.", lambda: {("analysis",): 3}, ["pool"]))
+
+    text = registry.render()
+    assert 'uploads_total{kind="pdf"} 3' in text
+    assert 'queue_depth{pool="analysis"} 3' in text
+    with pytest.raises(ValueError):
+        registry.register(Counter("uploads_total", "Again."))
+    with pytest.raises(ValueError):
+        counter.inc(wrong="label")
+
+
+def test_stage_timer_accumulates_and_records_once():
+    histogram = Histogram("stages", "Stages.", ["stage"])
+    timer = StageTimer()
+    for _ in range(3):
+        with timer.stage("classify"):
+            pass
+    breakdown = timer.finish(histogram)
+    timer.finish(histogram)
+
+    assert set(breakdown) == {"classify", "total"}
+    assert histogram.count(stage="classify") == 1
+
+
+def test_stage_timer_times_lazy_stages_without_double_counting():
+    timer = StageTimer()
+
+    def pages():
+        for page in ("a", "b"):
+            time.sleep(0.02)
+            yield page
+
+    assert list(timer.iterate("segment", timer.iterate("parse", pages()))) == ["a", "b"]
+    assert timer.timings["parse"] >= 0.04
+    assert timer.timings["segment"] < 0.02
+
+
+def test_structured_formatter_emits_fields():
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, "done %s", ("ok",), None)
+    record.fields = {"timings": {"parse": 0.1}}
+
+    payload = json.loads(StructuredFormatter(json_output=True).format(record))
+    assert payload["message"] == "done ok"
+    assert payload["timings"] == {"parse": 0.1}
+    assert StructuredFormatter().format(record).endswith('{"timings": {"parse": 0.1}}')
+
+
+def test_metrics_endpoint_reports_stages_after_analysis(tmp_path):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("slowapi")
+    code = (
+        "from fastapi.testclient import TestClient\n"
+        "from benchmarks.synthetic import build_contract\n"
+        "from legal_doc_analyzer import app as app_module\n"
+        "from legal_doc_analyzer.app import app\n"
+        "with TestClient(app) as client:\n"
+        "    pdf = build_contract(2, 'pdf', seed=1)\n"
+        "    assert client.post('/results', files={'file': ('c.pdf', pdf, 'application/pdf')}).status_code == 200\n"
+        "    def walk():\n"
+        "        raise AssertionError('scrape walked a cache directory')\n"
+        "    app_module.analysis_cache.stats = app_module.report_renderer.stats = walk\n"
+        "    print(client.get('/metrics').text)"
+    )
+    env = {
+        **os.environ,
+        "PYTHONPATH": ROOT,
+        "MODEL_LOADING": "lazy",
+        "HF_HUB_OFFLINE": "1",
+        "ANALYSIS_DB_PATH": "",
+        "LLM_CACHE_PATH": "",
+        "UPLOAD_STORAGE_DIR": str(tmp_path / "uploads"),
+        "REPORT_CACHE_DIR": str(tmp_path / "reports"),
+    }
+    env.pop("OPENAI_API_KEY", None)
+    text = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, env=env,
+        capture_output=True, text=True, timeout=300, check=True,
+    ).stdout
+
+    assert 'legal_doc_stage_seconds_count{stage="parse"} 1' in text
+    assert 'legal_doc_stage_seconds_count{stage="summarize"} 1' in text
+    assert "legal_doc_document_pages_count 1" in text
+    assert 'legal_doc_request_seconds_count{method="POST",route="/results",status="200"} 1' in text
+    assert 'legal_doc_queue_depth{pool="analysis"} 0' in text
+    assert 'legal_doc_cache_misses_total{cache="analysis"} 1' in text
+    assert 'legal_doc_cache_misses_total{cache="analysis"} 1' in text
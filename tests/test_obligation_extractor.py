@@ -0,0 +1,34 @@
+from legal_doc_analyzer.agents.obligation_extractor import ObligationExtractorAgent
+
+CLAUSE = (
+    "Payment Terms. The Client shall pay and must not withhold any invoice. "
+    "The Supplier agrees to\nprovide receipts. Fees are non-refundable. "
+    "Disputes will be settled by arbitration"
+)
+
+
+def test_each_sentence_reported_once_with_all_triggers():
+    obligations = ObligationExtractorAgent().extract(CLAUSE)
+
+    assert [ob["text"] for ob in obligations] == [
+        "The Client shall pay and must not withhold any invoice.",
+        "The Supplier agrees to\nprovide receipts.",
+        "Disputes will be settled by arbitration",
+    ]
+    assert obligations[0]["triggers"] == ["shall", "must"]
+    assert obligations[1]["triggers"] == ["agrees to"]
+
+
+def test_offsets_point_into_the_clause():
+    for ob in ObligationExtractorAgent().extract(CLAUSE):
+        assert CLAUSE[ob["start"]:ob["end"]] == ob["text"]
+
+
+def test_no_triggers_no_obligations():
+    assert ObligationExtractorAgent().extract("Fees are non-refundable. Willing parties.") == []
+
+
+def test_batch_matches_per_clause_extraction():
+    agent = ObligationExtractorAgent()
+    clauses = [CLAUSE, "Nothing here.", "Each party shall comply."]
+    assert agent.extract_batch(clauses) == [agent.extract(c) for c in clauses]
@@ -1,2 +1,52 @@
+import pytest
+
+pytest.importorskip("pdfplumber")
+
+from benchmarks.synthetic import render_pdf
+from legal_doc_analyzer.agents.parser_agent import ParserAgent
+
+PAGES = [
+    ["1. Termination. Either party may terminate on notice."],
+    [],  # image-only / blank page: pdfplumber returns None
+    ["2. Payment. The Client shall pay within 30 days."],
+    ["3. Governing Law. New York law applies."],
+]
+
+
 def test_dummy():
     assert True
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "contract.pdf"
+    path.write_bytes(render_pdf(PAGES))
+    return str(path)
+
+
+def test_serial_extraction_tolerates_blank_pages(pdf_path):
+    text = ParserAgent(max_workers=1).process(pdf_path)
+    assert text.count("\n") >= len(PAGES)
+    assert "Termination" in text and "Governing Law" in text
+
+
+def test_iter_pages_yields_each_page_in_order(pdf_path):
+    parser = ParserAgent(max_workers=1)
+    pages = list(parser.iter_pages(pdf_path))
+    assert len(pages) == parser.page_count(pdf_path) == len(PAGES)
+    assert all(page.endswith("\n") for page in pages)
+    assert "".join(pages) == parser.process(pdf_path)
+    assert "Payment" in pages[2]
+
+
+def test_parallel_extraction_matches_serial(pdf_path):
+    parallel = ParserAgent(max_workers=2, parallel_min_pages=1)
+    try:
+        assert parallel.process(pdf_path) == ParserAgent(max_workers=1).process(pdf_path)
+    finally:
+        parallel.close()
+
+
+def test_rejects_unsupported_file_type():
+    with pytest.raises(ValueError):
+        ParserAgent().process("contract.txt")
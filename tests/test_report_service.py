@@ -0,0 +1,75 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from legal_doc_analyzer.services.job_service import QueueFullError
+from legal_doc_analyzer.services.report_service import ReportRenderer
+
+DATA = {"summary": {"total_clauses": 1}, "details": [{"clause": "The Supplier shall pay.", "type": "payment terms"}]}
+RENDERS = []
+
+
+def fake_render(data, mode="single", output_path=None):
+    time.sleep(0.05)
+    RENDERS.append(mode)
+    with open(output_path, "wb") as f:
+        f.write(b"%PDF-1.4 " + repr(data).encode() * 20)
+    return output_path
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    RENDERS.clear()
+    renderer = ReportRenderer(str(tmp_path), mode="thread", render=fake_render)
+    yield renderer
+    renderer.shutdown()
+
+
+def test_same_report_renders_once(renderer):
+    first = asyncio.run(renderer.render_pdf(DATA))
+    second = asyncio.run(renderer.render_pdf(DATA))
+
+    assert first == second and RENDERS == ["single"]
+    assert renderer.stats()["hits"] == 1
+    with open(first, "rb") as f:
+        assert f.read().startswith(b"%PDF")
+
+
+def test_concurrent_requests_share_one_render(renderer):
+    async def many():
+        return await asyncio.gather(*(renderer.render_pdf(DATA) for _ in range(5)))
+
+    paths = asyncio.run(many())
+    assert len(set(paths)) == 1 and RENDERS == ["single"]
+
+
+def test_key_depends_on_data_and_mode(renderer):
+    other = {**DATA, "summary": {"total_clauses": 2}}
+    assert ReportRenderer.make_key(DATA, "single") != ReportRenderer.make_key(other, "single")
+    assert ReportRenderer.make_key(DATA, "single") != ReportRenderer.make_key(DATA, "comparison")
+
+
+def test_evicts_oldest_reports_over_budget(tmp_path):
+    renderer = ReportRenderer(str(tmp_path), max_cache_bytes=1, mode="thread", render=fake_render)
+    first = asyncio.run(renderer.render_pdf(DATA))
+    second = asyncio.run(renderer.render_pdf({**DATA, "summary": {"total_clauses": 2}}))
+    renderer.shutdown()
+
+    assert not os.path.exists(first) and os.path.exists(second)
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+def test_bounded_queue_rejects_overflow(tmp_path):
+    renderer = ReportRenderer(str(tmp_path), max_workers=1, max_queue=0, mode="thread", render=fake_render)
+
+    async def burst():
+        return await asyncio.gather(
+            *(renderer.render_pdf({"n": i}) for i in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(burst())
+    renderer.shutdown()
+    assert any(isinstance(r, QueueFullError) for r in results)
+    assert any(isinstance(r, str) for r in results)
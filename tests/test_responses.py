@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from legal_doc_analyzer.utils import responses
+from legal_doc_analyzer.utils.responses import choose_encoding, parse_fields, project_analysis
+
+RECORD = {
+    "clause": "The Client shall pay within 30 days.",
+    "type": "payment terms",
+    "summary": "Payment within 30 days.",
+    "risk": "✅ Safe",
+    "obligations": [{"text": "The Client shall pay within 30 days.", "start": 0, "end": 36, "triggers": ["shall"]}],
+}
+
+
+def test_projection_keeps_only_requested_fields_and_offsets():
+    data = {"summary": {"total_clauses": 1}, "details": [RECORD]}
+    projected = project_analysis(data, parse_fields("type, obligations.start,obligations.end"))
+    assert projected["summary"] == data["summary"]
+    assert projected["details"] == [{"type": "payment terms", "obligations": [{"start": 0, "end": 36}]}]
+    assert project_analysis(data, parse_fields("")) is data
+    # The whole field wins over a subset of it, in either order
+    assert parse_fields("obligations.start,obligations") == parse_fields("obligations,obligations.start")
+
+
+@pytest.mark.parametrize("spec", ["clause,text", "obligations.page", "type.start"])
+def test_projection_rejects_unknown_fields(spec):
+    with pytest.raises(ValueError):
+        parse_fields(spec)
+
+
+def test_fast_encoder_matches_stdlib_json():
+    data = {"summary": {"total_clauses": 1}, "details": [RECORD]}
+    assert json.loads(responses.dumps(data)) == data
+
+
+def test_accept_encoding_negotiation():
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("br, gzip") == ("br" if responses.brotli is not None else "gzip")
+
+
+def test_middleware_compresses_whole_responses_but_not_streams():
+    pytest.importorskip("fastapi")
+    from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse
+    from fastapi.testclient import TestClient
+
+    app = FastAPI(default_response_class=responses.FastJSONResponse)
+    app.add_middleware(responses.CompressionMiddleware, minimum_size=100)
+    big = {"details": [RECORD] * 50}
+
+    @app.get("/big")
+    def get_big():
+        return big
+
+    @app.get("/small")
+    def get_small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    def get_stream():
+        return StreamingResponse((json.dumps(RECORD) + "\n" for _ in range(50)), media_type="application/x-ndjson")
+
+    with TestClient(app) as client:
+        response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < len(responses.dumps(big)) / 5
+        assert response.json() == big
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/stream", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/big", headers={"Accept-Encoding": "identity"}).headers
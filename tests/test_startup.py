@@ -0,0 +1,61 @@
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("slowapi")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("torch", "transformers", "openai", "weasyprint", "pdfplumber")
+IMPORT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "3.0"))
+
+
+def _run(tmp_path, code, *flags):
+    env = {
+        **os.environ,
+        "PYTHONPATH": ROOT,
+        "MODEL_LOADING": "lazy",
+        "ANALYSIS_DB_PATH": "",
+        "LLM_CACHE_PATH": "",
+        "UPLOAD_STORAGE_DIR": str(tmp_path / "uploads"),
+    }
+    env.pop("OPENAI_API_KEY", None)
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120, check=True,
+    )
+
+
+def test_app_import_skips_heavy_backends_and_fits_budget(tmp_path):
+    code = (
+        "import sys, json, legal_doc_analyzer.app\n"
+        f"print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))"
+    )
+    result = _run(tmp_path, code, "-X", "importtime")
+
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+    cumulative = [
+        int(m.group(1))
+        for m in re.finditer(r"^import time:\s+\d+ \|\s+(\d+) \| legal_doc_analyzer\.app$", result.stderr, re.M)
+    ]
+    assert cumulative and cumulative[0] / 1e6 < IMPORT_BUDGET_SECONDS
+
+
+def test_health_is_immediate_and_ready_reports_backends(tmp_path):
+    code = (
+        "import json\n"
+        "from fastapi.testclient import TestClient\n"
+        "from legal_doc_analyzer.app import app\n"
+        "with TestClient(app) as client:\n"
+        "    print(json.dumps([client.get('/health').status_code, client.get('/ready').json()]))"
+    )
+    status, ready = json.loads(_run(tmp_path, code).stdout.strip().splitlines()[-1])
+
+    assert status == 200
+    assert ready["ready"] is True
+    assert ready["backends"]["classifier"] == "not loaded"
+    assert ready["backends"]["database"] == "disabled"
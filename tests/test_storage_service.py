@@ -0,0 +1,88 @@
+import io
+import os
+
+import pytest
+
+from legal_doc_analyzer.services.storage_service import BlobStore, InvalidUploadError
+
+
+class CountingStream(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.largest_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.largest_read = max(self.largest_read, len(chunk))
+        return chunk
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(str(tmp_path / "blobs"), max_upload_bytes=64 * 1024, chunk_size=4096)
+
+
+def test_streams_in_chunks_and_addresses_by_content(store):
+    stream = CountingStream(b"%PDF-1.4 " + b"x" * 20000)
+    blob = store.save_stream(stream)
+
+    assert stream.largest_read <= 4096
+    assert blob.size == 20009
+    assert os.path.basename(blob.path) == blob.digest + ".pdf"
+    with open(blob.path, "rb") as f:
+        assert f.read().startswith(b"%PDF-1.4")
+
+
+def test_identical_uploads_are_stored_once(store):
+    first = store.save_stream(io.BytesIO(b"%PDF-1.4 same"))
+    second = store.save_stream(io.BytesIO(b"%PDF-1.4 same"))
+    other = store.save_stream(io.BytesIO(b"%PDF-1.4 different"))
+
+    assert first == second
+    assert other.digest != first.digest
+    assert len(list(store._blobs())) == 2
+
+
+@pytest.mark.parametrize("data", [b"", b"not a pdf", b"%PDF" + b"x" * (64 * 1024)])
+def test_rejects_bad_uploads_without_leaving_files(store, data):
+    with pytest.raises(InvalidUploadError):
+        store.save_stream(io.BytesIO(data))
+    assert list(store._blobs()) == []
+    assert os.listdir(store._tmp_dir) == []
+
+
+def test_evicts_oldest_blobs_over_budget(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"), max_total_bytes=2500)
+    paths = []
+    for i in range(3):
+        blob = store.save_stream(io.BytesIO(b"%PDF" + bytes([i]) * 996))
+        os.utime(blob.path, (i, i))
+        paths.append(blob.path)
+    newest = store.save_stream(io.BytesIO(b"%PDF" + b"z" * 996))
+
+    assert not os.path.exists(paths[0]) and not os.path.exists(paths[1])
+    assert os.path.exists(paths[2]) and os.path.exists(newest.path)
+
+
+def test_leased_blobs_survive_eviction_until_released(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"), max_total_bytes=2500)
+    queued = store.save_stream(io.BytesIO(b"%PDF" + b"q" * 996), lease=True)  # e.g. a job still in the queue
+    os.utime(queued.path, (0, 0))  # the oldest blob, first in line for eviction
+    for i in range(4):
+        store.save_stream(io.BytesIO(b"%PDF" + bytes([i]) * 996))
+
+    assert os.path.exists(queued.path)
+    assert store.total_bytes() <= 2500 + queued.size
+
+    store.release(queued)
+    store.save_stream(io.BytesIO(b"%PDF" + b"z" * 996))
+    assert not os.path.exists(queued.path)
+
+
+def test_reupload_of_an_evicted_blob_is_written_again(store):
+    first = store.save_stream(io.BytesIO(b"%PDF-1.4 same"))
+    os.remove(first.path)  # evicted between uploads
+    again = store.save_stream(io.BytesIO(b"%PDF-1.4 same"), lease=True)
+
+    assert again == first and os.path.exists(again.path)
+    assert os.listdir(store._tmp_dir) == []
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from benchmarks.results import load_results, write_results
+from benchmarks.synthetic import build_contract, contract_lines, generate_clauses, LINES_PER_PAGE
+from legal_doc_analyzer.agents.parser_agent import ParserAgent
+from legal_doc_analyzer.agents.segmenter_agent import ClauseSegmenterAgent
+
+
+def test_contracts_are_deterministic_per_seed():
+    assert build_contract(2, "pdf", seed=7) == build_contract(2, "pdf", seed=7)
+    assert build_contract(2, "docx", seed=7) == build_contract(2, "docx", seed=7)
+    assert build_contract(2, "pdf", seed=7) != build_contract(2, "pdf", seed=8)
+
+
+def test_contract_fills_requested_pages_with_numbered_clauses():
+    lines = contract_lines(3)
+    assert len(lines) == 3 * LINES_PER_PAGE
+    numbers = [int(line.split(".")[0]) for line in lines if line.split(".")[0].isdigit()]
+    assert numbers == list(range(1, len(numbers) + 1))
+
+
+def test_clause_mix_restricts_labels():
+    clauses = generate_clauses(50, mix={"indemnity": 1, "termination": 0}, seed=1)
+    assert {clause["label"] for clause in clauses} == {"indemnity"}
+    with pytest.raises(ValueError):
+        generate_clauses(5, mix={"no such clause": 1})
+
+
+@pytest.mark.parametrize("fmt", ["pdf", "docx"])
+def test_parser_and_segmenter_read_generated_contracts(tmp_path, fmt):
+    path = tmp_path / f"contract.{fmt}"
+    path.write_bytes(build_contract(2, fmt, seed=3))
+    text = ParserAgent(max_workers=1).process(str(path))
+    clauses = ClauseSegmenterAgent().process(text)
+    assert len(clauses) > 10
+    assert "Agreement" in text
+
+
+def test_results_file_round_trips(tmp_path):
+    path = write_results("unit", {"pages": 1}, [{"name": "a", "seconds_p50": 0.5}], str(tmp_path / "r.json"))
+    payload = json.loads(open(path).read())
+    assert payload["environment"]["python"]
+    assert load_results(path) == {"a": {"name": "a", "seconds_p50": 0.5}}
@@ -0,0 +1,106 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from legal_doc_analyzer.services.vector_store_service import VectorStore
+
+
+def _corpus(n=200, dim=32, seed=0):
+    rng = np.random.RandomState(seed)
+    return rng.randn(n, dim).astype(np.float32)
+
+
+def _exact_top(vectors, query, k):
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return list(np.argsort(-(normed @ (query / np.linalg.norm(query))))[:k])
+
+
+def test_float32_search_matches_brute_force(tmp_path):
+    vectors = _corpus()
+    store = VectorStore(str(tmp_path), dim=32)
+    store.add(vectors, [{"row": i} for i in range(len(vectors))])
+
+    query = vectors[7] + 0.1
+    results = store.search(query, k=5)
+    assert [r["row"] for r in results] == _exact_top(vectors, query, 5)
+    assert results[0]["score"] >= results[-1]["score"]
+
+
+def test_int8_search_keeps_nearest_neighbour(tmp_path):
+    vectors = _corpus()
+    store = VectorStore(str(tmp_path), dim=32, quantize=True)
+    store.add(vectors, [{"row": i} for i in range(len(vectors))])
+
+    for row in (0, 42, 199):
+        assert store.search(vectors[row], k=1)[0]["row"] == row
+
+
+def test_appends_persist_across_instances(tmp_path):
+    vectors = _corpus(n=20)
+    VectorStore(str(tmp_path), dim=32).add(vectors[:10], [{"row": i} for i in range(10)], doc_id="a")
+    reopened = VectorStore(str(tmp_path), dim=32)
+    reopened.add(vectors[10:], [{"row": i} for i in range(10, 20)], doc_id="b")
+
+    assert len(reopened) == 20
+    assert reopened.has_document("a") and reopened.has_document("b")
+    assert not reopened.has_document("c")
+    assert reopened.search(vectors[15], k=1)[0]["row"] == 15
+
+
+def test_concurrent_uploads_of_one_document_index_it_once(tmp_path):
+    import threading
+
+    vectors = _corpus(n=10)
+    stores = [VectorStore(str(tmp_path), dim=32) for _ in range(2)]  # e.g. two workers
+    assert not any(store.has_document("a") for store in stores)  # both decide to index
+
+    start = threading.Barrier(8)
+
+    def upload(store):
+        start.wait()
+        store.add(vectors, [{"row": i} for i in range(10)], doc_id="a")
+
+    threads = [threading.Thread(target=upload, args=(stores[i % 2],)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(stores[0]) == 10
+    assert (tmp_path / "documents.txt").read_text() == "a\n"
+
+
+def test_claimed_document_is_indexed_chunk_by_chunk(tmp_path):
+    vectors = _corpus(n=10)
+    store, other = VectorStore(str(tmp_path), dim=32), VectorStore(str(tmp_path), dim=32)
+    assert store.claim("a")
+    assert not other.claim("a")  # a second upload of the same document skips indexing
+    assert other.has_document("a")
+
+    for start in (0, 5):
+        store.add(vectors[start:start + 5], [{"row": i} for i in range(start, start + 5)])
+    assert len(other) == 10
+    assert other.search(vectors[7], k=1)[0]["row"] == 7
+    assert (tmp_path / "documents.txt").read_text() == "a\n"
+
+
+def test_uncommitted_rows_are_ignored_and_truncated(tmp_path):
+    vectors = _corpus(n=4)
+    store = VectorStore(str(tmp_path), dim=32)
+    store.add(vectors[:2], [{"row": 0}, {"row": 1}])
+
+    # Simulate an append that crashed before the header was rewritten
+    with open(tmp_path / "vectors.bin", "ab") as f:
+        f.write(vectors[2:].tobytes())
+    assert len(store) == 2
+    assert {r["row"] for r in store.search(vectors[3], k=10)} == {0, 1}
+
+    store.add(vectors[3:], [{"row": 3}])
+    assert len(store) == 3
+    assert store.search(vectors[3], k=1)[0]["row"] == 3
+
+
+def test_rejects_mismatched_dimension(tmp_path):
+    VectorStore(str(tmp_path), dim=32)
+    with pytest.raises(ValueError):
+        VectorStore(str(tmp_path), dim=16)